@@ -0,0 +1,149 @@
+"""Tento modul obsahuje asynchronní variantu hry (`AsyncGame`).
+
+Průběh hry odpovídá třídě `Game`, tahy hráčů (instancí `AsyncPlayer`) jsou
+však očekávány korutinami. Jediná smyčka událostí tak může souběžně řídit
+tisíce her (např. pomocí `asyncio.gather`) - zatímco jeden hráč přemýšlí
+v exekutoru či čeká na vstup, smyčka obsluhuje tahy v ostatních hrách.
+
+Časovou kontrolu hráčů (`TimeControl`) asynchronní hra nepodporuje - tah
+synchronního hráče v exekutoru nelze po vypršení času přerušit.
+"""
+
+from time import perf_counter
+from typing import Iterable
+
+from src.game.async_player import AsyncPlayer
+from src.game.board import Board, default_board
+from src.game.end_recognition import EndDetector, EndRecognizer
+from src.game.game import (GameError, check_player_input, check_players,
+                           clear_player_input, default_end_recognizers)
+from src.game.game_result import GameResult, PlayedMove
+from src.game.game_result_exceptions import Draw, Win
+from src.game.observer import GameObserver
+from src.game.time_control import TimeControl
+
+
+class AsyncGame:
+    """Reprezentace asynchronní hry dvou hráčů."""
+
+    def __init__(self, players: Iterable[AsyncPlayer],
+                 board: Board = None,
+                 observers: Iterable[GameObserver] = (),
+                 time_controls: TimeControl = None):
+        """Initor, který přijímá sadu asynchronních hráčů, hrací plochu, na
+        které má hra probíhat, a volitelně pozorovatele, které hra informuje
+        o svém průběhu.
+
+        Na hráče jsou kladeny tytéž požadavky jako ve třídě `Game` - musí
+        být právě dva a každý musí mít unikátní značku. Nejsou-li tyto
+        podmínky splněny, je vyhozena výjimka. Výjimka je vyhozena i při
+        dodání časové kontroly, kterou asynchronní hra nepodporuje.
+        """
+        self.__players = list(players)
+        self.__board = board or default_board()
+        self.__observers: list[GameObserver] = list(observers)
+        self.__result = None
+
+        check_players(self.players, self)
+        if time_controls is not None:
+            raise GameError("Asynchronní hra nepodporuje časovou kontrolu",
+                            self)
+
+        self.__end_recognizers = default_end_recognizers(self.__board.base)
+        self.__end_detector = EndDetector(
+            self.__board, self.__end_recognizers)
+
+    @property
+    def players(self) -> tuple[AsyncPlayer]:
+        """Vrací ntici všech hráčů, kteří ve hře jsou."""
+        return tuple(self.__players)
+
+    @property
+    def player_marks(self) -> tuple[str]:
+        """Vrací ntici všech značek, které hráči používají k označování políček
+        svých tahů."""
+        return tuple([player.mark for player in self.__players])
+
+    @property
+    def end_recognizers(self) -> tuple[EndRecognizer]:
+        """Vrací ntici rozpoznávačů konce hry."""
+        return tuple(self.__end_recognizers)
+
+    @property
+    def observers(self) -> tuple[GameObserver]:
+        """Vrací ntici pozorovatelů hry."""
+        return tuple(self.__observers)
+
+    @property
+    def result(self) -> GameResult:
+        """Výsledek hry. Nebyla-li hra dosud dohrána, vrací None."""
+        return self.__result
+
+    def add_observer(self, observer: GameObserver):
+        """Zaregistruje nového pozorovatele hry."""
+        self.__observers.append(observer)
+
+    async def play(self) -> GameResult:
+        """Odehraje hru a vrátí její výsledek (viz `Game.play`). Na tah
+        každého hráče hra čeká, aniž by blokovala smyčku událostí."""
+        if self.__result is not None:
+            raise GameError("Hra již byla dohrána", self)
+
+        board = self.__board
+        observers = self.__observers
+        moves: list[PlayedMove] = []
+        index = 0
+        turn_start = None
+
+        while True:
+            player = self.__players[index % 2]
+            snapshot = board.board_snapshot
+            if turn_start is None:
+                turn_start = perf_counter()
+            for observer in observers:
+                observer.on_turn(player, snapshot)
+
+            # Čekání na tah hráče a očištění jeho odpovědi
+            player_move = clear_player_input(
+                await player.move(snapshot, snapshot.valid_moves))
+
+            # Neplatný tah musí hráč opakovat
+            if not check_player_input(snapshot, player_move):
+                for observer in observers:
+                    observer.on_invalid_move(player, player_move)
+                continue
+
+            x, y = snapshot.move_coords(player_move)
+            board.mark(x, y, player.mark)
+            moves.append(PlayedMove(player.mark, player_move,
+                                    perf_counter() - turn_start))
+            turn_start = None
+            for observer in observers:
+                observer.on_move(player, player_move, x, y)
+
+            try:
+                self.__end_detector.record(x, y, player.mark)
+            except Draw:
+                return self.__finish(None, moves)
+            except Win:
+                return self.__finish(player, moves)
+
+            # Hráč může v čase soupeře přemýšlet nad svým dalším tahem
+            player.ponder(board.board_snapshot)
+
+            index += 1
+
+    def __finish(self, winner: AsyncPlayer,
+                 moves: list[PlayedMove]) -> GameResult:
+        """Ukončí hru - ukončí přemýšlení hráčů, sestaví výsledek hry a
+        oznámí jej pozorovatelům."""
+        for player in self.__players:
+            player.stop_pondering()
+        self.__result = GameResult(
+            winner.player_name if winner else None,
+            winner.mark if winner else None,
+            tuple(moves),
+            self.__end_detector.recognized.description)
+        for observer in self.__observers:
+            observer.on_end(self.__result)
+        return self.__result
@@ -0,0 +1,70 @@
+"""Modul obsahuje prostředky pro definici hráče asynchronní hry.
+
+Konkrétně pak obsahuje abstraktní třídu `AsyncPlayer`, jejíž metoda `move`
+je korutinou - hráč, který na svůj tah čeká (např. na vstup uživatele či
+na výsledek výpočtu v jiném procesu), tak neblokuje smyčku událostí a jediný
+proces může souběžně řídit mnoho her. Stávající (synchronní) hráče lze do
+asynchronní hry zapojit adaptérem `SyncPlayerAdapter`.
+"""
+
+import asyncio
+from abc import abstractmethod
+from concurrent.futures import Executor
+
+from src.game.board import BoardSnapshot
+from src.game.player import BasePlayer, Player
+
+
+class AsyncPlayer(BasePlayer):
+    """Instance této abstraktní třídy reprezentují hráče asynchronní hry
+    (`AsyncGame`). Protokol odpovídá třídě `Player`, jen tah je volen
+    asynchronně."""
+
+    @abstractmethod
+    async def move(self, board: BoardSnapshot,
+                   valid_moves: tuple[str]) -> str:
+        """Abstraktní korutina reprezentující tah hráče. Tah hráč zadává
+        coby textovou reprezentaci."""
+
+
+class SyncPlayerAdapter(AsyncPlayer):
+    """Adaptér, který do asynchronní hry zapojí synchronního hráče (instanci
+    třídy `Player`).
+
+    Tah hráče je volán v exekutoru, smyčka událostí tak mezitím obsluhuje
+    ostatní hry. Výchozím exekutorem je výchozí exekutor smyčky (vlákna);
+    výpočetně náročné hráče je vhodné odsunout do `ProcessPoolExecutor` -
+    hráč je pak do procesu předán při každém tahu, jeho stav (např.
+    transpoziční tabulka) tedy mezi tahy zachován není.
+
+    Hráče, jejichž tah je levný (např. `RandomNPCPlayer`), lze s parametrem
+    `executor=False` volat přímo ve smyčce událostí.
+    """
+
+    def __init__(self, player: Player, executor: Executor = None):
+        """Initor, který přijímá synchronního hráče a exekutor, ve kterém
+        mají být jeho tahy volány."""
+        super().__init__(player.player_name, player.mark)
+        self.__player = player
+        self.__executor = executor
+
+    @property
+    def player(self) -> Player:
+        """Adaptovaný synchronní hráč."""
+        return self.__player
+
+    async def move(self, board: BoardSnapshot,
+                   valid_moves: tuple[str]) -> str:
+        """Zavolá tah synchronního hráče v exekutoru (případně přímo)."""
+        if self.__executor is False:
+            return self.__player.move(board, valid_moves)
+        return await asyncio.get_running_loop().run_in_executor(
+            self.__executor, self.__player.move, board, valid_moves)
+
+    def ponder(self, board: BoardSnapshot):
+        """Předá výzvu k přemýšlení synchronnímu hráči."""
+        self.__player.ponder(board)
+
+    def stop_pondering(self):
+        """Předá ukončení přemýšlení synchronnímu hráči."""
+        self.__player.stop_pondering()
@@ -0,0 +1,74 @@
+"""Tento modul obsahuje pomocné funkce pro bitovou reprezentaci hrací plochy.
+
+Hrací plocha je v rámci bitové reprezentace (tzv. *bitboard*) chápána jako
+jedno celé číslo pro každou značku hráče. Každé políčko je reprezentováno
+jedním bitem, jehož pořadí odpovídá indexu `y * base + x`. Označení políčka,
+kopie plochy i kontrola spojení linie jsou pak jen několika celočíselnými
+operacemi.
+"""
+
+from functools import lru_cache
+
+
+def cell_index(x: int, y: int, base: int) -> int:
+    """Vrací index políčka o daných souřadnicích v rámci bitové reprezentace.
+    """
+    return y * base + x
+
+
+def cell_bit(x: int, y: int, base: int) -> int:
+    """Vrací bitovou masku s jediným nastaveným bitem odpovídajícím políčku
+    o daných souřadnicích."""
+    return 1 << cell_index(x, y, base)
+
+
+def full_mask(base: int) -> int:
+    """Vrací masku, ve které jsou nastaveny bity všech políček hrací plochy.
+    """
+    return (1 << (base * base)) - 1
+
+
+@lru_cache(maxsize=None)
+def row_mask(base: int, y: int) -> int:
+    """Maska všech políček v řádku `y`."""
+    return sum(cell_bit(x, y, base) for x in range(base))
+
+
+@lru_cache(maxsize=None)
+def column_mask(base: int, x: int) -> int:
+    """Maska všech políček ve sloupci `x`."""
+    return sum(cell_bit(x, y, base) for y in range(base))
+
+
+@lru_cache(maxsize=None)
+def diagonal_mask(base: int) -> int:
+    """Maska políček na diagonále z levého horního rohu do pravého dolního,
+    tedy políček o souřadnicích `[i, i]`."""
+    return sum(cell_bit(i, i, base) for i in range(base))
+
+
+@lru_cache(maxsize=None)
+def anti_diagonal_mask(base: int) -> int:
+    """Maska políček na diagonále z pravého horního rohu do levého dolního,
+    tedy políček o souřadnicích `[i, base - 1 - i]`."""
+    return sum(cell_bit(i, base - 1 - i, base) for i in range(base))
+
+
+@lru_cache(maxsize=None)
+def line_masks(base: int) -> tuple[int]:
+    """Ntice masek všech výherních linií hrací plochy dané bazální velikosti.
+
+    Nejprve jsou uvedeny řádky, poté sloupce a nakonec obě diagonály.
+    """
+    return (tuple(row_mask(base, y) for y in range(base)) +
+            tuple(column_mask(base, x) for x in range(base)) +
+            (diagonal_mask(base), anti_diagonal_mask(base)))
+
+
+def has_line(bits: int, base: int) -> bool:
+    """Vrací, zda-li dodaná maska značek jednoho hráče obsahuje celou
+    výherní linii."""
+    for mask in line_masks(base):
+        if bits & mask == mask:
+            return True
+    return False
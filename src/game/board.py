@@ -5,14 +5,20 @@ dojde-li k problému v rámci hrací plochy (`BoardError`).
 """
 
 from typing import Iterable
-from src.game.field import Field, FieldClosure
+
+from src.game.bitboard import cell_bit, cell_index, full_mask, has_line
+from src.game.field import Field, FieldClosure, FieldError
+from src.game.zobrist import zobrist_hash_of_masks, zobrist_key
 
 
 class Board:
     """Instance této třídy reprezentují hrací plochu a poskytují základní
     nástroje pro práci s ní.
 
-    Samotná hrací plocha se sestává z políček (instancí třídy `Field`).
+    Samotná hrací plocha je uložena v bitové reprezentaci - pro každou značku
+    je udržováno jediné celé číslo, jehož bity odpovídají označeným políčkům.
+    Políčka (instance třídy `Field`) jsou pak pouze pohledy na tuto
+    reprezentaci.
     """
 
     def __init__(self, fields: Iterable[Field], base: int = 3):
@@ -22,13 +28,43 @@ class Board:
 
         Základní (bazální) velikost hrací plochy je chápána jako druhá mocnina
         políček - předpokládá se čtvercová herní plocha.
+
+        Dodaná políčka jsou na hrací plochu navázána a stávají se pohledy
+        na její bitovou reprezentaci. Políčka již navázaná na jinou hrací
+        plochu jsou nahrazena svými kopiemi - původní hrací plocha o ně tak
+        nepřijde.
         """
 
         self._base = base
-        self.__fields = list(fields)
+        self.__fields = [field.copy if field.is_bound else field
+                         for field in fields]
+        self.__bits = {mark: 0 for mark in Field.available_marks()}
 
         self.__check_fields()
 
+        # Index políček adresovaný pozicí `y * base + x`
+        self.__cells = [None] * len(self.__fields)
+
+        # Převzetí značek políček do bitové reprezentace a navázání políček
+        # na tuto hrací plochu
+        for field in self.__fields:
+            if field.is_marked:
+                self.__bits[field.mark] |= cell_bit(field.x, field.y, base)
+            field._bind(self)
+            self.__cells[cell_index(field.x, field.y, base)] = field
+
+        # Zobristův otisk pozice, udržovaný inkrementálně při označování
+        self.__hash = zobrist_hash_of_masks(self.__bits, base)
+
+        # Pořadí políček (dle jejich indexů) pro potřeby kopií
+        self.__order = tuple([cell_index(f.x, f.y, base)
+                              for f in self.__fields])
+
+        # Příznaky pro sdílení úložiště se snímky (copy-on-write)
+        self.__frozen = False
+        self.__shared = False
+        self.__snapshot = None
+
     @property
     def base(self) -> int:
         """Bazální velikost hrací plochy."""
@@ -37,12 +73,15 @@ class Board:
     @property
     def fields(self) -> tuple[Field]:
         """Ntice políček, ze kterých se hrací plocha skládá."""
+        if self.__fields is None:
+            cells = self.__index
+            self.__fields = [cells[i] for i in self.__order]
         return tuple(self.__fields)
 
     @property
     def size(self) -> int:
         """Velikost hrací plochy coby počet políček."""
-        return len(self.fields)
+        return len(self.__order)
 
     @property
     def marked_fields(self) -> tuple[Field]:
@@ -54,21 +93,87 @@ class Board:
         """Vrací ntici označených políček."""
         return tuple([field for field in self.fields if not field.is_marked])
 
+    @property
+    def occupied_mask(self) -> int:
+        """Bitová maska všech označených políček."""
+        return sum(self.__bits.values())
+
+    @property
+    def is_full(self) -> bool:
+        """Vrací, zda-li jsou již všechna políčka hrací plochy označena."""
+        return self.occupied_mask == full_mask(self.base)
+
+    @property
+    def __index(self) -> list[Field]:
+        """Seznam políček adresovaný indexem `y * base + x`. Pohledy na
+        políčka jsou vytvořeny až při prvním požadavku."""
+        if self.__cells is None:
+            self.__cells = [self.__field_view(i) for i in range(self.size)]
+        return self.__cells
+
     @property
     def __field_cords(self) -> tuple[tuple[int, int]]:
         """Vrací ntici dvojic (také ntic) reprezentujících souřadnice políček.
         """
-        return tuple([field.xy for field in self.fields])
+        return tuple([field.xy for field in self.__fields])
+
+    @property
+    def zobrist_hash(self) -> int:
+        """64bitový Zobristův otisk aktuálního rozložení hrací plochy."""
+        return self.__hash
+
+    @property
+    def is_frozen(self) -> bool:
+        """Vrací, zda-li jde o neměnný pohled na hrací plochu."""
+        return self.__frozen
 
     @property
     def board_snapshot(self) -> "BoardSnapshot":
-        """Vrací snímek aktuálního rozložení hry."""
-        return BoardSnapshot(self)
+        """Vrací snímek aktuálního rozložení hry.
+
+        Dokud není hrací plocha změněna, je opakovaně vracen tentýž snímek.
+        """
+        if self.__snapshot is None:
+            self.__snapshot = BoardSnapshot(self)
+        return self.__snapshot
+
+    @property
+    def frozen_copy(self) -> "Board":
+        """Vrací neměnnou kopii této hrací plochy, která s ní sdílí úložiště
+        bitových masek. Ke skutečnému zkopírování masek dojde až v momentě,
+        kdy je tato hrací plocha později změněna.
+        """
+        board = Board.__new__(Board)
+        board._base = self._base
+        board.__bits = self.__bits
+        board.__hash = self.__hash
+        board.__order = self.__order
+        board.__fields = None
+        board.__cells = None
+        board.__frozen = True
+        board.__shared = True
+        board.__snapshot = None
+        self.__shared = True
+        return board
 
     @property
     def copy(self) -> "Board":
-        """Vrací hlubokou kopii tohoto objektu."""
-        return Board([f.copy for f in self.fields], self.base)
+        """Vrací hlubokou kopii tohoto objektu.
+
+        Kopírovány jsou pouze bitové masky značek; pohledy na políčka si
+        kopie vytváří až v případě potřeby.
+        """
+        board = Board.__new__(Board)
+        board._base = self._base
+        board.__bits = dict(self.__bits)
+        board.__hash = self.__hash
+        board.__order = self.__order
+        board.__fields = None
+        board.__cells = None
+        board.__frozen = False
+        board.__shared = False
+        board.__snapshot = None
+        return board
 
     def has_field(self, x: int, y: int) -> bool:
         """Vrátí informaci o tom, zda-li je na hrací ploše políčko přítomné.
@@ -79,31 +184,81 @@ class Board:
         """Pokusí se najít políčko o daných souřadnicích a vrátí ho. Pokud
         takové políčko nalezeno není, je vráceno None.
         """
-        for field in self.fields:
-            if field.x == x and field.y == y:
-                return field
+        if 0 <= x < self.base and 0 <= y < self.base:
+            return self.__index[cell_index(x, y, self.base)]
+
+    def mark_mask(self, mark: str) -> int:
+        """Bitová maska políček označených dodanou značkou."""
+        return self.__bits[mark]
+
+    def mark_at(self, x: int, y: int) -> str:
+        """Vrací značku na políčku o daných souřadnicích. Není-li políčko
+        označeno, je vrácen prázdný řetězec."""
+        bit = cell_bit(x, y, self.base)
+        for mark, bits in self.__bits.items():
+            if bits & bit:
+                return mark
+        return ""
+
+    def has_line(self, mark: str) -> bool:
+        """Vrací, zda-li hráč s dodanou značkou spojil některou z linií."""
+        return has_line(self.__bits[mark], self.base)
 
     def mark(self, x: int, y: int, mark: str):
         """Pokusí se vyhledat políčko dle dodaných souřadnic a označit ho.
         Pokud takové políčko nebude nalezeno, je vyhozena výjimka.
         """
-        field = self.field(x, y)
-        if not field:
+        if self.__frozen:
+            raise BoardError("Neměnnou hrací plochu nelze označovat!", self)
+
+        if not self.has_field(x, y):
             raise BoardError(f"Políčko [{x}, {y}] nebylo nalezeno!", self)
-        field.mark = mark
+
+        Field.check_mark(mark)
+        bit = cell_bit(x, y, self.base)
+        if self.occupied_mask & bit:
+            raise FieldError(f"Značku nelze znovu změnit!", self.field(x, y))
+
+        # Prázdná značka neoznačeného políčka nic nemění
+        if not mark:
+            return
+
+        # Sdílí-li hrací plocha úložiště s některým ze snímků, je nutné si
+        # před změnou pořídit vlastní kopii
+        if self.__shared:
+            self.__bits = dict(self.__bits)
+            self.__shared = False
+
+        self.__bits[mark] |= bit
+        self.__hash ^= zobrist_key(x, y, mark, self.base)
+        self.__snapshot = None
+
+    def __field_view(self, index: int) -> Field:
+        """Vytvoří políčko coby pohled na políčko hrací plochy s daným
+        indexem."""
+        field = Field(index % self.base, index // self.base)
+        field._bind(self)
+        return field
 
     def __check_fields(self):
         """Metoda, která se stará o ověření správnosti hrací plochy.
-        Kontroluje se přitom, zda všechna políčka mají unikátní souřadnice.
+        Kontroluje se přitom, zda všechna políčka mají unikátní souřadnice
+        a zda-li leží v rozsahu hrací plochy.
         """
-        if len(set(self.__field_cords)) != self.size:
+        size = len(self.__fields)
+        if len(set(self.__field_cords)) != size:
             raise BoardError(f"Souřadnice jednotlivých políček musí být "
                              f"unikátní: {self.__field_cords}", self)
 
-        if self.size != self.base ** 2:
+        if size != self.base ** 2:
             raise BoardError(f"Základní velikost hrací plochy ({self.base}) "
                              f"neodpovídá dodaným políčkům "
-                             f"({self.base ** 2} != {self.size})", self)
+                             f"({self.base ** 2} != {size})", self)
+
+        for x, y in self.__field_cords:
+            if not (0 <= x < self.base and 0 <= y < self.base):
+                raise BoardError(f"Políčko [{x}, {y}] leží mimo hrací plochu "
+                                 f"o základní velikosti {self.base}", self)
 
 
 class BoardSnapshot:
@@ -112,11 +267,17 @@ class BoardSnapshot:
     a tím zamezit zneužití s cílem podávdět.
 
     Instance této třídy tímto obalují hrací plochu a vystavují pouze zástupné
-    objekty či v kontextu hry nevýznamné kopie objektů."""
+    objekty či v kontextu hry nevýznamné kopie objektů.
+
+    Snímek je neměnný a sdílí úložiště s hrací plochou, ze které vznikl.
+    Jeho pořízení je tedy levné; kopie je pořízena až při další změně hrací
+    plochy."""
 
     def __init__(self, board: Board):
         """Initor, který přijímá v parametru referenci na hrací plochu."""
-        self.__board = board.copy
+        self.__board = board.frozen_copy
+        self.__closures = None
+        self.__moves = None
 
     @property
     def fields(self) -> tuple[Field]:
@@ -146,16 +307,27 @@ class BoardSnapshot:
         """
         return self.__board.base
 
+    @property
+    def zobrist_hash(self) -> int:
+        """64bitový Zobristův otisk zachyceného rozložení hrací plochy."""
+        return self.__board.zobrist_hash
+
+    def mark_mask(self, mark: str) -> int:
+        """Bitová maska políček označených dodanou značkou. Bit políčka
+        `[x, y]` leží na pozici `y * board_base + x`."""
+        return self.__board.mark_mask(mark)
+
     @property
     def field_closures(self) -> tuple[FieldClosure]:
         """Ntice obálek všech políček. Každá tato obálka pak umožňuje
         reprezentovat políčko pomocí zástupného znaku.
         """
-        closures = []
-        for y in range(self.board_base):
-            for x in range(self.board_base):
-                closures.append(FieldClosure(self.__board.field(x, y)))
-        return tuple(closures)
+        if self.__closures is None:
+            board = self.__board
+            self.__closures = tuple([FieldClosure(board.field(x, y))
+                                     for y in range(self.board_base)
+                                     for x in range(self.board_base)])
+        return self.__closures
 
     @property
     def stringify(self) -> str:
@@ -177,14 +349,41 @@ class BoardSnapshot:
         """Ntice všech zástupných znaků reprezentujících jednoznačné reference
         na políčka hrací desky, která lze označit, resp. na kterých lze provést
         tah."""
-        return tuple([fc.identifier for fc in self.field_closures
-                      if not fc.is_marked])
+        return tuple(self.__valid_moves)
+
+    @property
+    def __valid_moves(self) -> dict[str, tuple[int, int]]:
+        """Slovník zástupných znaků povolených tahů a souřadnic políček,
+        na která odkazují."""
+        if self.__moves is None:
+            self.__moves = {fc.identifier: fc.coords
+                            for fc in self.field_closures
+                            if not fc.is_marked}
+        return self.__moves
+
+    def __hash__(self) -> int:
+        """Snímky jsou neměnné, lze je tedy používat jako klíče slovníků."""
+        return self.zobrist_hash
+
+    def __eq__(self, other) -> bool:
+        """Snímky jsou si rovny, zachycují-li totéž rozložení hrací plochy.
+        """
+        if not isinstance(other, BoardSnapshot):
+            return NotImplemented
+        return (self.board_base == other.board_base and
+                all(self.mark_mask(mark) == other.mark_mask(mark)
+                    for mark in Field.available_marks()))
+
+    def move_coords(self, move: str) -> tuple[int, int]:
+        """Vrací souřadnice políčka, na které odkazuje dodaný povolený tah.
+        Není-li tah povolený, je vráceno None."""
+        return self.__valid_moves.get(move)
 
     def find_closure(self, x: int, y: int) -> FieldClosure:
         """Pokusí se najít obálku políčka, pokud existuje."""
-        for field in self.field_closures:
-            if field.coords[0] == x and field.coords[1] == y:
-                return field
+        field = self.__board.field(x, y)
+        if field is not None:
+            return FieldClosure(field)
 
 
 def default_board(base: int = 3) -> Board:
@@ -1,12 +1,19 @@
 """Tento modul obsahuje definice rozpoznavatelů konce hry.
+
+Kromě samotných rozpoznavatelů obsahuje také inkrementální detektor konce
+hry (`EndDetector`), který po každém tahu kontroluje pouze linie vedoucí
+přes naposledy označené políčko.
 """
 
 
 from abc import ABC, abstractmethod
 from typing import Iterable
 
-from src.game.board import BoardSnapshot
-from src.game.field import FieldClosure
+from src.game.bitboard import (anti_diagonal_mask, cell_bit, cell_index,
+                                column_mask, diagonal_mask, full_mask,
+                                row_mask)
+from src.game.board import Board, BoardSnapshot
+from src.game.field import Field, FieldClosure
 from src.game.game_result_exceptions import Win, Draw
 
 
@@ -34,6 +41,14 @@ class EndRecognizer(ABC):
         výjimku, konkrétně `Win` nebo `Draw`.
         """
 
+    def line_mask(self, base: int) -> int:
+        """Bitová maska linie, jejíž spojení rozpoznavatel sleduje. Pokud
+        rozpoznavatel nesleduje spojení jediné linie, vrací None.
+
+        Maska umožňuje detektoru `EndDetector` vyhodnocovat zakončení
+        inkrementálně."""
+        return None
+
     @staticmethod
     def find_closure(x: int, y: int, closures: Iterable[FieldClosure]):
         """Pomocná statická metoda pro vyhledávání obálky políčka podle
@@ -45,6 +60,16 @@ class EndRecognizer(ABC):
         raise Exception(
             f"Obálka políčka se souřadnicemi [{x}, {y}] nebyla nalezena")
 
+    @staticmethod
+    def check_line(board_snapshot: BoardSnapshot, mask: int):
+        """Pomocná statická metoda, která ověří, zda-li nejsou všechna
+        políčka linie reprezentované dodanou bitovou maskou označena jedním
+        hráčem. Pokud ano, je vyhozena výjimka `Win`.
+        """
+        for mark in Field.available_marks():
+            if board_snapshot.mark_mask(mark) & mask == mask:
+                raise Win()
+
 
 class Column(EndRecognizer):
     """Instance této třídy poskytují službu vyhledávání spojení políček ve
@@ -64,6 +89,10 @@ class Column(EndRecognizer):
         """Číslo prohledávaného sloupce."""
         return self._column_number
 
+    def line_mask(self, base: int) -> int:
+        """Bitová maska prohledávaného sloupce."""
+        return column_mask(base, self.column_number)
+
     def is_end(self, board_snapshot: BoardSnapshot):
         """Metoda poskytující službu prohledání snímku rozložení políček hry
         s cílem zjistit, zda-li nebyl spojen některým z hráčů celý sloupec.
@@ -71,21 +100,10 @@ class Column(EndRecognizer):
         Pokud k takové situaci došlo, znamená to výhru daného hráče a je tedy
         vyhozena výjimka `Win`.
         """
-        closures = board_snapshot.field_closures
-        characters = []
-
-        # Pro všechny řádky ve sloupečku si zaznamenej znak, kterým se obálka
-        # políčka prezentuje
-        for y in range(board_snapshot.board_base):
-            closure = self.find_closure(self.column_number, y, closures)
-            if not closure.is_marked:
-                return
-            characters.append(closure.mark)
-
-        # Pokud je mezi znaky jen jediný společný (unikátní) znak, znamená
-        # to, že je sloupec spojen
-        if len(set(characters)) == 1:
-            raise Win()
+        # Pokud jsou všechna políčka sloupce označena značkou jednoho hráče,
+        # znamená to, že je sloupec spojen
+        self.check_line(
+            board_snapshot, self.line_mask(board_snapshot.board_base))
 
 
 class Row(EndRecognizer):
@@ -106,6 +124,10 @@ class Row(EndRecognizer):
         """Prohledávaný řádek"""
         return self._row_number
 
+    def line_mask(self, base: int) -> int:
+        """Bitová maska prohledávaného řádku."""
+        return row_mask(base, self.row_number)
+
     def is_end(self, board_snapshot: BoardSnapshot):
         """Metoda poskytující službu prohledání snímku rozložení políček hry
         s cílem zjistit, zda-li nebyl spojen některým z hráčů celý řádek.
@@ -113,20 +135,10 @@ class Row(EndRecognizer):
         Pokud k takové situaci došlo, znamená to výhru daného hráče a je tedy
         vyhozena výjimka `Win`.
         """
-        closures = board_snapshot.field_closures
-        characters = []
-
-        for x in range(board_snapshot.board_base):
-            closure = self.find_closure(x, self.row_number, closures)
-            if not closure.is_marked:
-                return
-
-            characters.append(closure.mark)
-
-        # Pokud je mezi znaky jen jediný společný (unikátní) znak, znamená
-        # to, že je řádek spojen
-        if len(set(characters)) == 1:
-            raise Win()
+        # Pokud jsou všechna políčka řádku označena značkou jednoho hráče,
+        # znamená to, že je řádek spojen
+        self.check_line(
+            board_snapshot, self.line_mask(board_snapshot.board_base))
 
 
 class NoMoreMoves(EndRecognizer):
@@ -142,7 +154,11 @@ class NoMoreMoves(EndRecognizer):
         dalších možných tahů. Pokud k této situaci skutečně nastane, znamená
         to remízu.
         """
-        if len(board_snapshot.valid_moves) == 0:
+        played = 0
+        for mark in Field.available_marks():
+            played |= board_snapshot.mark_mask(mark)
+
+        if played == full_mask(board_snapshot.board_base):
             raise Draw()
 
 
@@ -164,18 +180,13 @@ class RightLeftDiagonal(EndRecognizer):
         Pokud jsou tato políčka spojena, resp. označena jedním hráčem, pak
         je vyhozena výjimka reprezentující výhru.
         """
-        closures = board_snapshot.field_closures
-        chars = []
+        self.check_line(
+            board_snapshot, self.line_mask(board_snapshot.board_base))
 
-        for i in range(board_snapshot.board_base):
-            closure = self.find_closure(i, i, closures)
-            if not closure.is_marked:
-                return
-
-            chars.append(closure.mark)
-
-        if len(set(chars)) == 1:
-            raise Win()
+    def line_mask(self, base: int) -> int:
+        """Bitová maska diagonály z levého horního rohu do pravého dolního.
+        """
+        return diagonal_mask(base)
 
 
 class LeftRightDiagonal(EndRecognizer):
@@ -196,17 +207,98 @@ class LeftRightDiagonal(EndRecognizer):
         Pokud jsou tato políčka spojena, resp. označena jedním hráčem, pak
         je vyhozena výjimka reprezentující výhru.
         """
-        closures = board_snapshot.field_closures
-        chars = []
+        self.check_line(
+            board_snapshot, self.line_mask(board_snapshot.board_base))
 
-        for i in range(board_snapshot.board_base):
-            closure = self.find_closure(
-                i, (board_snapshot.board_base - 1) - i, closures)
-            if not closure.is_marked:
-                return
-            chars.append(closure.mark)
+    def line_mask(self, base: int) -> int:
+        """Bitová maska diagonály z pravého horního rohu do levého dolního.
+        """
+        return anti_diagonal_mask(base)
 
-        if len(set(chars)) == 1:
-            raise Win()
 
+class EndDetector:
+    """Instance této třídy slouží k inkrementálnímu rozpoznávání konce hry.
+
+    Namísto opakovaného prohledávání celé hrací plochy všemi rozpoznavateli
+    si detektor pro každou značku udržuje počty označených políček v liniích
+    sledovaných jednotlivými rozpoznavateli. Po každém tahu jsou pak
+    aktualizovány a kontrolovány pouze linie vedoucí přes označené políčko.
+
+    Rozpoznavatelé, kteří nesledují jedinou linii (viz metoda
+    `EndRecognizer.line_mask`), jsou po každém tahu dotázáni standardně
+    metodou `is_end`.
+    """
 
+    def __init__(self, board: Board, recognizers: Iterable[EndRecognizer]):
+        """Initor, který přijímá hrací plochu, nad kterou je hra vedena, a
+        rozpoznavatele v pořadí, ve kterém mají být dotazováni. Počáteční
+        počty označených políček jsou převzaty z dodané hrací plochy.
+        """
+        self.__board = board
+        self.__recognizers = list(recognizers)
+        self.__recognized = None
+
+        base = board.base
+        masks = [r.line_mask(base) for r in self.__recognizers]
+
+        # Délky sledovaných linií; None pro rozpoznavatele bez linie
+        self.__lengths = [None if mask is None else bin(mask).count("1")
+                          for mask in masks]
+
+        # Počty označených políček v jednotlivých liniích pro každou značku
+        self.__counts = {
+            mark: [0 if mask is None
+                   else bin(board.mark_mask(mark) & mask).count("1")
+                   for mask in masks]
+            for mark in Field.available_marks()
+        }
+
+        # Pro každé políčko indexy relevantních rozpoznavatelů v původním
+        # pořadí - tedy linií přes políčko vedoucích a rozpoznavatelů bez
+        # linie
+        self.__relevant = []
+        for y in range(base):
+            for x in range(base):
+                bit = cell_bit(x, y, base)
+                self.__relevant.append(tuple([
+                    i for i, mask in enumerate(masks)
+                    if mask is None or mask & bit]))
+
+    @property
+    def recognizers(self) -> tuple[EndRecognizer]:
+        """Ntice rozpoznavatelů, nad kterými detektor pracuje."""
+        return tuple(self.__recognizers)
+
+    @property
+    def recognized(self) -> EndRecognizer:
+        """Rozpoznavatel, který rozpoznal zakončení hry. Pokud zakončení
+        doposud rozpoznáno nebylo, vrací None."""
+        return self.__recognized
+
+    def record(self, x: int, y: int, mark: str):
+        """Zaznamená označení políčka o daných souřadnicích dodanou značkou
+        a ověří, zda-li tento tah hru neukončil. Pokud ano, je vyhozena
+        příslušná výjimka (`Win` nebo `Draw`) a rozpoznavatel, který
+        zakončení rozpoznal, je dostupný ve vlastnosti `recognized`.
+
+        Očekává se, že políčko již bylo na hrací ploše označeno.
+        """
+        relevant = self.__relevant[cell_index(x, y, self.__board.base)]
+        counts = self.__counts[mark]
+
+        # Aktualizace počtů ve všech liniích vedoucích přes políčko
+        for i in relevant:
+            if self.__lengths[i] is not None:
+                counts[i] += 1
+
+        # Kontrola zakončení v pořadí rozpoznavatelů
+        for i in relevant:
+            recognizer = self.__recognizers[i]
+            try:
+                if self.__lengths[i] is None:
+                    recognizer.is_end(self.__board.board_snapshot)
+                elif counts[i] == self.__lengths[i]:
+                    raise Win()
+            except (Win, Draw):
+                self.__recognized = recognizer
+                raise
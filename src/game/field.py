@@ -7,12 +7,21 @@ Dále obsahuje definici konkrétní výjimky, která je vyhozena, dojde-li k
 problému na úrovni políčka.
 """
 
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from src.game.board import Board
+
 
 class Field:
     """Instance této třídy reprezentují políčka piškvorek.
 
     Každé políčko má vlastní souřadnice (reprezentující polohu na hrací ploše)
     a své označení - používané pro reprezentaci tahu hráče.
+
+    Je-li políčko součástí hrací plochy, slouží pouze jako pohled na bitovou
+    reprezentaci této plochy - své označení pak čte i zapisuje přímo z/do
+    hrací plochy.
     """
 
     # Povolené značky
@@ -30,6 +39,7 @@ class Field:
         self.__x = x
         self.__y = y
         self.__mark = mark
+        self.__board = None
 
         self.check_mark(mark)
 
@@ -41,6 +51,7 @@ class Field:
     @x.setter
     def x(self, new_x: int):
         """Nastaví souřadnici na ose x tohoto políčka"""
+        self.__check_unbound()
         self.__x = new_x
 
     @property
@@ -51,6 +62,7 @@ class Field:
     @y.setter
     def y(self, new_y: int):
         """Nastaví souřadnici na ose y tohoto políčka"""
+        self.__check_unbound()
         self.__y = new_y
 
     @property
@@ -61,6 +73,8 @@ class Field:
     @property
     def mark(self) -> str:
         """Znak, kterým je dané políčko označeno."""
+        if self.__board is not None:
+            return self.__board.mark_at(self.__x, self.__y)
         return self.__mark
 
     @mark.setter
@@ -69,7 +83,10 @@ class Field:
         self.check_mark(new_mark)
         if self.is_marked:
             raise FieldError(f"Značku nelze znovu změnit!", self)
-        self.__mark = new_mark
+        if self.__board is not None:
+            self.__board.mark(self.__x, self.__y, new_mark)
+        else:
+            self.__mark = new_mark
 
     @property
     def is_marked(self) -> bool:
@@ -81,6 +98,27 @@ class Field:
         """Vrací kopii tohoto objektu."""
         return Field(self.x, self.y, self.mark)
 
+    @property
+    def is_bound(self) -> bool:
+        """Vrací, zda-li je políčko pohledem na některou hrací plochu."""
+        return self.__board is not None
+
+    def _bind(self, board: "Board"):
+        """Naváže políčko na hrací plochu. Od tohoto okamžiku je políčko
+        pouze pohledem na bitovou reprezentaci dodané hrací plochy.
+
+        Metoda je určena výhradně pro potřeby třídy `Board`.
+        """
+        self.__board = board
+        self.__mark = ""
+
+    def __check_unbound(self):
+        """Ověří, že políčko není navázáno na hrací plochu. Souřadnice
+        políčka na hrací ploše totiž není možné měnit."""
+        if self.__board is not None:
+            raise FieldError(f"Souřadnice políčka [{self.__x}, {self.__y}] "
+                             f"umístěného na hrací ploše nelze měnit!", self)
+
     @classmethod
     def available_marks(cls) -> tuple[str, str]:
         """Značky, kterými je možné políčko označit."""
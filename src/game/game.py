@@ -2,22 +2,86 @@
 
 Především pak obsahuje definici třídy, která hru reprezentuje (`Game`)."""
 
-from typing import Iterable
+import random
+from time import perf_counter
+from typing import Iterable, Union
 
 from src.game.board import Board, default_board, BoardSnapshot
-from src.game.end_recognition import (EndRecognizer, Column, NoMoreMoves, Row,
-                                      LeftRightDiagonal, RightLeftDiagonal)
+from src.game.end_recognition import (EndRecognizer, EndDetector, Column,
+                                      NoMoreMoves, Row, LeftRightDiagonal,
+                                      RightLeftDiagonal)
+from src.game.game_result import GameResult, PlayedMove
 from src.game.game_result_exceptions import Draw, GameOver, Win
+from src.game.observer import ConsoleObserver, GameObserver
 from src.game.player import Player
+from src.game.time_control import LOSS, Clock, TimeControl, timed_move
+
+
+def default_end_recognizers(base: int) -> list[EndRecognizer]:
+    """Vrací výchozí sadu rozpoznávačů konce hry pro hrací plochu o dané
+    bazální velikosti."""
+    recognizers: list[EndRecognizer] = []
+
+    # Rozpoznávače spojení sloupců a řádků
+    for i in range(base):
+        recognizers.append(Column(i))
+        recognizers.append(Row(i))
+
+    # Rozpoznávače spojení diagonál
+    recognizers.append(LeftRightDiagonal())
+    recognizers.append(RightLeftDiagonal())
+
+    # Rozpoznávač, když neexistuje další tah (remíza)
+    recognizers.append(NoMoreMoves())
+    return recognizers
+
+
+def check_players(players: tuple, game):
+    """Kontrola validity hráčů hry (synchronní i asynchronní). Kontroluje se
+    následující:
+
+        - Počet hráčů - musí být právě dva hráči
+        - Značky, kterými hráči označují svá políčka - musí být unikátní
+
+    Nejsou-li podmínky splněny, je vyhozena výjimka `GameError` s referencí
+    na dodanou hru.
+    """
+    marks = tuple([player.mark for player in players])
+
+    # Pokud je počet hráčů jiný než 2
+    if len(players) != 2:
+        raise GameError(f"Počet hráčů musí být 2: {len(players)}", game)
+
+    # Pokud je počet unikátních značek jiný, než počet hráčů
+    elif len(set(marks)) != len(players):
+        raise GameError(
+            f"Každý hráč musí mít unikátní značku: {marks}", game)
+
+
+def clear_player_input(player_input: str) -> str:
+    """Očišťuje hráčův vstup o mezery a převádí ho na velká písmena."""
+    return player_input.strip().upper()
+
+
+def check_player_input(board_snapshot: BoardSnapshot,
+                       player_input: str) -> bool:
+    """Formální kontrola vstupu, zda-li je možné takový tah provést."""
+    return player_input in board_snapshot.valid_moves
 
 
 class Game:
     """Reprezentace hry dvou hráčů."""
 
     def __init__(self, players: Iterable[Player],
-                 board: Board = None):
-        """Initor, který přijímá sadu hráčů a hrací plochu, na které má hra
-        probíhat.
+                 board: Board = None,
+                 observers: Iterable[GameObserver] = (),
+                 time_controls: Union[TimeControl,
+                                      Iterable[TimeControl]] = None):
+        """Initor, který přijímá sadu hráčů, hrací plochu, na které má hra
+        probíhat, a volitelně pozorovatele, které hra informuje o svém
+        průběhu, a časové kontroly hráčů. Časová kontrola může být jedna
+        společná pro oba hráče, nebo dvojice kontrol v pořadí hráčů (None
+        značí hráče bez časové kontroly).
 
         Hra předpokládá několik vlastností, které hráči musí splnit. V první
         řadě musí být právě 2 hráči, dále pak musí mít každý přidělen unikátní
@@ -27,13 +91,29 @@ class Game:
         self.__players = list(players)
         self.__board = board or default_board()
         self.__end_recognizers: list[EndRecognizer] = []
+        self.__observers: list[GameObserver] = list(observers)
+        self.__result = None
 
         # Kontrola, že jsou dodaní hráči validní. Pokud by nebyli,
         # byla by vyhozena výjimka
-        self.__check_players()
+        check_players(self.players, self)
+
+        # Hodiny hráčů s časovou kontrolou
+        if isinstance(time_controls, TimeControl) or time_controls is None:
+            time_controls = (time_controls, time_controls)
+        time_controls = tuple(time_controls)
+        if len(time_controls) != len(self.__players):
+            raise GameError(f"Počet časových kontrol musí odpovídat počtu "
+                            f"hráčů: {len(time_controls)}", self)
+        self.__clocks = [Clock(control) if control else None
+                         for control in time_controls]
 
         self.__set_up_end_recognizers()
 
+        # Inkrementální detektor konce hry nad sadou rozpoznávačů
+        self.__end_detector = EndDetector(
+            self.__board, self.__end_recognizers)
+
     @property
     def players(self) -> tuple[Player]:
         """Vrací ntici všech hráčů, kteří ve hře jsou."""
@@ -55,107 +135,168 @@ class Game:
         """"""
         return tuple(self.__end_recognizers)
 
+    @property
+    def observers(self) -> tuple[GameObserver]:
+        """Vrací ntici pozorovatelů hry."""
+        return tuple(self.__observers)
+
+    @property
+    def result(self) -> GameResult:
+        """Výsledek hry. Nebyla-li hra dosud dohrána, vrací None."""
+        return self.__result
+
+    @property
+    def clocks(self) -> tuple[Clock]:
+        """Vrací ntici hodin hráčů (None u hráče bez časové kontroly)."""
+        return tuple(self.__clocks)
+
+    def add_observer(self, observer: GameObserver):
+        """Zaregistruje nového pozorovatele hry."""
+        self.__observers.append(observer)
+
     def run_game(self):
-        """Jednoduchá implementace, která umožňuje teoreticky do nekonečna
-        střídat tahy hráčů, případně je zopakovat v případě chyby.
+        """Odehraje hru s výpisem jejího průběhu do konzole (viz
+        `ConsoleObserver`) a ukončí ji vyhozením výjimky `GameOver`.
+        """
+        observer = ConsoleObserver()
+        self.__observers.append(observer)
+        try:
+            result = self.play()
+        finally:
+            self.__observers.remove(observer)
+        raise GameOver(result.winner, result.message)
+
+    def play(self) -> GameResult:
+        """Odehraje hru a vrátí její výsledek. Hra sama nic nevypisuje,
+        o svém průběhu jen informuje pozorovatele.
+
+        Hráči se střídají v tazích; zadá-li hráč neplatný tah, musí jej
+        opakovat. Do času tahu se započítávají i neplatné pokusy. Překročí-li
+        hráč s časovou kontrolou svůj čas, prohrává, nebo je za něj zahrán
+        náhodný tah (viz `TimeControl.on_timeout`).
         """
+        if self.__result is not None:
+            raise GameError("Hra již byla dohrána", self)
+
+        board = self.__board
+        observers = self.__observers
+        moves: list[PlayedMove] = []
         index = 0
+        turn_start = None
 
-        # Nekonečný cyklus
         while True:
 
             # Hra dvou hráčů - střídají se (podobně jako sudá a lichá čísla)
-            player = self.players[index % 2]
-            print(80*"-")
-            print("Na tahu je hráč:", player.player_name)
-
-            snapshot = self.__board.board_snapshot
+            player = self.__players[index % 2]
+            clock = self.__clocks[index % 2]
+            snapshot = board.board_snapshot
+            if turn_start is None:
+                turn_start = perf_counter()
+            for observer in observers:
+                observer.on_turn(player, snapshot)
 
             # Vyzvání hráče ke svému tahu, získání odpovědi a očištění
             # této odpovědi
-            player_move = player.move(snapshot, snapshot.valid_moves)
-            player_move = self.__clear_player_input(player_move)
+            player_move = self.__ask(player, clock, snapshot, turn_start)
+            timed_out = player_move is None
+
+            # Hráč překročil svůj čas
+            if timed_out:
+                for observer in observers:
+                    observer.on_timeout(player)
+                if clock.control.on_timeout == LOSS:
+                    clock.charge(perf_counter() - turn_start)
+                    return self.__finish(
+                        self.__players[(index + 1) % 2], moves,
+                        f"hráči '{player.player_name}' vypršel čas")
+                player_move = random.choice(snapshot.valid_moves)
+
+            player_move = clear_player_input(player_move)
 
             # Zkontroluj, že uživatel zadal validní vstup. Pokud nezadal,
             # opakuj tuto iteraci znovu
-            if not self.__check_player_input(snapshot, player_move):
-                print(f"Neplatný tah: '{player_move}'")
+            if not check_player_input(snapshot, player_move):
+                for observer in observers:
+                    observer.on_invalid_move(player, player_move)
                 continue
 
             # Pokud uživatel zadal validní tah, proveď ho - označ políčko,
             # které specifikoval uživatel
-            for closure in snapshot.field_closures:
-                if player_move == closure.identifier:
-                    self.__board.mark(*closure.coords, player.mark)
-                    break
-
-            # Pro každý rozpoznávač zkontroluj
-            for end_recognizer in self.end_recognizers:
-                try:
-                    end_recognizer.is_end(self.__board.board_snapshot)
-
-                # Pokud je daný stav remízou
-                except Draw:
-                    raise GameOver(
-                        None,
-                        f"Hra skončila remízou - {end_recognizer.description}")
-
-                # Pokud je daný stav výhrou jednoho z hráčů
-                except Win:
-                    raise GameOver(
-                        player.player_name,
-                        f"Hráč '{player.player_name}' vyhrál - "
-                        f"{end_recognizer.description}")
+            time_used = perf_counter() - turn_start
+            turn_start = None
+            if clock is not None:
+                clock.charge(time_used)
 
-            # Další tah
-            index += 1
+            x, y = snapshot.move_coords(player_move)
+            board.mark(x, y, player.mark)
+            moves.append(PlayedMove(player.mark, player_move, time_used,
+                                    timed_out))
+            for observer in observers:
+                observer.on_move(player, player_move, x, y)
 
-    def __check_players(self):
-        """Kontrola validity hráčů. Kontroluje se následující:
+            # Zkontroluj linie vedoucí přes označené políčko
+            try:
+                self.__end_detector.record(x, y, player.mark)
 
-            - Počet hráčů - musí být právě dva hráči
-            - Značky, kterými hráči označují svá políčka - musí být unikátní
-        """
-        # Pokud je počet hráčů jiný než 2
-        if len(self.players) != 2:
-            raise GameError(f"Počet hráčů musí být 2: "
-                            f"{len(self.players)}", self)
+            # Pokud je daný stav remízou
+            except Draw:
+                return self.__finish(None, moves)
+
+            # Pokud je daný stav výhrou jednoho z hráčů
+            except Win:
+                return self.__finish(player, moves)
+
+            # Hráč může v čase soupeře přemýšlet nad svým dalším tahem
+            player.ponder(board.board_snapshot)
 
-        # Pokud je počet unikátních značek jiný, než počet hráčů
-        elif len(set(self.player_marks)) != len(self.players):
-            raise GameError(
-                f"Každý hráč musí mít unikátní značku: "
-                f"{self.player_marks}", self)
+            # Další tah
+            index += 1
+
+    @staticmethod
+    def __ask(player: Player, clock: Clock, snapshot: BoardSnapshot,
+              turn_start: float) -> str:
+        """Vyzve hráče k tahu. Má-li hráč časovou kontrolu, je tah volán
+        v samostatném vlákně či procesu a nestihne-li hráč táhnout ve svém
+        čase, je vráceno None."""
+        if clock is None:
+            return player.move(snapshot, snapshot.valid_moves)
+
+        available = clock.available
+        if available is None:
+            return player.move(snapshot, snapshot.valid_moves)
+        remaining = available - (perf_counter() - turn_start)
+        if remaining <= 0:
+            return None
+        return timed_move(player, snapshot, snapshot.valid_moves, remaining,
+                          clock.control.isolation)
+
+    def __finish(self, winner: Player, moves: list[PlayedMove],
+                 reason: str = None) -> GameResult:
+        """Ukončí hru - ukončí přemýšlení hráčů, sestaví výsledek hry a
+        oznámí jej pozorovatelům. Není-li dodán důvod ukončení hry, je jím
+        popis rozpoznaného konce hry."""
+        self.__stop_pondering()
+        self.__result = GameResult(
+            winner.player_name if winner else None,
+            winner.mark if winner else None,
+            tuple(moves),
+            reason or self.__end_detector.recognized.description)
+        for observer in self.__observers:
+            observer.on_end(self.__result)
+        return self.__result
+
+    def __stop_pondering(self):
+        """Ukončí přemýšlení všech hráčů v čase soupeře."""
+        for player in self.players:
+            player.stop_pondering()
 
     def __set_up_end_recognizers(self):
         """Privátní metoda, která se stará o opatření služebníků, kteří
         mají za cíl rozpoznávat konečné (výherní či remízové) rozložení
         hrací plochy.
         """
-        # Rozpoznávače spojení sloupců a řádků
-        for i in range(self.__board.base):
-            self.__end_recognizers.append(Column(i))
-            self.__end_recognizers.append(Row(i))
-
-        # Rozpoznávače spojení diagonál
-        self.__end_recognizers.append(LeftRightDiagonal())
-        self.__end_recognizers.append(RightLeftDiagonal())
-
-        # Rozpoznávač, když neexistuje další tah (remíza)
-        self.__end_recognizers.append(NoMoreMoves())
-
-    @staticmethod
-    def __clear_player_input(player_input: str) -> str:
-        """Očišťuje hráčův vstup o mezery a převádí ho na malá písmena."""
-        return player_input.strip().upper()
-
-    @staticmethod
-    def __check_player_input(board_snapshot: BoardSnapshot,
-                             player_input: str) -> bool:
-        """Formální kontrola vstupu, zda-li je možné takový tah provést."""
-        if player_input not in board_snapshot.valid_moves:
-            return False
-        return True
+        self.__end_recognizers.extend(
+            default_end_recognizers(self.__board.base))
 
 
 class GameError(Exception):
@@ -0,0 +1,52 @@
+"""Tento modul obsahuje strukturovaný výsledek odehrané hry.
+
+Na rozdíl od výjimky `GameOver` nese výsledek kromě vítěze také celý průběh
+hry (posloupnost tahů) a popis způsobu, kterým hra skončila. Je proto vhodný
+zejména pro hromadné simulace, kde je výsledek dále strojově zpracováván.
+"""
+
+from typing import NamedTuple
+
+
+class PlayedMove(NamedTuple):
+    """Jeden tah odehrané hry."""
+
+    # Značka hráče, který tah provedl
+    mark: str
+
+    # Tah ve formátu `X Y`
+    move: str
+
+    # Čas (v sekundách), který hráči tah zabral, včetně neplatných pokusů
+    time_used: float = 0.0
+
+    # Příznak tahu zahraného náhodně za hráče, který překročil svůj čas
+    timed_out: bool = False
+
+
+class GameResult(NamedTuple):
+    """Výsledek odehrané hry."""
+
+    # Jméno vítěze, nebo None, skončila-li hra remízou
+    winner: str
+
+    # Značka vítěze, nebo None, skončila-li hra remízou
+    winner_mark: str
+
+    # Posloupnost všech platných tahů v pořadí, ve kterém byly provedeny
+    moves: tuple[PlayedMove]
+
+    # Popis způsobu, kterým hra skončila (viz `EndRecognizer.description`)
+    reason: str
+
+    @property
+    def is_draw(self) -> bool:
+        """Vrací, zda-li hra skončila remízou."""
+        return self.winner is None
+
+    @property
+    def message(self) -> str:
+        """Textová zpráva o ukončení hry."""
+        if self.is_draw:
+            return f"Hra skončila remízou - {self.reason}"
+        return f"Hráč '{self.winner}' vyhrál - {self.reason}"
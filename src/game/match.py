@@ -0,0 +1,207 @@
+"""Tento modul obsahuje prostředky pro hromadné odehrání mnoha her mezi dvěma
+hráči (tzv. zápas).
+
+Hry jsou rozděleny do dávek, které jsou odehrávány v pracovních procesech
+(`ProcessPoolExecutor`). Hráči jsou zadáváni továrnami - funkcemi, které
+ze značky vytvoří nového hráče (např. `functools.partial(RandomNPCPlayer,
+"Náhodný")`), každá hra tak začíná s čerstvými hráči. Hráči se ve hrách
+střídají v tom, kdo začíná; začínající hráč používá značku `X`.
+
+Generátor náhodných čísel (modul `random`) je před každou hrou nastaven na
+semínko odvozené od semínka zápasu a pořadí hry. Výsledek zápasu tak nezávisí
+na počtu procesů ani na tom, který proces hru odehrál.
+"""
+
+import os
+import random
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from time import perf_counter
+from typing import Callable, NamedTuple
+
+from src.game.board import BoardSnapshot, default_board
+from src.game.game import Game
+from src.game.observer import GameObserver
+from src.game.player import Player
+
+# Továrna hráče - ze značky vytvoří nového hráče
+PlayerFactory = Callable[[str], Player]
+
+
+class GameRecord(NamedTuple):
+    """Záznam jedné hry zápasu."""
+
+    # Pořadí hry v zápasu
+    index: int
+
+    # Index vítěze (0 pro prvního, 1 pro druhého hráče zápasu), nebo None
+    # při remíze
+    winner: int
+
+    # Počet tahů hry
+    moves: int
+
+    # Celkový čas (v sekundách), který prvnímu a druhému hráči zabraly tahy
+    move_times: tuple[float, float]
+
+    # Počet tahů prvního a druhého hráče
+    move_counts: tuple[int, int]
+
+
+class MatchStats:
+    """Instance této třídy průběžně shrnují výsledky zápasu - počty výher,
+    remíz a proher a časy tahů obou hráčů."""
+
+    def __init__(self, games: int):
+        """Initor, který přijímá celkový počet her zápasu."""
+        self.__games = games
+        self.__played = 0
+        self.__wins = [0, 0]
+        self.__draws = 0
+        self.__move_times = [0.0, 0.0]
+        self.__move_counts = [0, 0]
+
+    @property
+    def games(self) -> int:
+        """Celkový počet her zápasu."""
+        return self.__games
+
+    @property
+    def played(self) -> int:
+        """Počet dosud odehraných her."""
+        return self.__played
+
+    @property
+    def first_wins(self) -> int:
+        """Počet výher prvního hráče."""
+        return self.__wins[0]
+
+    @property
+    def second_wins(self) -> int:
+        """Počet výher druhého hráče."""
+        return self.__wins[1]
+
+    @property
+    def draws(self) -> int:
+        """Počet remíz."""
+        return self.__draws
+
+    @property
+    def is_finished(self) -> bool:
+        """Vrací, zda-li byly odehrány všechny hry zápasu."""
+        return self.__played == self.__games
+
+    def average_move_time(self, player: int) -> float:
+        """Průměrný čas tahu (v sekundách) prvního (`0`) či druhého (`1`)
+        hráče."""
+        count = self.__move_counts[player]
+        return self.__move_times[player] / count if count else 0.0
+
+    def record(self, game: GameRecord):
+        """Započítá výsledek odehrané hry."""
+        self.__played += 1
+        if game.winner is None:
+            self.__draws += 1
+        else:
+            self.__wins[game.winner] += 1
+        for player in (0, 1):
+            self.__move_times[player] += game.move_times[player]
+            self.__move_counts[player] += game.move_counts[player]
+
+    def __str__(self) -> str:
+        return (f"{self.__played}/{self.__games} her: "
+                f"{self.first_wins} výher, {self.__draws} remíz, "
+                f"{self.second_wins} proher")
+
+
+class _MoveTimer(GameObserver):
+    """Pozorovatel, který měří, jak dlouho hráčům trvají tahy. Celkové doby
+    a počty tahů eviduje dle značek hráčů."""
+
+    def __init__(self):
+        """Initor, který připraví prázdné součty dob a počtů tahů."""
+        self.times = {}
+        self.counts = {}
+        self.__start = 0.0
+
+    def on_turn(self, player: Player, board: BoardSnapshot):
+        """Zahájí měření tahu hráče na tahu."""
+        self.__start = perf_counter()
+
+    def on_move(self, player: Player, move: str, x: int, y: int):
+        """Započte hráči dobu od jeho posledního vyzvání k tahu a zvýší
+        počet jeho tahů."""
+        mark = player.mark
+        self.times[mark] = (self.times.get(mark, 0.0) +
+                            perf_counter() - self.__start)
+        self.counts[mark] = self.counts.get(mark, 0) + 1
+
+
+def _initialize(memory_mb: float):
+    """Inicializace pracovního procesu - omezí jeho adresový prostor na
+    dodaný paměťový limit."""
+    if memory_mb is not None:
+        # Modul `resource` je dostupný jen na unixových systémech
+        import resource
+        limit = int(memory_mb * 2 ** 20)
+        resource.setrlimit(resource.RLIMIT_AS, (limit, limit))
+
+
+def _play_games(first: PlayerFactory, second: PlayerFactory, base: int,
+                seed: int, indices: range) -> list[GameRecord]:
+    """Odehraje v pracovním procesu hry s dodanými pořadími."""
+    records = []
+    for index in indices:
+        random.seed(f"{seed}-{index}")
+
+        # V sudých hrách začíná první hráč, v lichých druhý
+        starts = index % 2
+        factories = (first, second) if starts == 0 else (second, first)
+        players = [factories[0]("X"), factories[1]("O")]
+        marks = ("X", "O") if starts == 0 else ("O", "X")
+
+        timer = _MoveTimer()
+        result = Game(players, default_board(base), [timer]).play()
+        records.append(GameRecord(
+            index,
+            marks.index(result.winner_mark) if result.winner_mark else None,
+            len(result.moves),
+            tuple(timer.times.get(mark, 0.0) for mark in marks),
+            tuple(timer.counts.get(mark, 0) for mark in marks)))
+    return records
+
+
+def play_match(first: PlayerFactory, second: PlayerFactory, games: int,
+               base: int = 3, workers: int = None, seed: int = 0,
+               memory_mb: float = None, chunk_size: int = None,
+               on_progress: Callable[[MatchStats], None] = None
+               ) -> MatchStats:
+    """Odehraje zápas o daném počtu her mezi hráči vytvořenými dodanými
+    továrnami na hrací ploše o dané bazální velikosti a vrátí jeho shrnutí.
+    Výhry a prohry jsou uváděny z pohledu prvního hráče.
+
+    Hry jsou odehrávány v daném počtu pracovních procesů (výchozí je počet
+    procesorů) po dávkách o velikosti `chunk_size`. Po každé dokončené
+    dávce je zavolána funkce `on_progress` s průběžným shrnutím. Továrny
+    musí být serializovatelné (modulem `pickle`).
+
+    Parametr `memory_mb` omezuje adresový prostor každého pracovního
+    procesu; proces, který by limit překročil, selže s `MemoryError`.
+    """
+    if games <= 0:
+        raise ValueError(f"Počet her musí být kladný: {games}")
+
+    workers = workers or os.cpu_count()
+    chunk_size = chunk_size or max(1, games // (8 * workers))
+    stats = MatchStats(games)
+
+    with ProcessPoolExecutor(workers, initializer=_initialize,
+                             initargs=(memory_mb,)) as pool:
+        futures = [pool.submit(_play_games, first, second, base, seed,
+                               range(start, min(start + chunk_size, games)))
+                   for start in range(0, games, chunk_size)]
+        for future in as_completed(futures):
+            for record in future.result():
+                stats.record(record)
+            if on_progress is not None:
+                on_progress(stats)
+    return stats
@@ -0,0 +1,54 @@
+"""Tento modul obsahuje prostředky pro sledování průběhu hry.
+
+Hra (`Game`) sama nic nevypisuje - o svém průběhu informuje zaregistrované
+pozorovatele (instance třídy `GameObserver`). Výpis do konzole je tak jen
+jedním z pozorovatelů (`ConsoleObserver`) a hromadné simulace bez
+pozorovatelů nestráví žádný čas vstupem a výstupem.
+"""
+
+from src.game.board import BoardSnapshot
+from src.game.game_result import GameResult
+from src.game.player import Player
+
+
+class GameObserver:
+    """Instance této třídy reprezentují pozorovatele hry. Všechny metody
+    ve výchozí implementaci nedělají nic; potomci překrývají jen ty, které
+    potřebují."""
+
+    def on_turn(self, player: Player, board: BoardSnapshot):
+        """Hráč je vyzván ke svému tahu v pozici dodaného snímku."""
+
+    def on_move(self, player: Player, move: str, x: int, y: int):
+        """Hráč provedl platný tah na políčko `[x, y]`."""
+
+    def on_invalid_move(self, player: Player, move: str):
+        """Hráč zadal neplatný tah; tah musí opakovat."""
+
+    def on_timeout(self, player: Player):
+        """Hráč překročil čas vymezený jeho časovou kontrolou."""
+
+    def on_end(self, result: GameResult):
+        """Hra skončila s dodaným výsledkem."""
+
+
+class ConsoleObserver(GameObserver):
+    """Pozorovatel, který průběh hry vypisuje do konzole."""
+
+    def on_turn(self, player: Player, board: BoardSnapshot):
+        """Vypíše oddělovač a jméno hráče, který je na tahu."""
+        print(80*"-")
+        print("Na tahu je hráč:", player.player_name)
+
+    def on_invalid_move(self, player: Player, move: str):
+        """Vypíše neplatný tah."""
+        print(f"Neplatný tah: '{move}'")
+
+    def on_timeout(self, player: Player):
+        """Vypíše hráče, který překročil svůj čas."""
+        print(f"Hráči '{player.player_name}' vypršel čas")
+
+    def on_end(self, result: GameResult):
+        """Vypíše zprávu o ukončení hry."""
+        print(80*"-")
+        print(result.message)
@@ -1,7 +1,9 @@
 """Modul obsahuje všechny prostředky pro definici hráče.
 
 Konkrétně pak obsahuje především definici abstraktní třídy `Player`, která
-slouží jako společný předek pro všechny typy hráčů - živých i NPC.
+slouží jako společný předek pro všechny typy hráčů - živých i NPC. Jméno,
+značku a jejich kontrolu sdílí se svou asynchronní variantou (`AsyncPlayer`)
+prostřednictvím společného předka `BasePlayer`.
 """
 
 
@@ -9,11 +11,10 @@ from abc import ABC, abstractmethod
 from src.game.board import BoardSnapshot
 
 
-class Player(ABC):
-    """Instance této abstraktní třídy umožňují sdružovat společný protokol
-    pro všechny typy hráčů - pro 'živé' i pro tzv. NPC.
-
-    Hráč je chápán jako entita schopná interagovat s hrou."""
+class BasePlayer(ABC):
+    """Společný předek synchronních (`Player`) i asynchronních
+    (`AsyncPlayer`) hráčů. Udržuje a kontroluje jméno hráče a jeho značku;
+    samotný tah definují až potomci."""
 
     # Značky, kterými mohou hráči označovat svá políčka. Pokud by se pokusil
     # hráč používat jiných značek, je při iniciaci instance vyhozena výjimka
@@ -50,15 +51,37 @@ class Player(ABC):
         """Značka, kterou hráč označuje políčko svého tahu."""
         return self.__mark
 
-    @abstractmethod
-    def move(self, board: BoardSnapshot, valid_moves: tuple[str]) -> str:
-        """Abstraktní metoda reprezentující tah hráče. Tah hráč zadává coby
-        textovou reprezentaci."""
+    def ponder(self, board: BoardSnapshot):
+        """Metoda, kterou hra hráče vyzve, aby v čase soupeře přemýšlel nad
+        dalším tahem. Dodaný snímek je pozice po hráčově tahu, ve které je
+        na tahu soupeř.
+
+        Výchozí implementace nedělá nic; hráči, kteří přemýšlení podporují,
+        jej zahájí na pozadí a metodu neprodleně opustí. Při dalším volání
+        metody `move` přemýšlení ukončí a jeho výsledek využijí či zahodí.
+        """
+
+    def stop_pondering(self):
+        """Metoda, kterou hra hráči oznámí, že přemýšlení v čase soupeře
+        již nemá smysl (např. protože hra skončila). Výchozí implementace
+        nedělá nic."""
 
     @classmethod
     def available_marks(cls) -> tuple[str, str]:
         """Povolené značky, kterými může hráč označit své políčko."""
-        return Player.__AVAILABLE_MARKS
+        return BasePlayer.__AVAILABLE_MARKS
+
+
+class Player(BasePlayer):
+    """Instance této abstraktní třídy umožňují sdružovat společný protokol
+    pro všechny typy hráčů - pro 'živé' i pro tzv. NPC.
+
+    Hráč je chápán jako entita schopná interagovat s hrou."""
+
+    @abstractmethod
+    def move(self, board: BoardSnapshot, valid_moves: tuple[str]) -> str:
+        """Abstraktní metoda reprezentující tah hráče. Tah hráč zadává coby
+        textovou reprezentaci."""
 
 
 class PlayerError(Exception):
@@ -67,7 +90,7 @@ class PlayerError(Exception):
     v jehož kontextu k chybě došlo. Díky tomu je možné lépe strojově reagovat
     na možné problémy."""
 
-    def __init__(self, message: str, player: Player):
+    def __init__(self, message: str, player: BasePlayer):
         """Initor, který přijímá kromě textové zprávy o chybě také referenci
         na hráče, v jehož kontextu k chybě došlo.
         """
@@ -75,7 +98,8 @@ class PlayerError(Exception):
         self._player = player
 
     @property
-    def player(self) -> Player:
-        """Instance třídy `Player`, v jejímž kontextu došlo k chybě."""
+    def player(self) -> BasePlayer:
+        """Instance hráče (potomka třídy `BasePlayer`), v jejímž kontextu
+        došlo k chybě."""
         return self._player
 
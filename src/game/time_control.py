@@ -0,0 +1,227 @@
+"""Tento modul obsahuje prostředky pro časovou kontrolu hry.
+
+Každý hráč může mít vlastní časovou kontrolu (`TimeControl`) - limit na
+jeden tah, celkovou zásobu času a přírůstek, který je k zásobě připočten po
+každém tahu (tzv. Fischerovy hodiny). Hra (`Game`) pak tah hráče volá
+v samostatném vlákně či procesu (viz `timed_move`) a na jeho dokončení čeká
+nejvýše po dobu, kterou hráči jeho hodiny (`Clock`) aktuálně dovolují.
+
+Překročí-li hráč svůj čas, hra jej dle nastavení kontroly buď prohlásí za
+poraženého (`LOSS`), nebo za něj zahraje náhodný platný tah (`RANDOM_MOVE`).
+"""
+
+import multiprocessing
+from threading import Event, Thread
+from weakref import WeakKeyDictionary
+
+from src.game.board import BoardSnapshot
+from src.game.player import Player, PlayerError
+
+# Důsledky překročení času
+LOSS = "loss"
+RANDOM_MOVE = "random"
+
+# Způsoby, kterými je tah hráče volán
+THREAD = "thread"
+PROCESS = "process"
+
+# Doba (v sekundách), po kterou je po vypršení času čekáno na dokončení
+# vlákna s tahem hráče
+ABORT_GRACE = 1.0
+
+# Vlákna s tahy hráčů, kteří je nestihli dokončit ani po vypršení času
+_unfinished: "WeakKeyDictionary[Player, Thread]" = WeakKeyDictionary()
+
+
+class TimeControl:
+    """Instance této třídy reprezentují nastavení časové kontroly hráče.
+
+    Tah volaný ve vlákně nelze násilně ukončit. Hráči, kteří podporují
+    přerušení prohledávání (metodu `abort_on(Event)`, viz minimaxoví hráči),
+    jsou po vypršení času přerušeni; tah ostatních hráčů (např. lidského
+    hráče) dobíhá dál a hráč není k dalšímu tahu vyzván, dokud jej
+    nedokončí (viz `timed_move`).
+
+    Tah volaný v procesu (`PROCESS`) je po vypršení času ukončen, změny
+    stavu hráče (např. jeho transpoziční tabulka) se však do hry nepromítnou
+    a hráč nesmí číst standardní vstup.
+    """
+
+    def __init__(self, per_move: float = None, bank: float = None,
+                 increment: float = 0.0, on_timeout: str = LOSS,
+                 isolation: str = THREAD):
+        """Initor, který přijímá limit na jeden tah a celkovou zásobu času
+        (v sekundách; None značí bez omezení), přírůstek zásoby po každém
+        tahu, důsledek překročení času (`LOSS`, nebo `RANDOM_MOVE`) a způsob
+        volání tahu (`THREAD`, nebo `PROCESS`)."""
+        if per_move is not None and per_move <= 0:
+            raise ValueError(f"Limit na tah musí být kladný: {per_move}")
+        elif bank is not None and bank <= 0:
+            raise ValueError(f"Zásoba času musí být kladná: {bank}")
+        elif increment < 0:
+            raise ValueError(f"Přírůstek nesmí být záporný: {increment}")
+        elif on_timeout not in (LOSS, RANDOM_MOVE):
+            raise ValueError(
+                f"Neznámý důsledek překročení času: {on_timeout}")
+        elif isolation not in (THREAD, PROCESS):
+            raise ValueError(f"Neznámý způsob volání tahu: {isolation}")
+
+        self.__per_move = per_move
+        self.__bank = bank
+        self.__increment = increment
+        self.__on_timeout = on_timeout
+        self.__isolation = isolation
+
+    @property
+    def per_move(self) -> float:
+        """Limit na jeden tah v sekundách, nebo None."""
+        return self.__per_move
+
+    @property
+    def bank(self) -> float:
+        """Počáteční zásoba času v sekundách, nebo None."""
+        return self.__bank
+
+    @property
+    def increment(self) -> float:
+        """Přírůstek zásoby času po každém tahu v sekundách."""
+        return self.__increment
+
+    @property
+    def on_timeout(self) -> str:
+        """Důsledek překročení času (`LOSS`, nebo `RANDOM_MOVE`)."""
+        return self.__on_timeout
+
+    @property
+    def isolation(self) -> str:
+        """Způsob volání tahu (`THREAD`, nebo `PROCESS`)."""
+        return self.__isolation
+
+
+class Clock:
+    """Instance této třídy reprezentují hodiny jednoho hráče v průběhu hry.
+    """
+
+    def __init__(self, control: TimeControl):
+        """Initor, který přijímá časovou kontrolu hráče."""
+        self.__control = control
+        self.__remaining = control.bank
+        self.__used = 0.0
+
+    @property
+    def control(self) -> TimeControl:
+        """Časová kontrola, kterou hodiny měří."""
+        return self.__control
+
+    @property
+    def remaining(self) -> float:
+        """Zbývající zásoba času v sekundách, nebo None."""
+        return self.__remaining
+
+    @property
+    def used(self) -> float:
+        """Celkový čas, který hráč spotřeboval na své tahy."""
+        return self.__used
+
+    @property
+    def available(self) -> float:
+        """Čas, který má hráč k dispozici na aktuální tah, nebo None, není-li
+        omezen."""
+        limits = [limit for limit in (self.__control.per_move,
+                                      self.__remaining) if limit is not None]
+        return max(0.0, min(limits)) if limits else None
+
+    def charge(self, seconds: float):
+        """Započte hráči tah, který mu trval dodanou dobu."""
+        self.__used += seconds
+        if self.__remaining is not None:
+            self.__remaining = max(0.0, self.__remaining - seconds)
+            self.__remaining += self.__control.increment
+
+
+def _move_in_process(player: Player, board: BoardSnapshot,
+                     valid_moves: tuple[str], connection):
+    """Tělo procesu - zvolí tah a odešle jej rodičovskému procesu."""
+    connection.send(player.move(board, valid_moves))
+    connection.close()
+
+
+def timed_move(player: Player, board: BoardSnapshot,
+               valid_moves: tuple[str], timeout: float,
+               isolation: str = THREAD) -> str:
+    """Zavolá tah hráče v samostatném vlákně či procesu a počká na něj
+    nejvýše dodanou dobu (v sekundách). Nestihne-li hráč táhnout, vrací
+    None. Výjimka vyhozená tahem hráče je vyhozena znovu.
+
+    Podporuje-li hráč volaný ve vlákně přerušení prohledávání (metodu
+    `abort_on`), je po vypršení času přerušen a na dokončení vlákna je
+    čekáno nejvýše `ABORT_GRACE` sekund; nedokončí-li je, je vyhozena
+    výjimka `PlayerError`. Tah hráče bez přerušení ve vlákně dobíhá dál;
+    dokud jej nedokončí, je každý jeho další tah považován za nestihnutý
+    (hráč tak nikdy není sdílen dvěma vlákny).
+    """
+    if isolation == PROCESS:
+        return _timed_move_in_process(player, board, valid_moves, timeout)
+
+    unfinished = _unfinished.get(player)
+    if unfinished is not None:
+        if unfinished.is_alive():
+            return None
+        del _unfinished[player]
+
+    # Po vypršení času je prohledávání hráče přerušeno
+    abortable = hasattr(player, "abort_on")
+    abort = Event()
+    if abortable:
+        player.abort_on(abort)
+    outcome = {}
+
+    def run():
+        try:
+            outcome["move"] = player.move(board, valid_moves)
+        except BaseException as error:
+            outcome["error"] = error
+        finally:
+            if abortable:
+                player.abort_on(None)
+
+    thread = Thread(target=run, daemon=True)
+    thread.start()
+    thread.join(timeout)
+    if thread.is_alive():
+        abort.set()
+        thread.join(ABORT_GRACE if abortable else 0)
+        if thread.is_alive():
+            _unfinished[player] = thread
+            if abortable:
+                raise PlayerError(
+                    f"Hráč '{player.player_name}' neukončil tah ani "
+                    f"po jeho přerušení", player)
+        return None
+
+    if "error" in outcome:
+        raise outcome["error"]
+    return outcome["move"]
+
+
+def _timed_move_in_process(player: Player, board: BoardSnapshot,
+                           valid_moves: tuple[str], timeout: float) -> str:
+    """Zavolá tah hráče v samostatném procesu, který je po vypršení času
+    ukončen (viz `timed_move`)."""
+    receiver, sender = multiprocessing.Pipe(duplex=False)
+    process = multiprocessing.Process(
+        target=_move_in_process,
+        args=(player, board, valid_moves, sender), daemon=True)
+    process.start()
+    sender.close()
+    try:
+        if receiver.poll(timeout):
+            return receiver.recv()
+        return None
+    except EOFError:
+        raise RuntimeError(
+            f"Proces hráče '{player.player_name}' selhal") from None
+    finally:
+        process.kill()
+        process.join()
+        receiver.close()
@@ -0,0 +1,51 @@
+"""Tento modul obsahuje prostředky pro Zobristovo hashování pozic.
+
+Každé dvojici (políčko, značka) je přiřazeno náhodné 64bitové číslo (klíč).
+Otisk (hash) pozice je pak XOR klíčů všech označených políček. Díky tomu lze
+otisk udržovat inkrementálně - označení i odznačení políčka znamená pouze
+jednu operaci XOR s příslušným klíčem.
+
+Klíče jsou generovány deterministicky z pevného semínka, aby byly otisky
+stejné napříč procesy i jednotlivými běhy programu.
+"""
+
+import random
+from functools import lru_cache
+
+# Semínko generátoru klíčů
+ZOBRIST_SEED = 0x7A0B2157
+
+# Značky, pro které jsou klíče generovány
+_MARKS = ("X", "O")
+
+
+@lru_cache(maxsize=None)
+def zobrist_keys(base: int) -> dict[str, tuple[int]]:
+    """Vrací slovník klíčů pro hrací plochu dané bazální velikosti. Pro každou
+    značku obsahuje ntici klíčů adresovanou indexem políčka `y * base + x`.
+    """
+    generator = random.Random(ZOBRIST_SEED + base)
+    return {
+        mark: tuple([generator.getrandbits(64) for _ in range(base * base)])
+        for mark in _MARKS
+    }
+
+
+def zobrist_key(x: int, y: int, mark: str, base: int) -> int:
+    """Vrací klíč políčka o daných souřadnicích označeného dodanou značkou.
+    """
+    return zobrist_keys(base)[mark][y * base + x]
+
+
+def zobrist_hash_of_masks(masks: dict[str, int], base: int) -> int:
+    """Vypočítá otisk pozice zadané bitovými maskami políček jednotlivých
+    značek (viz modul `bitboard`)."""
+    keys = zobrist_keys(base)
+    result = 0
+    for mark, bits in masks.items():
+        mark_keys = keys[mark]
+        while bits:
+            low = bits & -bits
+            result ^= mark_keys[low.bit_length() - 1]
+            bits ^= low
+    return result
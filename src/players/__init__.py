@@ -10,3 +10,5 @@ from .human_player.human_player import HumanPlayer
 from .random_player.random_npc_player import RandomNPCPlayer
 from .custom_player.custom_player import CustomPlayer
 from .rational_npc_player import MinmaxNPC, LimitedMinmaxPlayer
+from .mcts_player.mcts_npc import MCTSPlayer
+from .engine_player.engine_player import EnginePlayer
@@ -0,0 +1,87 @@
+"""Tento modul je vstupním bodem procesu enginu - zpřístupní libovolného
+hráče (potomka `Player`) přes řádkový protokol (viz `engine_protocol`) na
+standardním vstupu a výstupu.
+
+Hráč je zadán továrnou ve tvaru `modul:jméno`, která je volána se jménem
+hráče a značkou; další pojmenované argumenty lze předat jako JSON, např.:
+
+    python -m src.players.engine_player.engine src.players:MinmaxNPC \\
+        --options '{"alpha_beta": true}' --memory-mb 512
+
+Pro každou značku engine vytvoří jediného hráče, který je zachován po celou
+dobu běhu procesu (včetně např. jeho transpoziční tabulky).
+"""
+
+import argparse
+import importlib
+import json
+import sys
+from functools import partial
+from typing import Callable, TextIO
+
+from src.game.player import Player
+from src.players.engine_player.engine_protocol import (
+    ERROR, QUIT, READY, decode_position, encode_move)
+
+# Jméno hráčů vytvořených enginem
+ENGINE_NAME = "Engine"
+
+
+def load_factory(spec: str, options: dict = None) -> Callable[[str], Player]:
+    """Vrací továrnu hráče dle zápisu `modul:jméno` - funkci, která ze
+    značky vytvoří hráče."""
+    module, _, name = spec.partition(":")
+    player_class = getattr(importlib.import_module(module), name)
+    return partial(player_class, ENGINE_NAME, **(options or {}))
+
+
+def serve(factory: Callable[[str], Player], input: TextIO = sys.stdin,
+          output: TextIO = sys.stdout):
+    """Vyřizuje požadavky na tahy ze vstupu, dokud není vstup uzavřen či
+    není přijat požadavek `quit`. Hráči jsou vytvářeni dodanou továrnou."""
+    players: dict[str, Player] = {}
+
+    def reply(line: str):
+        output.write(line + "\n")
+        output.flush()
+
+    reply(READY)
+    for line in input:
+        line = line.strip()
+        if not line:
+            continue
+        elif line == QUIT:
+            break
+
+        try:
+            mark, board = decode_position(line)
+            if mark not in players:
+                players[mark] = factory(mark)
+            snapshot = board.board_snapshot
+            reply(encode_move(
+                players[mark].move(snapshot, snapshot.valid_moves)))
+        except Exception as error:
+            reply(f"{ERROR} {error!r}".replace("\n", " "))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Zpřístupní hráče coby proces enginu.")
+    parser.add_argument("player", help="továrna hráče ve tvaru modul:jméno")
+    parser.add_argument("--options", default="{}",
+                        help="další argumenty továrny ve formátu JSON")
+    parser.add_argument("--memory-mb", type=float,
+                        help="paměťový limit procesu v megabajtech")
+    arguments = parser.parse_args()
+
+    if arguments.memory_mb is not None:
+        # Modul `resource` je dostupný jen na unixových systémech
+        import resource
+        limit = int(arguments.memory_mb * 2 ** 20)
+        resource.setrlimit(resource.RLIMIT_AS, (limit, limit))
+
+    # Standardní výstup patří protokolu - případné výpisy hráče jsou
+    # přesměrovány na standardní chybový výstup
+    protocol_output, sys.stdout = sys.stdout, sys.stderr
+    serve(load_factory(arguments.player, json.loads(arguments.options)),
+          sys.stdin, protocol_output)
@@ -0,0 +1,320 @@
+"""Tento modul obsahuje hráče, jehož tahy volí engine běžící v samostatném
+procesu.
+
+Engine je libovolný hráč zpřístupněný vstupním bodem modulu `engine`; s ním
+hra komunikuje řádkovým protokolem (viz `engine_protocol`) přes standardní
+vstup a výstup procesu. Paměťově náročný či havarující engine tak hru
+neohrozí a enginy mohou využívat samostatná jádra procesoru.
+
+Procesy enginů jsou udržovány ve skupině (`EnginePool`) a zachovány mezi tahy
+i hrami; mohou je sdílet i různí hráči. Havarovaný proces je při dalším
+požadavku spuštěn znovu.
+"""
+
+import json
+import os
+import select
+import subprocess
+import sys
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from queue import Queue
+from threading import Event, Lock
+from typing import Sequence
+
+from src.game.board import BoardSnapshot
+from src.game.player import Player, PlayerError
+from src.players.engine_player.engine_protocol import (
+    QUIT, READY, decode_move, encode_position)
+
+# Kořenový adresář projektu - procesy enginů jej potřebují pro import balíčku
+# `src`
+PROJECT_ROOT = Path(__file__).resolve().parents[3]
+
+# Interval (v sekundách), ve kterém je při čekání na odpověď enginu
+# kontrolováno přerušení
+ABORT_CHECK_INTERVAL = 0.02
+
+
+def engine_command(player: str, memory_mb: float = None,
+                   **options) -> list[str]:
+    """Vrací příkaz, kterým je spuštěn proces enginu zpřístupňující hráče
+    zadaného továrnou ve tvaru `modul:jméno` (např. `src.players:MinmaxNPC`).
+    Pojmenované argumenty jsou předány továrně. Volitelný paměťový limit
+    v megabajtech si proces enginu nastaví sám při svém spuštění."""
+    command = [sys.executable, "-m", "src.players.engine_player.engine",
+               player, "--options", json.dumps(options)]
+    if memory_mb is not None:
+        command += ["--memory-mb", str(memory_mb)]
+    return command
+
+
+class EngineError(Exception):
+    """Výjimka reprezentující selhání procesu enginu. Svého předka rozšiřuje
+    o referenci na skupinu procesů, ke které engine patří."""
+
+    def __init__(self, message: str, pool: "EnginePool"):
+        """Initor, který přijímá kromě textové zprávy o chybě také referenci
+        na skupinu procesů enginů."""
+        Exception.__init__(self, message)
+        self._pool = pool
+
+    @property
+    def pool(self) -> "EnginePool":
+        """Skupina procesů enginů, v jejímž kontextu došlo k chybě."""
+        return self._pool
+
+
+class _Engine:
+    """Jeden proces enginu."""
+
+    def __init__(self, pool: "EnginePool"):
+        """Initor, který spustí proces enginu příkazem dodané skupiny
+        a počká, až se přihlásí. Nepřihlásí-li se proces včas, je ukončen
+        a vyhozena výjimka `EngineError`."""
+        self.__pool = pool
+        self.__buffer = b""
+        self.__process = subprocess.Popen(
+            pool.command, stdin=subprocess.PIPE, stdout=subprocess.PIPE,
+            env=pool.environment)
+        if self.request(None, timeout=pool.start_timeout) != READY:
+            self.kill()
+            raise EngineError("Engine se nepřihlásil", pool)
+
+    @property
+    def is_alive(self) -> bool:
+        """Vrací, zda-li proces enginu stále běží."""
+        return self.__process.poll() is None
+
+    def request(self, line: str, abort: Event = None,
+                timeout: float = None) -> str:
+        """Odešle řádek požadavku (None značí jen čekání na odpověď) a vrátí
+        řádek odpovědi. Je-li během čekání nastavena událost `abort`, je
+        proces ukončen a vrácen je prázdný řetězec. Neodpoví-li engine do
+        dodaného počtu sekund, je proces ukončen a vyhozena výjimka
+        `EngineError`."""
+        deadline = (time.monotonic() + timeout
+                    if timeout is not None else None)
+        try:
+            if line is not None:
+                os.write(self.__process.stdin.fileno(),
+                         (line + "\n").encode())
+
+            output = self.__process.stdout.fileno()
+            while b"\n" not in self.__buffer:
+                if abort is not None and abort.is_set():
+                    self.kill()
+                    return ""
+                if deadline is not None and time.monotonic() >= deadline:
+                    raise EngineError("Engine neodpověděl včas",
+                                      self.__pool)
+                ready, _, _ = select.select(
+                    [output], [], [], ABORT_CHECK_INTERVAL)
+                if ready:
+                    chunk = os.read(output, 4096)
+                    if not chunk:
+                        raise EngineError("Proces enginu skončil",
+                                          self.__pool)
+                    self.__buffer += chunk
+        except OSError as error:
+            self.kill()
+            raise EngineError(f"Proces enginu selhal: {error}",
+                              self.__pool) from error
+        except EngineError:
+            self.kill()
+            raise
+
+        line, _, self.__buffer = self.__buffer.partition(b"\n")
+        return line.decode().strip()
+
+    def quit(self):
+        """Požádá engine o ukončení a počká na něj."""
+        if self.is_alive:
+            try:
+                self.__process.communicate((QUIT + "\n").encode(), timeout=1)
+            except (OSError, subprocess.TimeoutExpired):
+                self.kill()
+
+    def kill(self):
+        """Násilně ukončí proces enginu."""
+        self.__process.kill()
+        self.__process.wait()
+        for stream in (self.__process.stdin, self.__process.stdout):
+            stream.close()
+
+    @property
+    def pid(self) -> int:
+        """Identifikátor procesu enginu."""
+        return self.__process.pid
+
+
+class EnginePool:
+    """Instance této třídy reprezentují skupinu trvale běžících procesů
+    enginu spuštěných týmž příkazem (viz `engine_command`).
+
+    Procesy jsou spuštěny již při vytvoření skupiny a ukončeny metodou
+    `close` (či opuštěním bloku `with`). Každý požadavek si zapůjčí jeden
+    volný proces; neběží-li již, je spuštěn znovu. Proces, který je vrácen
+    až po ukončení skupiny, je ukončen.
+    """
+
+    def __init__(self, command: Sequence[str], size: int = 1,
+                 start_timeout: float = 10):
+        """Initor, který přijímá příkaz spouštějící proces enginu, počet
+        procesů a dobu v sekundách, do které se spuštěný proces musí
+        přihlásit."""
+        if size <= 0:
+            raise ValueError(f"Počet procesů musí být kladný: {size}")
+
+        self.__command = list(command)
+        self.__size = size
+        self.__start_timeout = start_timeout
+        self.__environment = dict(os.environ)
+        self.__environment["PYTHONPATH"] = os.pathsep.join(
+            filter(None, [str(PROJECT_ROOT),
+                          os.environ.get("PYTHONPATH")]))
+
+        self.__engines: list[_Engine] = []
+        self.__idle: Queue = Queue()
+
+        # Zámek chránící seznam procesů a příznak ukončení skupiny
+        self.__lock = Lock()
+        self.__closed = False
+        for _ in range(size):
+            engine = _Engine(self)
+            self.__engines.append(engine)
+            self.__idle.put(engine)
+
+    @property
+    def command(self) -> list[str]:
+        """Příkaz, kterým jsou spouštěny procesy enginu."""
+        return list(self.__command)
+
+    @property
+    def size(self) -> int:
+        """Počet procesů skupiny."""
+        return self.__size
+
+    @property
+    def start_timeout(self) -> float:
+        """Doba v sekundách, do které se spuštěný proces musí přihlásit."""
+        return self.__start_timeout
+
+    @property
+    def environment(self) -> dict[str, str]:
+        """Proměnné prostředí procesů enginu."""
+        return self.__environment
+
+    @property
+    def pids(self) -> tuple[int]:
+        """Identifikátory právě běžících procesů skupiny."""
+        return tuple(engine.pid for engine in self.__engines
+                     if engine.is_alive)
+
+    @property
+    def is_closed(self) -> bool:
+        """Vrací, zda-li již byla skupina ukončena."""
+        return self.__closed
+
+    @contextmanager
+    def engine(self):
+        """Zapůjčí volný proces enginu (případně počká, až se některý
+        uvolní). Neběží-li zapůjčený proces, je spuštěn znovu; nepodaří-li
+        se to, zůstává ve skupině původní proces a pokus se zopakuje při
+        dalším zapůjčení. Je-li skupina ukončena, je vyhozena výjimka
+        `EngineError`."""
+        engine = self.__idle.get()
+        if engine is None:
+            # Zarážka ukončené skupiny - probudí i další čekající
+            self.__idle.put(None)
+            raise EngineError("Skupina procesů enginu byla ukončena", self)
+
+        try:
+            if not engine.is_alive:
+                replacement = _Engine(self)
+                with self.__lock:
+                    if engine in self.__engines:
+                        self.__engines[self.__engines.index(engine)] = (
+                            replacement)
+                engine = replacement
+            yield engine
+        finally:
+            with self.__lock:
+                closed = self.__closed
+                if not closed:
+                    self.__idle.put(engine)
+            if closed:
+                engine.kill()
+
+    def close(self):
+        """Ukončí všechny volné procesy skupiny. Procesy, které jsou právě
+        zapůjčeny, jsou ukončeny při svém vrácení."""
+        with self.__lock:
+            if self.__closed:
+                return
+            self.__closed = True
+            idle = []
+            while not self.__idle.empty():
+                idle.append(self.__idle.get_nowait())
+            self.__idle.put(None)
+            self.__engines = []
+
+        for engine in idle:
+            engine.quit()
+
+    def __enter__(self):
+        """Vstup do bloku `with` - vrací skupinu samotnou."""
+        return self
+
+    def __exit__(self, *args):
+        """Opuštění bloku `with` - ukončí skupinu (viz `close`)."""
+        self.close()
+
+
+class EnginePlayer(Player):
+    """Instance této třídy reprezentují hráče, jehož tahy volí engine
+    v samostatném procesu (viz `EnginePool`).
+
+    Selže-li proces enginu během tahu, je spuštěn znovu a tah je zopakován;
+    selže-li i napodruhé, je vyhozena výjimka `PlayerError`. Hráč podporuje
+    přerušení tahu událostí (metodou `abort_on`, viz časová kontrola hry) -
+    proces enginu je pak ukončen.
+    """
+
+    def __init__(self, player_name: str, mark: str, pool: EnginePool):
+        """Initor, který přijímá hráčovo jméno, značku, kterou označuje svá
+        políčka (tahy), a skupinu procesů enginu, ve kterých volí tahy."""
+        super().__init__(player_name, mark)
+        self.__pool = pool
+        self.__abort = None
+
+    @property
+    def pool(self) -> EnginePool:
+        """Skupina procesů enginu, ve kterých hráč volí tahy."""
+        return self.__pool
+
+    def abort_on(self, event: Event):
+        """Nastaví událost, jejímž nastavením je rozpracovaný tah přerušen
+        (a proces enginu ukončen)."""
+        self.__abort = event
+
+    def move(self, board: BoardSnapshot, valid_moves: tuple[str]) -> str:
+        """Vyžádá si tah od volného procesu enginu."""
+        request = encode_position(self.mark, board)
+        for attempt in range(2):
+            try:
+                with self.__pool.engine() as engine:
+                    reply = engine.request(request, self.__abort)
+                break
+            except EngineError as error:
+                if attempt:
+                    raise PlayerError(f"Engine hráče selhal: {error}",
+                                      self) from error
+
+        if not reply:
+            raise PlayerError("Tah enginu byl přerušen", self)
+        try:
+            return decode_move(reply)
+        except ValueError as error:
+            raise PlayerError(str(error), self) from error
@@ -0,0 +1,68 @@
+"""Tento modul obsahuje řádkový protokol, kterým hra komunikuje s procesem
+enginu (viz modul `engine`).
+
+Každá zpráva je jeden řádek textu:
+
+    - `ready` (engine): engine je připraven přijímat požadavky
+    - `go <značka> <základ> <políčka>` (hra): engine má zvolit tah hráče
+      s danou značkou; políčka plochy jsou zapsána po řádcích jako znaky
+      `X`, `O` a `.` (neoznačené políčko)
+    - `move <x> <y>` (engine): zvolený tah
+    - `error <zpráva>` (engine): požadavek se nepodařilo vyřídit
+    - `quit` (hra): engine se má ukončit
+
+Např. pozice `X` uprostřed plochy 3×3, ve které je na tahu `O`, je zapsána
+jako `go O 3 ....X....`.
+"""
+
+from src.game.board import Board, BoardSnapshot, default_board
+from src.game.bitboard import cell_bit
+
+READY = "ready"
+GO = "go"
+MOVE = "move"
+ERROR = "error"
+QUIT = "quit"
+
+
+def encode_position(mark: str, board: BoardSnapshot) -> str:
+    """Sestaví požadavek na tah hráče s danou značkou v pozici snímku."""
+    base = board.board_base
+    x_bits, o_bits = board.mark_mask("X"), board.mark_mask("O")
+    cells = "".join(
+        "X" if x_bits & bit else "O" if o_bits & bit else "."
+        for bit in (cell_bit(x, y, base)
+                    for y in range(base) for x in range(base)))
+    return f"{GO} {mark} {base} {cells}"
+
+
+def decode_position(line: str) -> tuple[str, Board]:
+    """Dekóduje požadavek na tah a vrátí značku hráče na tahu a hrací
+    plochu. Je-li požadavek poškozený, je vyhozena výjimka `ValueError`."""
+    command, mark, base, cells = line.split()
+    base = int(base)
+    if command != GO or len(cells) != base * base:
+        raise ValueError(f"Poškozený požadavek: '{line}'")
+
+    board = default_board(base)
+    for index, cell in enumerate(cells):
+        if cell != ".":
+            board.mark(index % base, index // base, cell)
+    return mark, board
+
+
+def encode_move(move: str) -> str:
+    """Sestaví odpověď s tahem ve formátu `X Y`."""
+    return f"{MOVE} {move}"
+
+
+def decode_move(line: str) -> str:
+    """Dekóduje odpověď enginu a vrátí tah ve formátu `X Y`. Ohlásil-li
+    engine chybu či je-li odpověď poškozená, je vyhozena výjimka
+    `ValueError`."""
+    command, _, argument = line.strip().partition(" ")
+    if command == MOVE and argument:
+        return argument
+    elif command == ERROR:
+        raise ValueError(f"Engine ohlásil chybu: {argument}")
+    raise ValueError(f"Neočekávaná odpověď enginu: '{line.strip()}'")
@@ -0,0 +1,359 @@
+"""Tento modul obsahuje definici hráče, který vybírá své tahy metodou
+Monte Carlo prohledávání stromu (*Monte Carlo Tree Search*, MCTS).
+
+Na rozdíl od minimaxových hráčů neprohledává hráč strom hry do šířky, ale
+opakovaně sehrává náhodné partie (tzv. *playouts*) z pozic, které se dosud
+ukázaly jako nadějné. Výběr pozic se řídí pravidlem UCT (*Upper Confidence
+bounds applied to Trees*), které vyvažuje využívání dobře hodnocených tahů
+a zkoumání tahů dosud málo vyzkoušených. Náročnost volby tahu je tak dána
+jen rozpočtem (počtem partií či časem), nikoliv velikostí hrací plochy.
+"""
+
+import math
+import random
+from array import array
+from functools import lru_cache
+from time import perf_counter
+
+from src.game.bitboard import cell_bit, full_mask, line_masks
+from src.game.board import BoardSnapshot
+from src.game.player import Player, PlayerError
+
+# Stavy uzlů stromu - pozice dosud nebyla vyhodnocena, hra pokračuje, hráč,
+# který do pozice táhl, vyhrál, hra skončila remízou
+UNKNOWN, OPEN, WIN, DRAW = 0, 1, 2, 3
+
+# Výchozí počet partií sehraných při volbě tahu, není-li zadán žádný rozpočet
+DEFAULT_PLAYOUTS = 2000
+
+# Počet partií, po kterých je kontrolován časový limit
+TIME_CHECK_INTERVAL = 16
+
+
+@lru_cache(maxsize=None)
+def cell_line_masks(base: int) -> tuple[tuple[int]]:
+    """Vrací pro každé políčko (adresované indexem `y * base + x`) ntici
+    masek výherních linií, které přes políčko vedou."""
+    return tuple(tuple(mask for mask in line_masks(base)
+                       if mask & cell_bit(index % base, index // base, base))
+                 for index in range(base * base))
+
+
+class MCTSPlayer(Player):
+    """Instance této třídy reprezentují hráče, který volí své tahy metodou
+    Monte Carlo prohledávání stromu s výběrem dle pravidla UCT.
+
+    Strom je uložen kompaktně v paralelních polích (modul `array`) - každý
+    uzel je jen indexem, potomci jednoho uzlu leží v polích za sebou. Po
+    volbě tahu si hráč strom ponechává; při dalším tahu z něj převezme
+    podstrom pod tahem, který skutečně zahrál soupeř.
+    """
+
+    def __init__(self, player_name: str, mark: str, playouts: int = None,
+                 time_limit: float = None, exploration: float = math.sqrt(2),
+                 max_nodes: int = 2 ** 20, seed: int = None):
+        """Initor, který přijímá hráčovo jméno a značku, kterou označuje
+        svá políčka (tahy).
+
+        Parametry `playouts` a `time_limit` (v sekundách) určují rozpočet
+        na volbu jednoho tahu - hráč sehraje nejvýše daný počet partií a
+        skončí nejpozději po uplynutí daného času. Není-li zadán žádný
+        z nich, sehraje hráč `DEFAULT_PLAYOUTS` partií.
+
+        Parametr `exploration` je konstanta pravidla UCT - vyšší hodnota
+        upřednostňuje zkoumání méně vyzkoušených tahů.
+
+        Parametr `max_nodes` omezuje velikost stromu; po jeho naplnění hráč
+        strom již nerozšiřuje a jen v něm dále sehrává partie.
+
+        Parametr `seed` umožňuje volbu tahů zopakovat.
+        """
+        super().__init__(player_name, mark)
+
+        if playouts is not None and playouts <= 0:
+            raise PlayerError(
+                f"Počet partií musí být kladný: {playouts}", self)
+        elif time_limit is not None and time_limit <= 0:
+            raise PlayerError(
+                f"Časový limit musí být kladný: {time_limit}", self)
+        elif max_nodes <= 0:
+            raise PlayerError(
+                f"Maximální počet uzlů musí být kladný: {max_nodes}", self)
+
+        if playouts is None and time_limit is None:
+            playouts = DEFAULT_PLAYOUTS
+
+        self.__playouts = playouts
+        self.__time_limit = time_limit
+        self.__exploration = exploration
+        self.__max_nodes = max_nodes
+        self.__random = random.Random(seed)
+        self.__last_playouts = 0
+        self.__reused_nodes = 0
+
+        # Strom - pro každý uzel index políčka tahu, který do uzlu vede,
+        # stav, počet návštěv, součet odměn hráče, který do uzlu táhl,
+        # index prvního potomka a počet potomků
+        self.__clear_tree()
+
+        # Pozice v kořeni stromu (masky značek obou hráčů) a její základ
+        self.__root_masks = None
+        self.__base = 0
+
+    @property
+    def playouts(self) -> int:
+        """Maximální počet partií sehraných při volbě tahu. Není-li počet
+        omezen, vrací None."""
+        return self.__playouts
+
+    @property
+    def time_limit(self) -> float:
+        """Časový limit pro volbu tahu v sekundách. Není-li čas omezen,
+        vrací None."""
+        return self.__time_limit
+
+    @property
+    def exploration(self) -> float:
+        """Konstanta pravidla UCT."""
+        return self.__exploration
+
+    @property
+    def max_nodes(self) -> int:
+        """Maximální počet uzlů stromu."""
+        return self.__max_nodes
+
+    @property
+    def last_playouts(self) -> int:
+        """Počet partií sehraných při volbě posledního tahu."""
+        return self.__last_playouts
+
+    @property
+    def reused_nodes(self) -> int:
+        """Počet uzlů převzatých z předchozího tahu při volbě posledního
+        tahu."""
+        return self.__reused_nodes
+
+    @property
+    def tree_size(self) -> int:
+        """Aktuální počet uzlů stromu."""
+        return len(self.__visits)
+
+    def move(self, board: BoardSnapshot, valid_moves: tuple[str]) -> str:
+        """Metoda zděděná z předka, která je odpovědná za provedení tahu ve
+        hře. Hráč převezme podstrom z předchozího tahu (je-li to možné),
+        sehraje partie v rámci svého rozpočtu a zvolí nejčastěji
+        navštívený tah v kořeni."""
+        base = board.board_base
+        masks = {mark: board.mark_mask(mark) for mark in ("X", "O")}
+        self.__reuse_tree(masks, base)
+
+        if len(valid_moves) == 1:
+            self.__last_playouts = 0
+            return valid_moves[0]
+
+        deadline = (perf_counter() + self.__time_limit
+                    if self.__time_limit is not None else None)
+        playouts = 0
+        while self.__playouts is None or playouts < self.__playouts:
+            if (deadline is not None and playouts and
+                    playouts % TIME_CHECK_INTERVAL == 0 and
+                    perf_counter() >= deadline):
+                break
+            self.__playout(masks[self.mark], masks[self.opponent_mark])
+            playouts += 1
+        self.__last_playouts = playouts
+
+        # Nepojme-li strom ani potomky kořene, je tah zvolen náhodně
+        if not self.__child_counts[0]:
+            return self.__random.choice(valid_moves)
+        best = self.__best_child(0)
+        return f"{self.__cells[best] % base} {self.__cells[best] // base}"
+
+    def __clear_tree(self):
+        """Vytvoří nový strom obsahující jen kořen."""
+        self.__cells = array("h", [-1])
+        self.__states = array("b", [UNKNOWN])
+        self.__visits = array("l", [0])
+        self.__rewards = array("d", [0.0])
+        self.__first_child = array("l", [0])
+        self.__child_counts = array("h", [0])
+
+    def __reuse_tree(self, masks: dict[str, int], base: int):
+        """Nastaví kořen stromu na dodanou pozici. Vznikla-li pozice z pozice
+        v kořeni tahem hráče a odpovědí soupeře, je podstrom pod těmito tahy
+        převzat, jinak je strom vytvořen znovu."""
+        root = None
+        previous = self.__root_masks
+        if previous is not None and base == self.__base:
+            own = masks[self.mark] ^ previous[self.mark]
+            other = masks[self.opponent_mark] ^ previous[self.opponent_mark]
+            if (own & previous[self.mark] == 0 and
+                    other & previous[self.opponent_mark] == 0 and
+                    own.bit_count() == 1 and other.bit_count() == 1):
+                root = self.__find_child(0, own.bit_length() - 1)
+                if root is not None:
+                    root = self.__find_child(root, other.bit_length() - 1)
+
+        if root is None:
+            self.__clear_tree()
+            self.__reused_nodes = 0
+        else:
+            self.__compact(root)
+            self.__reused_nodes = len(self.__visits)
+        self.__root_masks = masks
+        self.__base = base
+
+    def __find_child(self, node: int, cell: int) -> int:
+        """Vrací potomka uzlu, do kterého vede tah na dané políčko. Nebyl-li
+        uzel dosud rozšířen, vrací None."""
+        first = self.__first_child[node]
+        for child in range(first, first + self.__child_counts[node]):
+            if self.__cells[child] == cell:
+                return child
+        return None
+
+    def __compact(self, root: int):
+        """Ponechá ve stromu jen podstrom dodaného uzlu, který se stane
+        novým kořenem. Uzly jsou zkopírovány do nových polí tak, aby potomci
+        každého uzlu opět ležely za sebou."""
+        cells, states = self.__cells, self.__states
+        visits, rewards = self.__visits, self.__rewards
+        first_child, child_counts = self.__first_child, self.__child_counts
+
+        self.__clear_tree()
+        self.__cells[0], self.__states[0] = cells[root], states[root]
+        self.__visits[0], self.__rewards[0] = visits[root], rewards[root]
+
+        queue = [(root, 0)]
+        for old, new in queue:
+            count = child_counts[old]
+            if not count:
+                continue
+            start = len(self.__visits)
+            self.__first_child[new] = start
+            self.__child_counts[new] = count
+            for offset in range(count):
+                child = first_child[old] + offset
+                self.__append(cells[child], states[child])
+                self.__visits[-1] = visits[child]
+                self.__rewards[-1] = rewards[child]
+                queue.append((child, start + offset))
+
+    def __append(self, cell: int, state: int):
+        """Přidá do stromu nový list."""
+        self.__cells.append(cell)
+        self.__states.append(state)
+        self.__visits.append(0)
+        self.__rewards.append(0.0)
+        self.__first_child.append(0)
+        self.__child_counts.append(0)
+
+    def __expand(self, node: int, own: int, other: int, base: int):
+        """Rozšíří uzel o potomky pro všechny volné políčka. Masky `own` a
+        `other` jsou značky hráče na tahu, resp. jeho soupeře. Potomci jsou
+        zařazeni v náhodném pořadí."""
+        occupied = own | other
+        free = [cell for cell in range(base * base)
+                if not occupied >> cell & 1]
+        if len(self.__visits) + len(free) > self.__max_nodes:
+            return
+        self.__random.shuffle(free)
+
+        full = full_mask(base)
+        lines = cell_line_masks(base)
+        self.__first_child[node] = len(self.__visits)
+        self.__child_counts[node] = len(free)
+        for cell in free:
+            placed = own | 1 << cell
+            if any(placed & mask == mask for mask in lines[cell]):
+                state = WIN
+            elif placed | other == full:
+                state = DRAW
+            else:
+                state = OPEN
+            self.__append(cell, state)
+
+    def __select(self, node: int) -> int:
+        """Vybere potomka uzlu dle pravidla UCT. Dosud nenavštívení potomci
+        mají přednost."""
+        first = self.__first_child[node]
+        visits, rewards = self.__visits, self.__rewards
+        log_parent = math.log(visits[node])
+        best, best_score = first, float("-inf")
+        for child in range(first, first + self.__child_counts[node]):
+            count = visits[child]
+            if not count:
+                return child
+            score = (rewards[child] / count + self.__exploration *
+                     math.sqrt(log_parent / count))
+            if score > best_score:
+                best, best_score = child, score
+        return best
+
+    def __best_child(self, node: int) -> int:
+        """Vrací nejčastěji navštíveného potomka uzlu."""
+        first = self.__first_child[node]
+        children = range(first, first + self.__child_counts[node])
+        return max(children, key=lambda child: self.__visits[child])
+
+    def __playout(self, own: int, other: int):
+        """Sehraje jednu partii z pozice v kořeni. Masky `own` a `other` jsou
+        značky hráče, resp. jeho soupeře v kořeni.
+
+        Partie sestoupí stromem dle pravidla UCT, rozšíří první dosud
+        nerozšířený navštívený uzel, z dosaženého uzlu dohraje náhodně a
+        výsledek promítne do všech uzlů na cestě."""
+        base = self.__base
+        node = 0
+        path = [0]
+
+        # Masky značek hráče na tahu a jeho soupeře v aktuálním uzlu
+        mover, waiting = own, other
+        while self.__child_counts[node]:
+            node = self.__select(node)
+            mover |= 1 << self.__cells[node]
+            mover, waiting = waiting, mover
+            path.append(node)
+
+        state = self.__states[node]
+        if state in (UNKNOWN, OPEN) and self.__visits[node]:
+            self.__expand(node, mover, waiting, base)
+            if self.__child_counts[node]:
+                node = self.__select(node)
+                mover |= 1 << self.__cells[node]
+                mover, waiting = waiting, mover
+                path.append(node)
+                state = self.__states[node]
+
+        # Výsledek z pohledu hráče, který táhl do posledního uzlu cesty -
+        # 1 při jeho výhře, 0 při prohře a 0.5 při remíze
+        if state == WIN:
+            reward = 1.0
+        elif state == DRAW:
+            reward = 0.5
+        else:
+            reward = self.__rollout(mover, waiting, base)
+
+        visits, rewards = self.__visits, self.__rewards
+        for node in reversed(path):
+            visits[node] += 1
+            rewards[node] += reward
+            reward = 1.0 - reward
+
+    def __rollout(self, mover: int, waiting: int, base: int) -> float:
+        """Dohraje partii náhodnými tahy. Masky `mover` a `waiting` jsou
+        značky hráče na tahu, resp. hráče, který právě táhl. Vrací výsledek
+        z pohledu hráče, který právě táhl."""
+        occupied = mover | waiting
+        free = [cell for cell in range(base * base)
+                if not occupied >> cell & 1]
+        self.__random.shuffle(free)
+
+        lines = cell_line_masks(base)
+        for turn, cell in enumerate(free):
+            mover |= 1 << cell
+            if any(mover & mask == mask for mask in lines[cell]):
+                # V sudých tazích táhne soupeř hráče, který právě táhl
+                return float(turn % 2)
+            mover, waiting = waiting, mover
+        return 0.5
@@ -21,9 +21,7 @@ class RandomNPCPlayer(Player):
         hře. Metoda je postavena na podstatě výběru náhodného tahu ze sady
         všech přípustných tahů.
         """
-        random_move = random.choice(valid_moves)
-        print(f"Náhodně jsem si vybralo tah '{random_move}'")
-        return random_move
+        return random.choice(valid_moves)
 
 
 
@@ -3,4 +3,9 @@
 from .minmax_npc import MinmaxNPC
 from .heuristic_minmax_npc import LimitedMinmaxPlayer
 from .evaluators import *
-
+from .transposition import TranspositionTable
+from .solved_db import SolvedDatabase, build_database
+from .move_ordering import MoveOrdering
+from .evaluation_cache import EvaluationCache
+from .parallel import ParallelSearch
+from .shared_transposition import SharedTranspositionTable
@@ -0,0 +1,199 @@
+"""Tento modul obsahuje evaluační jádro, které vyhodnocuje hrací plochu
+celou sadou evaluátorů najednou.
+
+Každý evaluátor by jinak hrací plochu procházel samostatně - znovu by
+sestavoval sloupce a diagonály a počítal v nich značky. Evaluační jádro
+proto hrací plochu projde jen jednou, vypočte statistiky všech linií
+(viz `LineStatistics`) a z nich vyhodnotí všechny evaluátory, které to
+umožňují. Ostatní (typicky vlastní) evaluátory jsou vyhodnoceny svou
+metodou `evaluate`.
+
+Během hlubokého prohledávání lze navíc hodnotu udržovat inkrementálně (viz
+třída `IncrementalEvaluation`) - po každém tahu jsou aktualizovány jen
+linie vedoucí přes změněné políčko a hodnota listu je pak pouze přečtena.
+"""
+
+from typing import Iterable
+
+from src.players.rational_npc_player.evaluators import (
+    COLUMNS, FIRST_DIAGONAL, ROWS, SECOND_DIAGONAL, Evaluator,
+    LineStatistics, line_statistics)
+
+
+class EvaluationEngine:
+    """Instance této třídy vyhodnocují hrací plochu sadou evaluátorů
+    z pohledu daného hráče.
+
+    Výsledek je totožný se součtem hodnot jednotlivých evaluátorů v pořadí,
+    ve kterém byly dodány.
+    """
+
+    def __init__(self, evaluators: Iterable[Evaluator], player_mark: str,
+                 opponent_mark: str):
+        """Initor, který přijímá evaluátory, značku sledovaného hráče
+        a značku jeho oponenta."""
+        self.__evaluators = tuple(evaluators)
+        self.__player_mark = player_mark
+        self.__opponent_mark = opponent_mark
+
+        # Plán vyhodnocení - pro každý evaluátor informace, zda-li je
+        # vyhodnocen ze sdílených statistik linií
+        self.__plan = tuple([(evaluator, evaluator.supports_lines())
+                             for evaluator in self.__evaluators])
+        self.__uses_lines = any(fused for _, fused in self.__plan)
+
+    @property
+    def evaluators(self) -> tuple[Evaluator]:
+        """Ntice evaluátorů, kterými je hrací plocha vyhodnocována."""
+        return self.__evaluators
+
+    @property
+    def fused_count(self) -> int:
+        """Počet evaluátorů vyhodnocovaných ze sdílených statistik linií."""
+        return sum(1 for _, fused in self.__plan if fused)
+
+    @property
+    def uses_lines(self) -> bool:
+        """Vrací, zda-li je některý z evaluátorů vyhodnocován ze sdílených
+        statistik linií."""
+        return self.__uses_lines
+
+    def evaluate(self, board: list[list[str]],
+                 lines: LineStatistics = None) -> float:
+        """Vyhodnotí dodanou hrací plochu všemi evaluátory a vrátí součet
+        jejich hodnot. Volitelně lze dodat již sestavené statistiky linií
+        hrací plochy (např. z `LineCodes.statistics`)."""
+        player_mark = self.__player_mark
+        opponent_mark = self.__opponent_mark
+        if lines is None and self.__uses_lines:
+            lines = line_statistics(board, player_mark, opponent_mark)
+        total = 0
+        for evaluator, fused in self.__plan:
+            if fused:
+                total += evaluator.evaluate_lines(lines)
+            else:
+                total += evaluator.evaluate(board, player_mark, opponent_mark)
+        return total
+
+
+def line_groups(base: int) -> dict[str, tuple[tuple[int, int]]]:
+    """Vrací pro každou skupinu linií ntici linií, přičemž každá linie je
+    ntice indexů (`y * base + x`) jejích políček."""
+    return {
+        ROWS: tuple(tuple(y * base + x for x in range(base))
+                    for y in range(base)),
+        COLUMNS: tuple(tuple(y * base + x for y in range(base))
+                       for x in range(base)),
+        FIRST_DIAGONAL: (tuple(i * base + i for i in range(base)),),
+        SECOND_DIAGONAL: (tuple((base - 1 - i) * base + i
+                                for i in range(base)),),
+    }
+
+
+class IncrementalEvaluation:
+    """Instance této třídy udržují hodnotu hrací plochy během prohledávání
+    inkrementálně.
+
+    Pro každou linii jsou udržovány počty značek obou hráčů a pro každý
+    evaluátor podporující inkrementální vyhodnocení (viz
+    `Evaluator.supports_incremental`) celočíselný součet ohodnocení jeho
+    linií. Označení či odznačení políčka tak aktualizuje jen linie, které
+    přes políčko vedou. Ostatní evaluátory jsou při čtení hodnoty
+    vyhodnoceny nad aktuální hrací plochou.
+
+    Hodnota odpovídá hodnotě `EvaluationEngine.evaluate` až na zaokrouhlení
+    - součty jsou udržovány celočíselně a děleny délkou linie až nakonec.
+    """
+
+    def __init__(self, evaluators: Iterable[Evaluator],
+                 board: list[list[str]], player_mark: str,
+                 opponent_mark: str):
+        """Initor, který přijímá evaluátory, hrací plochu (na které bude
+        prohledávání probíhat a která musí být o všech změnách informována
+        metodami `place` a `remove`), značku sledovaného hráče a značku jeho
+        oponenta."""
+        self.__board = board
+        self.__player_mark = player_mark
+        self.__opponent_mark = opponent_mark
+        self.__base = base = len(board)
+        self.__evaluators = tuple(evaluators)
+
+        # Všechny linie, rozsahy indexů linií jednotlivých skupin a pro
+        # každé políčko indexy linií, které přes něj vedou
+        lines = []
+        group_lines = {}
+        for name, group in line_groups(base).items():
+            group_lines[name] = range(len(lines), len(lines) + len(group))
+            lines.extend(group)
+        self.__cell_lines = tuple(
+            tuple(index for index, line in enumerate(lines) if cell in line)
+            for cell in range(base * base))
+
+        # Počty značek obou hráčů v liniích
+        self.__counts = [[0, 0] for _ in lines]
+
+        # Pro každý evaluátor index jeho součtu (či None, není-li
+        # vyhodnocován inkrementálně), pro každý součet tabulka ohodnocení
+        # linie dle počtu značek a pro každou linii indexy součtů, které ji
+        # sledují
+        self.__slots = []
+        self.__tables = []
+        self.__scores = []
+        self.__watchers = [[] for _ in lines]
+        for evaluator in self.__evaluators:
+            if not evaluator.supports_incremental():
+                self.__slots.append(None)
+                continue
+            slot = len(self.__tables)
+            watched = group_lines[evaluator.line_group]
+            table = tuple(evaluator.line_score(player, opponent, base)
+                          for player in range(base + 1)
+                          for opponent in range(base + 1))
+            self.__slots.append(slot)
+            self.__tables.append(table)
+            self.__scores.append(len(watched) * table[0])
+            for line in watched:
+                self.__watchers[line].append(slot)
+
+        for y in range(base):
+            for x in range(base):
+                if board[y][x]:
+                    self.__update(x, y, board[y][x], 1)
+
+    @property
+    def value(self) -> float:
+        """Hodnota aktuální hrací plochy."""
+        total = 0
+        for evaluator, slot in zip(self.__evaluators, self.__slots):
+            if slot is not None:
+                total += evaluator.total_score(self.__scores[slot],
+                                               self.__base)
+            else:
+                total += evaluator.evaluate(
+                    self.__board, self.__player_mark, self.__opponent_mark)
+        return total
+
+    def place(self, x: int, y: int, mark: str):
+        """Promítne označení políčka dodanou značkou."""
+        self.__update(x, y, mark, 1)
+
+    def remove(self, x: int, y: int, mark: str):
+        """Promítne odznačení políčka, které bylo označeno dodanou značkou.
+        """
+        self.__update(x, y, mark, -1)
+
+    def __update(self, x: int, y: int, mark: str, change: int):
+        """Změní počty značek v liniích přes dané políčko a aktualizuje
+        součty ohodnocení sledujících evaluátorů."""
+        side = 0 if mark == self.__player_mark else 1
+        width = self.__base + 1
+        tables = self.__tables
+        scores = self.__scores
+        for line in self.__cell_lines[y * self.__base + x]:
+            counts = self.__counts[line]
+            old = counts[0] * width + counts[1]
+            counts[side] += change
+            new = counts[0] * width + counts[1]
+            for slot in self.__watchers[line]:
+                table = tables[slot]
+                scores[slot] += table[new] - table[old]
@@ -0,0 +1,82 @@
+"""Tento modul obsahuje mezipaměť hodnot listů pro heuristického hráče.
+
+Při omezeném prohledávání je tentýž list (tatáž pozice) dosažen mnoha
+různými pořadími tahů a pokaždé by musel být vyhodnocen celou sadou
+evaluátorů. Mezipaměť si proto hodnoty pozic pamatuje - pozice jsou
+identifikovány Zobristovým otiskem doplněným o informaci, který z hráčů je
+na tahu (viz `transposition.position_key`).
+"""
+
+from collections import OrderedDict
+
+
+class EvaluationCache:
+    """Instance této třídy reprezentují mezipaměť hodnot pozic s omezenou
+    kapacitou.
+
+    Při zaplnění je vyřazena nejdéle nepoužitá pozice (strategie *LRU*).
+
+    Mezipaměť je určena pro jediného hráče s neměnnou sadou evaluátorů -
+    uložené hodnoty jsou vždy z pohledu hráče, který mezipaměť používá.
+    """
+
+    def __init__(self, capacity: int = 2 ** 16):
+        """Initor, který přijímá maximální počet uložených pozic."""
+        if capacity <= 0:
+            raise ValueError(
+                f"Kapacita mezipaměti musí být kladná: {capacity}")
+
+        self.__capacity = capacity
+        self.__values: OrderedDict[int, float] = OrderedDict()
+        self.__hits = 0
+        self.__misses = 0
+
+    @property
+    def capacity(self) -> int:
+        """Maximální počet pozic, které mezipaměť pojme."""
+        return self.__capacity
+
+    @property
+    def hits(self) -> int:
+        """Počet úspěšných dotazů do mezipaměti."""
+        return self.__hits
+
+    @property
+    def misses(self) -> int:
+        """Počet neúspěšných dotazů do mezipaměti."""
+        return self.__misses
+
+    @property
+    def hit_rate(self) -> float:
+        """Podíl úspěšných dotazů ze všech dotazů."""
+        total = self.__hits + self.__misses
+        return self.__hits / total if total else 0.0
+
+    def __len__(self) -> int:
+        """Počet uložených pozic."""
+        return len(self.__values)
+
+    def probe(self, key: int) -> float:
+        """Vrací uloženou hodnotu pozice s dodaným klíčem. Pokud pozice
+        v mezipaměti není, vrací None."""
+        value = self.__values.get(key)
+        if value is None:
+            self.__misses += 1
+            return None
+        self.__hits += 1
+        self.__values.move_to_end(key)
+        return value
+
+    def store(self, key: int, value: float):
+        """Uloží hodnotu pozice s dodaným klíčem. Je-li mezipaměť plná, je
+        vyřazena nejdéle nepoužitá pozice."""
+        self.__values[key] = value
+        self.__values.move_to_end(key)
+        if len(self.__values) > self.__capacity:
+            self.__values.popitem(last=False)
+
+    def clear(self):
+        """Vyprázdní mezipaměť a vynuluje počítadla dotazů."""
+        self.__values.clear()
+        self.__hits = 0
+        self.__misses = 0
@@ -4,6 +4,57 @@ Jejich význam spočívá v číselném vyhodnocení kvality hrací plochy (uži
 resp. případně cena) pro sledovaného hráče."""
 
 from abc import ABC, abstractmethod
+from typing import NamedTuple
+
+# Skupiny linií, které mohou evaluátory sledovat
+ROWS = "rows"
+COLUMNS = "columns"
+FIRST_DIAGONAL = "first_diagonal"
+SECOND_DIAGONAL = "second_diagonal"
+
+
+class LineStatistics(NamedTuple):
+    """Sdílené statistiky linií hrací plochy z pohledu sledovaného hráče.
+
+    Pro každou linii obsahuje dvojici (počet políček sledovaného hráče,
+    počet políček oponenta). Statistiky jsou vypočteny jediným průchodem
+    hrací plochy a sdíleny všemi evaluátory, které je umí využít (viz
+    metoda `Evaluator.evaluate_lines`).
+    """
+
+    # Délka linie (bazální velikost hrací plochy)
+    length: int
+
+    # Statistiky řádků (shora dolů)
+    rows: tuple[tuple[int, int]]
+
+    # Statistiky sloupců (zleva doprava)
+    columns: tuple[tuple[int, int]]
+
+    # Statistika první diagonály (z levého horního rohu do pravého dolního)
+    first_diagonal: tuple[int, int]
+
+    # Statistika druhé diagonály (z levého dolního rohu do pravého horního)
+    second_diagonal: tuple[int, int]
+
+
+def line_statistics(board: list[list[str]], player_mark: str,
+                    opponent_mark: str) -> LineStatistics:
+    """Vypočítá statistiky všech linií dodané hrací plochy z pohledu hráče
+    se značkou `player_mark`."""
+    length = len(board)
+    first_diagonal = [board[i][i] for i in range(length)]
+    second_diagonal = [board[length - i - 1][i] for i in range(length)]
+    return LineStatistics(
+        length,
+        tuple([(row.count(player_mark), row.count(opponent_mark))
+               for row in board]),
+        tuple([(column.count(player_mark), column.count(opponent_mark))
+               for column in zip(*board)]),
+        (first_diagonal.count(player_mark),
+         first_diagonal.count(opponent_mark)),
+        (second_diagonal.count(player_mark),
+         second_diagonal.count(opponent_mark)))
 
 
 class Evaluator(ABC):
@@ -13,6 +64,9 @@ class Evaluator(ABC):
 
     Kromě toho jsou tyto evaluátory vybaveny koeficientem (`weight`), které
     dokáže zdůraznit význam sledované veličiny.
+
+    Evaluátor, který umí plochu vyhodnotit ze sdílených statistik linií či
+    inkrementálně, navíc dědí od třídy `LineEvaluator`.
     """
 
     def __init__(self, weight: float = 1):
@@ -52,12 +106,82 @@ class Evaluator(ABC):
             pro sledovaného hráče
         """
 
+    @classmethod
+    def supports_lines(cls) -> bool:
+        """Vrací, zda-li lze evaluátor vyhodnotit metodou `evaluate_lines`.
+        To platí jen tehdy, je-li tato metoda překryta alespoň na stejné
+        úrovni hierarchie jako metoda `evaluate` - potomek, který překryje
+        jen metodu `evaluate`, je tak vyhodnocován jí."""
+        return (issubclass(cls, LineEvaluator) and
+                cls.__overrides("evaluate_lines"))
+
+    @classmethod
+    def supports_incremental(cls) -> bool:
+        """Vrací, zda-li lze evaluátor vyhodnocovat inkrementálně. Platí
+        stejné pravidlo jako u metody `supports_lines`."""
+        return (issubclass(cls, LineEvaluator) and
+                cls.line_group is not None and cls.__overrides("line_score"))
+
+    @classmethod
+    def __overrides(cls, name: str) -> bool:
+        """Vrací, zda-li je metoda s daným názvem překryta alespoň na stejné
+        úrovni hierarchie jako metoda `evaluate`."""
+
+        def owner(method: str) -> type:
+            return next(klass for klass in cls.__mro__
+                        if method in vars(klass))
+
+        return (owner(name) is not LineEvaluator and
+                issubclass(owner(name), owner("evaluate")))
+
+
+class LineEvaluator(ABC):
+    """Abstraktní třída (mixin) evaluátorů, které hrací plochu umí vyhodnotit
+    ze sdílených statistik linií (`evaluate_lines`) a inkrementálně.
+
+    Inkrementálně vyhodnocovaný evaluátor sleduje jedinou skupinu linií
+    (`line_group`), každou linii ohodnotí celým číslem jen na základě počtu
+    značek obou hráčů v ní (`line_score`) a svou hodnotu určí ze součtu
+    těchto čísel (`total_score`). Součet lze pak během prohledávání udržovat
+    po každém tahu aktualizací jen těch linií, které vedou přes změněné
+    políčko.
+
+    Metody mixinu se uplatní jen tehdy, jsou-li překryty alespoň na stejné
+    úrovni hierarchie jako metoda `evaluate` (viz
+    `Evaluator.supports_lines`).
+    """
 
-class WinInRow(Evaluator):
+    # Skupina linií sledovaná při inkrementálním vyhodnocení (`ROWS`,
+    # `COLUMNS`, `FIRST_DIAGONAL` nebo `SECOND_DIAGONAL`). Hodnota None
+    # značí, že evaluátor inkrementální vyhodnocení nepodporuje
+    line_group: str = None
+
+    @abstractmethod
+    def evaluate_lines(self, lines: LineStatistics) -> float:
+        """Varianta metody `evaluate`, která hrací plochu vyhodnocuje ze
+        sdílených statistik linií. Musí vracet tutéž hodnotu jako metoda
+        `evaluate`."""
+
+    @abstractmethod
+    def line_score(self, player_count: int, opponent_count: int,
+                   length: int) -> int:
+        """Vrací celočíselné ohodnocení jedné linie dané délky s daným
+        počtem značek sledovaného hráče a jeho oponenta."""
+
+    @abstractmethod
+    def total_score(self, score: int, length: int) -> float:
+        """Převádí součet ohodnocení všech sledovaných linií na hodnotu
+        evaluátoru. Výsledek musí odpovídat hodnotě metody `evaluate` (až na
+        zaokrouhlení)."""
+
+
+class WinInRow(Evaluator, LineEvaluator):
     """Instance této třídy jsou odpovědné za zjištění výhry v řádku hrací
     plochy.
     """
 
+    line_group = ROWS
+
     def evaluate(self, board: list[list[str]], player_mark: str,
                  opponent_mark: str) -> float:
         """Metoda, která má za cíl vyhodnotit otisk hrací plochy co do výhry
@@ -90,12 +214,31 @@ class WinInRow(Evaluator):
                 return 1000.0
         return 0
 
+    def evaluate_lines(self, lines: LineStatistics) -> float:
+        """Varianta metody `evaluate` využívající sdílené statistiky linií.
+        """
+        for player_count, _ in lines.rows:
+            if player_count == lines.length:
+                return 1000.0
+        return 0
+
+    def line_score(self, player_count: int, opponent_count: int,
+                   length: int) -> int:
+        """Linie je ohodnocena jedničkou, je-li celá vyplněna hráčem."""
+        return 1 if player_count == length else 0
 
-class WinInColumn(Evaluator):
+    def total_score(self, score: int, length: int) -> float:
+        """Výherní hodnota, je-li některá linie celá vyplněna hráčem."""
+        return 1000.0 if score else 0
+
+
+class WinInColumn(Evaluator, LineEvaluator):
     """Instance této třídy jsou odpovědné za zjištění výhry ve sloupci hrací
     plochy.
     """
 
+    line_group = COLUMNS
+
     def evaluate(self, board: list[list[str]], player_mark: str,
                  opponent_mark: str) -> float:
         """Metoda, která má za cíl vyhodnotit otisk hrací plochy co do výhry
@@ -131,12 +274,31 @@ class WinInColumn(Evaluator):
                 return 1000.0
         return 0
 
+    def evaluate_lines(self, lines: LineStatistics) -> float:
+        """Varianta metody `evaluate` využívající sdílené statistiky linií.
+        """
+        for player_count, _ in lines.columns:
+            if player_count == lines.length:
+                return 1000.0
+        return 0
+
+    def line_score(self, player_count: int, opponent_count: int,
+                   length: int) -> int:
+        """Linie je ohodnocena jedničkou, je-li celá vyplněna hráčem."""
+        return 1 if player_count == length else 0
 
-class WinInFirstDiagonal(Evaluator):
+    def total_score(self, score: int, length: int) -> float:
+        """Výherní hodnota, je-li některá linie celá vyplněna hráčem."""
+        return 1000.0 if score else 0
+
+
+class WinInFirstDiagonal(Evaluator, LineEvaluator):
     """Instance této třídy jsou odpovědné za zjištění výhry v první diagonále,
     tedy té vedoucí z levého horního rohu do pravého dolního.
     """
 
+    line_group = FIRST_DIAGONAL
+
     def evaluate(self, board: list[list[str]], player_mark: str,
                  opponent_mark: str) -> float:
         """Metoda, která má za cíl vyhodnotit otisk hrací plochy co do výhry
@@ -167,12 +329,30 @@ class WinInFirstDiagonal(Evaluator):
             return 1000.0
         return 0
 
+    def evaluate_lines(self, lines: LineStatistics) -> float:
+        """Varianta metody `evaluate` využívající sdílené statistiky linií.
+        """
+        if lines.first_diagonal[0] == lines.length:
+            return 1000.0
+        return 0
+
+    def line_score(self, player_count: int, opponent_count: int,
+                   length: int) -> int:
+        """Linie je ohodnocena jedničkou, je-li celá vyplněna hráčem."""
+        return 1 if player_count == length else 0
+
+    def total_score(self, score: int, length: int) -> float:
+        """Výherní hodnota, je-li některá linie celá vyplněna hráčem."""
+        return 1000.0 if score else 0
 
-class WinInSecondDiagonal(Evaluator):
+
+class WinInSecondDiagonal(Evaluator, LineEvaluator):
     """Instance této třídy jsou odpovědné za zjištění výhry ve druhé diagonále,
     tedy té vedoucí z levého dolního rohu do pravého horního.
     """
 
+    line_group = SECOND_DIAGONAL
+
     def evaluate(self, board: list[list[str]], player_mark: str,
                  opponent_mark: str) -> float:
         """Metoda, která má za cíl vyhodnotit otisk hrací plochy co do výhry
@@ -203,13 +383,31 @@ class WinInSecondDiagonal(Evaluator):
             return 1000.0
         return 0
 
+    def evaluate_lines(self, lines: LineStatistics) -> float:
+        """Varianta metody `evaluate` využívající sdílené statistiky linií.
+        """
+        if lines.second_diagonal[0] == lines.length:
+            return 1000.0
+        return 0
 
-class OffensiveProgressInRow(Evaluator):
+    def line_score(self, player_count: int, opponent_count: int,
+                   length: int) -> int:
+        """Linie je ohodnocena jedničkou, je-li celá vyplněna hráčem."""
+        return 1 if player_count == length else 0
+
+    def total_score(self, score: int, length: int) -> float:
+        """Výherní hodnota, je-li některá linie celá vyplněna hráčem."""
+        return 1000.0 if score else 0
+
+
+class OffensiveProgressInRow(Evaluator, LineEvaluator):
     """Instance této třídy jsou odpovědné za zjištění pozitivního postupu ve
     hře. Konkrétně se tyto instance zaměřují na měření užitku z postupného
     plnění řádků.
     """
 
+    line_group = ROWS
+
     def evaluate(self, board: list[list[str]], player_mark: str,
                  opponent_mark: str) -> float:
         """Metoda, která má za cíl vyhodnotit otisk hrací plochy co do
@@ -243,13 +441,34 @@ class OffensiveProgressInRow(Evaluator):
                 total += row.count(player_mark) ** 2 / len(row)
         return total * self.weight
 
+    def evaluate_lines(self, lines: LineStatistics) -> float:
+        """Varianta metody `evaluate` využívající sdílené statistiky linií.
+        """
+        total = 0
+        for player_count, opponent_count in lines.rows:
+            if not opponent_count:
+                total += player_count ** 2 / lines.length
+        return total * self.weight
+
+    def line_score(self, player_count: int, opponent_count: int,
+                   length: int) -> int:
+        """Linie bez značky oponenta je ohodnocena druhou mocninou počtu
+        políček hráče."""
+        return 0 if opponent_count else player_count ** 2
+
+    def total_score(self, score: int, length: int) -> float:
+        """Součet ohodnocení linií vydělený jejich délkou a vážený."""
+        return score / length * self.weight
+
 
-class OffensiveProgressInColumn(Evaluator):
+class OffensiveProgressInColumn(Evaluator, LineEvaluator):
     """Instance této třídy jsou odpovědné za zjištění pozitivního postupu ve
     hře. Konkrétně se tyto instance zaměřují na měření užitku z postupného
     plnění sloupců.
     """
 
+    line_group = COLUMNS
+
     def evaluate(self, board: list[list[str]], player_mark: str,
                  opponent_mark: str) -> float:
         """Metoda, která má za cíl vyhodnotit otisk hrací plochy co do
@@ -284,14 +503,35 @@ class OffensiveProgressInColumn(Evaluator):
                 total += column.count(player_mark) ** 2 / len(column)
         return total * self.weight
 
+    def evaluate_lines(self, lines: LineStatistics) -> float:
+        """Varianta metody `evaluate` využívající sdílené statistiky linií.
+        """
+        total = 0
+        for player_count, opponent_count in lines.columns:
+            if not opponent_count:
+                total += player_count ** 2 / lines.length
+        return total * self.weight
+
+    def line_score(self, player_count: int, opponent_count: int,
+                   length: int) -> int:
+        """Linie bez značky oponenta je ohodnocena druhou mocninou počtu
+        políček hráče."""
+        return 0 if opponent_count else player_count ** 2
+
+    def total_score(self, score: int, length: int) -> float:
+        """Součet ohodnocení linií vydělený jejich délkou a vážený."""
+        return score / length * self.weight
+
 
-class OffensiveProgressInFirstDiagonal(Evaluator):
+class OffensiveProgressInFirstDiagonal(Evaluator, LineEvaluator):
     """Instance této třídy jsou odpovědné za zjištění pozitivního postupu ve
     hře. Konkrétně se tyto instance zaměřují na měření užitku z postupného
     plnění první diagonály, tedy té z vedoucí z levého horního rohu do toho
     pravého spodního.
     """
 
+    line_group = FIRST_DIAGONAL
+
     def evaluate(self, board: list[list[str]], player_mark: str,
                  opponent_mark: str) -> float:
         """Metoda, která má za cíl vyhodnotit otisk hrací plochy co do
@@ -324,14 +564,34 @@ class OffensiveProgressInFirstDiagonal(Evaluator):
             return (diagonal.count(player_mark) ** 2 / length) * self.weight
         return 0
 
+    def evaluate_lines(self, lines: LineStatistics) -> float:
+        """Varianta metody `evaluate` využívající sdílené statistiky linií.
+        """
+        player_count, opponent_count = lines.first_diagonal
+        if not opponent_count:
+            return (player_count ** 2 / lines.length) * self.weight
+        return 0
 
-class OffensiveProgressInSecondDiagonal(Evaluator):
+    def line_score(self, player_count: int, opponent_count: int,
+                   length: int) -> int:
+        """Linie bez značky oponenta je ohodnocena druhou mocninou počtu
+        políček hráče."""
+        return 0 if opponent_count else player_count ** 2
+
+    def total_score(self, score: int, length: int) -> float:
+        """Součet ohodnocení linií vydělený jejich délkou a vážený."""
+        return score / length * self.weight
+
+
+class OffensiveProgressInSecondDiagonal(Evaluator, LineEvaluator):
     """Instance této třídy jsou odpovědné za zjištění pozitivního postupu ve
     hře. Konkrétně se tyto instance zaměřují na měření užitku z postupného
     plnění druhé diagonály, tedy té z vedoucí z levého spodního rohu do toho
     pravého horního.
     """
 
+    line_group = SECOND_DIAGONAL
+
     def evaluate(self, board: list[list[str]], player_mark: str,
                  opponent_mark: str) -> float:
         """Metoda, která má za cíl vyhodnotit otisk hrací plochy co do
@@ -364,13 +624,33 @@ class OffensiveProgressInSecondDiagonal(Evaluator):
             return (diagonal.count(player_mark) ** 2 / length) * self.weight
         return 0
 
+    def evaluate_lines(self, lines: LineStatistics) -> float:
+        """Varianta metody `evaluate` využívající sdílené statistiky linií.
+        """
+        player_count, opponent_count = lines.second_diagonal
+        if not opponent_count:
+            return (player_count ** 2 / lines.length) * self.weight
+        return 0
+
+    def line_score(self, player_count: int, opponent_count: int,
+                   length: int) -> int:
+        """Linie bez značky oponenta je ohodnocena druhou mocninou počtu
+        políček hráče."""
+        return 0 if opponent_count else player_count ** 2
 
-class DefensiveProgressInRow(Evaluator):
+    def total_score(self, score: int, length: int) -> float:
+        """Součet ohodnocení linií vydělený jejich délkou a vážený."""
+        return score / length * self.weight
+
+
+class DefensiveProgressInRow(Evaluator, LineEvaluator):
     """Instance této třídy jsou odpovědné za zjištění pozitivního postupu ve
     hře. Konkrétně se tyto instance zaměřují na měření ceny z postupného
     plnění řádků.
     """
 
+    line_group = ROWS
+
     def evaluate(self, board: list[list[str]], player_mark: str,
                  opponent_mark: str) -> float:
         """Metoda, která má za cíl vyhodnotit otisk hrací plochy co do
@@ -404,13 +684,35 @@ class DefensiveProgressInRow(Evaluator):
                 total -= row.count(opponent_mark) ** 2 / len(row)
         return total * self.weight
 
+    def evaluate_lines(self, lines: LineStatistics) -> float:
+        """Varianta metody `evaluate` využívající sdílené statistiky linií.
+        """
+        total = 0
+        for player_count, opponent_count in lines.rows:
+            if not player_count:
+                total -= opponent_count ** 2 / lines.length
+        return total * self.weight
 
-class DefensiveProgressInColumn(Evaluator):
+    def line_score(self, player_count: int, opponent_count: int,
+                   length: int) -> int:
+        """Linie bez značky hráče je ohodnocena druhou mocninou počtu
+        políček oponenta."""
+        return 0 if player_count else opponent_count ** 2
+
+    def total_score(self, score: int, length: int) -> float:
+        """Záporný součet ohodnocení linií vydělený jejich délkou a vážený.
+        """
+        return -(score / length) * self.weight
+
+
+class DefensiveProgressInColumn(Evaluator, LineEvaluator):
     """Instance této třídy jsou odpovědné za zjištění pozitivního postupu ve
     hře. Konkrétně se tyto instance zaměřují na měření užitku z postupného
     plnění sloupců.
     """
 
+    line_group = COLUMNS
+
     def evaluate(self, board: list[list[str]], player_mark: str,
                  opponent_mark: str) -> float:
         """Metoda, která má za cíl vyhodnotit otisk hrací plochy co do
@@ -445,14 +747,36 @@ class DefensiveProgressInColumn(Evaluator):
                 total -= column.count(opponent_mark) ** 2 / len(column)
         return total * self.weight
 
+    def evaluate_lines(self, lines: LineStatistics) -> float:
+        """Varianta metody `evaluate` využívající sdílené statistiky linií.
+        """
+        total = 0
+        for player_count, opponent_count in lines.columns:
+            if not player_count:
+                total -= opponent_count ** 2 / lines.length
+        return total * self.weight
+
+    def line_score(self, player_count: int, opponent_count: int,
+                   length: int) -> int:
+        """Linie bez značky hráče je ohodnocena druhou mocninou počtu
+        políček oponenta."""
+        return 0 if player_count else opponent_count ** 2
+
+    def total_score(self, score: int, length: int) -> float:
+        """Záporný součet ohodnocení linií vydělený jejich délkou a vážený.
+        """
+        return -(score / length) * self.weight
+
 
-class DefensiveProgressInFirstDiagonal(Evaluator):
+class DefensiveProgressInFirstDiagonal(Evaluator, LineEvaluator):
     """Instance této třídy jsou odpovědné za zjištění pozitivního postupu ve
     hře. Konkrétně se tyto instance zaměřují na měření užitku z postupného
     plnění první diagonály, tedy té z vedoucí z levého horního rohu do toho
     pravého spodního.
     """
 
+    line_group = FIRST_DIAGONAL
+
     def evaluate(self, board: list[list[str]], player_mark: str,
                  opponent_mark: str) -> float:
         """Metoda, která má za cíl vyhodnotit otisk hrací plochy co do
@@ -485,14 +809,35 @@ class DefensiveProgressInFirstDiagonal(Evaluator):
             return -(diagonal.count(opponent_mark) ** 2 / length) * self.weight
         return 0
 
+    def evaluate_lines(self, lines: LineStatistics) -> float:
+        """Varianta metody `evaluate` využívající sdílené statistiky linií.
+        """
+        player_count, opponent_count = lines.first_diagonal
+        if not player_count:
+            return -(opponent_count ** 2 / lines.length) * self.weight
+        return 0
 
-class DefensiveProgressInSecondDiagonal(Evaluator):
+    def line_score(self, player_count: int, opponent_count: int,
+                   length: int) -> int:
+        """Linie bez značky hráče je ohodnocena druhou mocninou počtu
+        políček oponenta."""
+        return 0 if player_count else opponent_count ** 2
+
+    def total_score(self, score: int, length: int) -> float:
+        """Záporný součet ohodnocení linií vydělený jejich délkou a vážený.
+        """
+        return -(score / length) * self.weight
+
+
+class DefensiveProgressInSecondDiagonal(Evaluator, LineEvaluator):
     """Instance této třídy jsou odpovědné za zjištění pozitivního postupu ve
     hře. Konkrétně se tyto instance zaměřují na měření užitku z postupného
     plnění druhé diagonály, tedy té z vedoucí z levého spodního rohu do toho
     pravého horního.
     """
 
+    line_group = SECOND_DIAGONAL
+
     def evaluate(self, board: list[list[str]], player_mark: str,
                  opponent_mark: str) -> float:
         """Metoda, která má za cíl vyhodnotit otisk hrací plochy co do
@@ -525,3 +870,22 @@ class DefensiveProgressInSecondDiagonal(Evaluator):
             return -(diagonal.count(opponent_mark) ** 2 / length) * self.weight
         return 0
 
+    def evaluate_lines(self, lines: LineStatistics) -> float:
+        """Varianta metody `evaluate` využívající sdílené statistiky linií.
+        """
+        player_count, opponent_count = lines.second_diagonal
+        if not player_count:
+            return -(opponent_count ** 2 / lines.length) * self.weight
+        return 0
+
+    def line_score(self, player_count: int, opponent_count: int,
+                   length: int) -> int:
+        """Linie bez značky hráče je ohodnocena druhou mocninou počtu
+        políček oponenta."""
+        return 0 if player_count else opponent_count ** 2
+
+    def total_score(self, score: int, length: int) -> float:
+        """Záporný součet ohodnocení linií vydělený jejich délkou a vážený.
+        """
+        return -(score / length) * self.weight
+
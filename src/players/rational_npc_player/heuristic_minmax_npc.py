@@ -8,11 +8,29 @@ tohoto přístupu schopen částečně překračovat problém s komplexitou víc
 herních ploch.
 """
 
+import copy
+from time import perf_counter
 from typing import Iterable
 from src.game.board import BoardSnapshot
-from src.game.player import Player
+from src.game.player import Player, PlayerError
+from src.game.zobrist import zobrist_key
+from src.players.rational_npc_player.evaluation import (
+    EvaluationEngine, IncrementalEvaluation)
+from src.players.rational_npc_player.evaluation_cache import EvaluationCache
 from src.players.rational_npc_player.evaluators import Evaluator
-from src.players.rational_npc_player.utils import is_terminate, translate_board
+from src.players.rational_npc_player.line_codes import LineCodes
+from src.players.rational_npc_player.move_ordering import MoveOrdering
+from src.players.rational_npc_player.parallel import ParallelSearch
+from src.players.rational_npc_player.pondering import (Ponderer,
+                                                       SearchAborted)
+from src.players.rational_npc_player.symmetry import (
+    INVERSE_TRANSFORMS, PositionHasher, transform_move, unique_moves)
+from src.players.rational_npc_player.transposition import (
+    EXACT, LOWER_BOUND, TranspositionEntry, TranspositionTable, bound_type,
+    position_key)
+from src.players.rational_npc_player.utils import (is_terminate,
+                                                   translate_board,
+                                                   zobrist_hash)
 
 
 class LimitedMinmaxPlayer(Player):
@@ -25,7 +43,15 @@ class LimitedMinmaxPlayer(Player):
     """
 
     def __init__(self, player_name: str, mark: str,
-                 evaluators: Iterable[Evaluator] = (), max_depth: int = 9):
+                 evaluators: Iterable[Evaluator] = (), max_depth: int = 9,
+                 alpha_beta: bool = False,
+                 transposition_table: TranspositionTable = None,
+                 symmetry: bool = False, time_limit: float = None,
+                 node_limit: int = None, move_ordering: MoveOrdering = None,
+                 incremental: bool = False,
+                 evaluation_cache: EvaluationCache = None,
+                 parallel: ParallelSearch = None,
+                 pondering: bool = False):
         """Initor, který přijímá hráčovo jméno, značku, kterou označuje svá
         políčka (tahy), iterovatelnou množinu evaluačních funkcí (instancí
         typu `Evaluator`), které budou použity pro vyhodnocování tahů, a
@@ -34,16 +60,172 @@ class LimitedMinmaxPlayer(Player):
         Pro maximální hloubku prohledávání platí, že čim vyšší, tím
         kvalitnější tahy hráč hraje. Ovšem za cenu vyšší výpočetní složitosti,
         kterou musí při volbě tahu překonat.
+
+        Volitelný parametr `alpha_beta` zapíná prohledávání s alfa-beta
+        prořezáváním, které vrací tentýž tah, ale prohledá méně uzlů.
+
+        Volitelný parametr `transposition_table` umožňuje dodat
+        transpoziční tabulku, do které si hráč ukládá výsledky prohledaných
+        pozic. Tabulka je zachována mezi jednotlivými tahy; uložený výsledek
+        je použit, byla-li pozice prohledána alespoň do požadované hloubky.
+
+        Volitelný parametr `symmetry` zapíná využití symetrií hrací plochy -
+        v kořeni jsou vynechány tahy symetricky ekvivalentní s již
+        zkoušenými a transpoziční tabulka ukládá pozice v kanonickém tvaru.
+        Symetrie je vhodné zapínat jen se sadou evaluátorů, která je vůči
+        symetriím invariantní (tedy hodnotí řádky stejně jako sloupce a obě
+        diagonály stejně).
+
+        Volitelné parametry `time_limit` (v sekundách) a `node_limit`
+        omezují čas, resp. počet uzlů, které smí hráč na volbu jednoho tahu
+        spotřebovat. Je-li některý z nich zadán, prohledává hráč iterativně
+        se zvyšující se hloubkou (až do `max_depth`) a vrací nejlepší tah
+        z poslední dokončené hloubky. Nejlepší tah předchozí hloubky je
+        přitom zkoušen jako první. Hloubka 1 je dokončena vždy, hráč tak
+        tah vrátí i při vyčerpání limitu.
+
+        Volitelný parametr `move_ordering` určuje pořadí, ve kterém jsou
+        tahy zkoušeny (viz třída `MoveOrdering`). Bez něj jsou tahy zkoušeny
+        po řádcích. Vhodné pořadí zásadně zvyšuje účinnost alfa-beta
+        prořezávání; při shodném ohodnocení více tahů však může být zvolen
+        jiný z nich.
+
+        Volitelný parametr `incremental` zapíná inkrementální vyhodnocování
+        listů (viz třída `IncrementalEvaluation`) - hodnota hrací plochy je
+        aktualizována při každém tahu během prohledávání a v listu je jen
+        přečtena. Hodnoty se od běžného vyhodnocení mohou lišit nejvýše
+        zaokrouhlením.
+
+        Volitelný parametr `evaluation_cache` umožňuje dodat mezipaměť
+        hodnot listů (viz třída `EvaluationCache`). List, který již byl
+        vyhodnocen, pak není vyhodnocován znovu. Mezipaměť je zachována mezi
+        jednotlivými tahy.
+
+        Volitelný parametr `parallel` umožňuje dodat skupinu pracovních
+        procesů (viz třída `ParallelSearch`), ve kterých jsou podstromy tahů
+        v kořeni prohledávány souběžně. Zvolený tah je totožný s tahem
+        sériového prohledávání. Paralelní prohledávání nelze kombinovat
+        s limity času či uzlů.
+
+        Volitelný parametr `pondering` zapíná přemýšlení v čase soupeře
+        (metoda `ponder`, viz třída `Ponderer`).
         """
         super().__init__(player_name, mark)
+
+        if parallel is not None and (time_limit is not None or
+                                     node_limit is not None):
+            raise PlayerError("Paralelní prohledávání nelze kombinovat "
+                              "s limitem času či uzlů", self)
+        elif parallel is not None and pondering:
+            raise PlayerError("Přemýšlení v čase soupeře nelze kombinovat "
+                              "s paralelním prohledáváním", self)
+
         self.__max_depth = max_depth
         self.__evaluators: list[Evaluator] = list(evaluators)
+        self.__engine = EvaluationEngine(self.__evaluators, mark,
+                                         self.opponent_mark)
+        self.__alpha_beta = alpha_beta
+        self.__table = transposition_table
+        self.__symmetry = symmetry
+        self.__time_limit = time_limit
+        self.__node_limit = node_limit
+        self.__ordering = move_ordering
+        self.__incremental = incremental
+        self.__cache = evaluation_cache
+        self.__parallel = parallel
+        self.__nodes = 0
+        self.__completed_depth = 0
+
+        # Stav prohledávání - kódy linií, otisk a hodnota aktuální pozice,
+        # vzdálenost od kořene, tahy v kořeni, které mají být zkoušeny, tah
+        # v kořeni, který má být zkoušen jako první, a limity aktuálního
+        # prohledávání
+        self.__lines = None
+        self.__hasher = None
+        self.__position_hash = 0
+        self.__evaluation = None
+        self.__ply = 0
+        self.__root_moves = None
+        self.__first_move = None
+        self.__deadline = None
+        self.__max_nodes = None
+
+        # Událost, jejíž nastavení přeruší prohledávání, a přemýšlení
+        # v čase soupeře
+        self.__abort = None
+        self.__ponderer = None
+        if pondering:
+            self.__ponderer = Ponderer(copy.copy(self))
 
     @property
     def max_depth(self) -> int:
         """Maximální hloubka, ve které bude algoritmus prohledávat."""
         return self.__max_depth
 
+    @property
+    def alpha_beta(self) -> bool:
+        """Vrací, zda-li hráč prohledává s alfa-beta prořezáváním."""
+        return self.__alpha_beta
+
+    @property
+    def nodes(self) -> int:
+        """Počet uzlů prohledaných při volbě posledního tahu."""
+        return self.__nodes
+
+    @property
+    def transposition_table(self) -> TranspositionTable:
+        """Transpoziční tabulka hráče. Nepoužívá-li hráč tabulku, vrací None.
+        """
+        return self.__table
+
+    @property
+    def symmetry(self) -> bool:
+        """Vrací, zda-li hráč využívá symetrií hrací plochy."""
+        return self.__symmetry
+
+    @property
+    def time_limit(self) -> float:
+        """Časový limit na volbu jednoho tahu v sekundách. Není-li čas
+        omezen, vrací None."""
+        return self.__time_limit
+
+    @property
+    def node_limit(self) -> int:
+        """Limit počtu uzlů na volbu jednoho tahu. Není-li počet uzlů
+        omezen, vrací None."""
+        return self.__node_limit
+
+    @property
+    def evaluation_cache(self) -> EvaluationCache:
+        """Mezipaměť hodnot listů. Nepoužívá-li ji hráč, vrací None."""
+        return self.__cache
+
+    @property
+    def incremental(self) -> bool:
+        """Vrací, zda-li hráč vyhodnocuje listy inkrementálně."""
+        return self.__incremental
+
+    @property
+    def move_ordering(self) -> MoveOrdering:
+        """Řazení tahů hráče. Zkouší-li hráč tahy po řádcích, vrací None."""
+        return self.__ordering
+
+    @property
+    def parallel(self) -> ParallelSearch:
+        """Skupina procesů pro paralelní prohledávání. Prohledává-li hráč
+        sériově, vrací None."""
+        return self.__parallel
+
+    @property
+    def ponderer(self) -> Ponderer:
+        """Přemýšlení v čase soupeře. Nepřemýšlí-li hráč, vrací None."""
+        return self.__ponderer
+
+    @property
+    def completed_depth(self) -> int:
+        """Hloubka, ze které pochází poslední zvolený tah."""
+        return self.__completed_depth
+
     @property
     def evaluators(self) -> tuple[Evaluator]:
         """Ntice evaluačních funkcí, které jsou při rozhodování použity."""
@@ -51,56 +233,394 @@ class LimitedMinmaxPlayer(Player):
 
     def add_evaluator(self, new_evaluator: Evaluator):
         """Funkce pro přidání nové evaluační funkce pro ohodnocování svých
-        rozhodnutí."""
+        rozhodnutí.
+
+        Uložené výsledky v transpoziční tabulce i v mezipaměti hodnot listů
+        tím pozbývají platnosti, obě jsou proto vyprázdněny. Přemýšlí-li
+        hráč v čase soupeře, je přemýšlení ukončeno a nadále probíhá
+        s novou sadou evaluátorů."""
         self.__evaluators.append(new_evaluator)
+        self.__engine = EvaluationEngine(self.__evaluators, self.mark,
+                                         self.opponent_mark)
+        if self.__table is not None:
+            self.__table.clear()
+        if self.__cache is not None:
+            self.__cache.clear()
+        if self.__parallel is not None:
+            self.__parallel.forget(self)
+        if self.__ponderer is not None:
+            self.__ponderer.stop()
+            self.__ponderer = None
+            self.__ponderer = Ponderer(copy.copy(self))
 
     def move(self, board: BoardSnapshot, valid_moves: tuple[str]) -> str:
-        """Funkce odpovědná za výběr následujícího tahu."""
+        """Funkce odpovědná za výběr následujícího tahu. Byla-li odpověď na
+        tah soupeře nalezena již v jeho čase, je pouze převzata."""
+        if self.__ponderer is not None:
+            answer = self.__ponderer.finish(board)
+            if answer in valid_moves:
+                return answer
+
         new_board = translate_board(board)
-        return self.limited_minmax(
-            new_board, True, self.max_depth)[1]
+        self.__prepare(new_board)
+        try:
+            if self.__parallel is not None:
+                self.__completed_depth = self.max_depth
+                best_move, self.__nodes = self.__parallel.search(
+                    self, new_board, self.__moves(new_board),
+                    self.alpha_beta)
+                return best_move
+            if self.__time_limit is None and self.__node_limit is None:
+                self.__completed_depth = self.max_depth
+                return self.__search(new_board, self.max_depth)
+            return self.__deepen(new_board, len(valid_moves))
+        finally:
+            self.__finish()
+
+    def ponder(self, board: BoardSnapshot):
+        """Zahájí přemýšlení v čase soupeře, je-li zapnuto."""
+        if self.__ponderer is not None:
+            self.__ponderer.start(board)
+
+    def stop_pondering(self):
+        """Ukončí přemýšlení v čase soupeře, je-li zapnuto."""
+        if self.__ponderer is not None:
+            self.__ponderer.stop()
+
+    def abort_on(self, event):
+        """Nastaví událost (`threading.Event`), jejíž nastavení přeruší
+        probíhající prohledávání výjimkou `SearchAborted`."""
+        self.__abort = event
+
+    def search_move(self, board: list[list[str]], x: int, y: int,
+                    alpha: float) -> tuple[float, int]:
+        """Prohledá podstrom tahu na políčko `[x, y]` v kořeni `board` do
+        maximální hloubky. Vrací hodnotu tahu a počet prohledaných uzlů.
+
+        Při alfa-beta prořezávání je podstrom prohledán s dolní mezí
+        `alpha`; vrácená hodnota je přesná, je-li vyšší než tato mez, jinak
+        jde o horní mez skutečné hodnoty. Metoda slouží paralelnímu
+        prohledávání (viz třída `ParallelSearch`)."""
+        self.__prepare(board)
+        try:
+            board[y][x] = self.mark
+            self.__play(x, y, self.mark, len(board))
+            if self.alpha_beta:
+                value = self.limited_alphabeta(
+                    board, False, self.max_depth - 1, alpha, float("inf"))[0]
+            else:
+                value = self.limited_minmax(
+                    board, False, self.max_depth - 1)[0]
+            self.__play(x, y, self.mark, len(board), undo=True)
+            board[y][x] = ""
+            return value, self.__nodes
+        finally:
+            self.__finish()
+
+    def __prepare(self, board: list[list[str]]):
+        """Připraví stav prohledávání z dodaného kořene."""
+        self.__nodes = 0
+        self.__ply = 0
+        self.__first_move = None
+        self.__root_moves = (set(unique_moves(board))
+                             if self.__symmetry else None)
+        if self.__table is not None:
+            self.__hasher = PositionHasher(board, self.__symmetry)
+        if self.__ordering is not None:
+            self.__ordering.new_search()
+        self.__evaluation = (IncrementalEvaluation(
+            self.__evaluators, board, self.mark, self.opponent_mark)
+            if self.__incremental else None)
+        self.__lines = LineCodes(board)
+        self.__position_hash = zobrist_hash(board)
+
+    def __finish(self):
+        """Uvolní stav prohledávání."""
+        self.__lines = None
+        self.__evaluation = None
+
+    def __deepen(self, board: list[list[str]], free_fields: int) -> str:
+        """Iterativní prohledávání se zvyšující se hloubkou. Prohledávání
+        je přerušeno, jakmile je vyčerpán časový limit nebo limit uzlů;
+        vrácen je nejlepší tah poslední dokončené hloubky."""
+        start = perf_counter()
+        best_move = ""
+        self.__completed_depth = 0
+        try:
+            for depth in range(1, min(self.max_depth, free_fields) + 1):
+                try:
+                    best_move = self.__search(board, depth)
+                except _BudgetExhausted:
+                    break
+                self.__completed_depth = depth
+                x, y = map(int, best_move.split())
+                self.__first_move = (x, y)
+
+                # První hloubka je dokončena vždy, limity platí až od druhé
+                if self.__time_limit is not None:
+                    self.__deadline = start + self.__time_limit
+                self.__max_nodes = self.__node_limit
+        finally:
+            self.__deadline = None
+            self.__max_nodes = None
+        return best_move
+
+    def __search(self, board: list[list[str]], depth: int) -> str:
+        """Prohledá strom hry z kořene do dané hloubky a vrátí nejlepší tah.
+        """
+        if self.alpha_beta:
+            return self.limited_alphabeta(
+                board, True, depth, float("-inf"), float("inf"))[1]
+        return self.limited_minmax(board, True, depth)[1]
 
     def limited_minmax(self, board: list[list[str]], is_maximizing: bool,
                        depth: int) -> tuple[float, str]:
         """Metoda odpovědná za samotné vyhodnocení tahu co do bonity jeho
         následníků (listů).
         """
-        if depth == 0 or is_terminate(board):
-            return self.evaluate(board), ""
+        self.__nodes += 1
+        self.__check_budget()
+
+        # Byla-li již pozice prohledána alespoň do požadované hloubky,
+        # převezmi výsledek z tabulky
+        table = self.__table if depth > 0 else None
+        hash_move = None
+        if table is not None:
+            key, transform = self.__table_key(is_maximizing)
+            entry = table.probe(key)
+            if (entry is not None and entry.depth >= depth and
+                    self.__ply > 0):
+                return entry.value, self.__entry_move(entry, transform)
+            hash_move = self.__hash_move(entry, transform)
+
+        if depth == 0 or self.__result(board):
+            return self.__leaf_value(board, is_maximizing), ""
 
         best_move = ""
         best_score = float("-inf") if is_maximizing else float("inf")
         current_mark = self.mark if is_maximizing else self.opponent_mark
 
-        for y in range(len(board)):
-            for x in range(len(board)):
-                if board[y][x] == "":
-                    board[y][x] = current_mark
-                    score_for_move = self.limited_minmax(
-                        board,
-                        not is_maximizing,
-                        depth - 1
-                    )[0]
-
-                    if is_maximizing and score_for_move > best_score:
-                        best_score = score_for_move
-                        best_move = f"{x} {y}"
-                    elif not is_maximizing and score_for_move < best_score:
-                        best_score = score_for_move
-                        best_move = f"{x} {y}"
-
-                    board[y][x] = ""
+        for x, y in self.__moves(board, hash_move):
+            board[y][x] = current_mark
+            self.__play(x, y, current_mark, len(board))
+            score_for_move = self.limited_minmax(
+                board,
+                not is_maximizing,
+                depth - 1
+            )[0]
+            self.__play(x, y, current_mark, len(board), undo=True)
+
+            if is_maximizing and score_for_move > best_score:
+                best_score = score_for_move
+                best_move = f"{x} {y}"
+            elif not is_maximizing and score_for_move < best_score:
+                best_score = score_for_move
+                best_move = f"{x} {y}"
+
+            board[y][x] = ""
+
+        if table is not None:
+            self.__store(key, transform, best_score, depth, EXACT, best_move)
         return best_score, best_move
 
-    def evaluate(self, board: list[list[str]]) -> float:
-        """"""
-        return sum([
-            ef.evaluate(board, self.mark, self.opponent_mark)
-            for ef in self.evaluators
-        ])
+    def limited_alphabeta(self, board: list[list[str]], is_maximizing: bool,
+                          depth: int, alpha: float,
+                          beta: float) -> tuple[float, str]:
+        """Varianta metody `limited_minmax` s alfa-beta prořezáváním (ve
+        variantě *fail-soft*). Následníci, kteří již nemohou výsledek
+        ovlivnit, nejsou prohledáváni. Vrácený tah je totožný s tahem
+        vráceným metodou `limited_minmax`.
+
+        Používá-li hráč transpoziční tabulku, jsou mimo kořen využity
+        uložené výsledky - přesná hodnota přímo, mez pak k zúžení okna.
+        """
+        self.__nodes += 1
+        self.__check_budget()
+
+        table = self.__table if depth > 0 else None
+        hash_move = None
+        if table is not None:
+            key, transform = self.__table_key(is_maximizing)
+            entry = table.probe(key)
+            hash_move = self.__hash_move(entry, transform)
+            if (entry is not None and entry.depth >= depth and
+                    self.__ply > 0):
+                if entry.bound == EXACT:
+                    return entry.value, self.__entry_move(entry, transform)
+                elif entry.bound == LOWER_BOUND:
+                    alpha = max(alpha, entry.value)
+                else:
+                    beta = min(beta, entry.value)
+                if alpha >= beta:
+                    return entry.value, self.__entry_move(entry, transform)
+
+        # Okno, vůči kterému je určen typ výsledné hodnoty
+        window = (alpha, beta)
+
+        if depth == 0 or self.__result(board):
+            return self.__leaf_value(board, is_maximizing), ""
 
+        best_move = ""
+        best_score = float("-inf") if is_maximizing else float("inf")
+        current_mark = self.mark if is_maximizing else self.opponent_mark
+
+        for x, y in self.__moves(board, hash_move):
+            board[y][x] = current_mark
+            self.__play(x, y, current_mark, len(board))
+            score_for_move = self.limited_alphabeta(
+                board, not is_maximizing, depth - 1, alpha, beta)[0]
+            self.__play(x, y, current_mark, len(board), undo=True)
+            board[y][x] = ""
+
+            if is_maximizing:
+                if score_for_move > best_score:
+                    best_score = score_for_move
+                    best_move = f"{x} {y}"
+                alpha = max(alpha, score_for_move)
+            else:
+                if score_for_move < best_score:
+                    best_score = score_for_move
+                    best_move = f"{x} {y}"
+                beta = min(beta, score_for_move)
+
+            if alpha >= beta:
+                if self.__ordering is not None:
+                    self.__ordering.record_cutoff((x, y), self.__ply, depth)
+                break
+
+        if table is not None:
+            self.__store(key, transform, best_score, depth,
+                         bound_type(best_score, *window), best_move)
+        return best_score, best_move
+
+    def __play(self, x: int, y: int, mark: str, base: int,
+               undo: bool = False):
+        """Promítne provedení (případně vrácení) tahu do vzdálenosti od
+        kořene, do kódů linií a, používá-li hráč transpoziční tabulku,
+        mezipaměť hodnot listů či inkrementální vyhodnocování, do otisku
+        aktuální pozice a její hodnoty."""
+        self.__ply += -1 if undo else 1
+        if self.__table is not None:
+            self.__hasher.toggle(x, y, mark)
+        if self.__lines is not None:
+            if undo:
+                self.__lines.remove(x, y, mark)
+            else:
+                self.__lines.place(x, y, mark)
+        if self.__cache is not None:
+            self.__position_hash ^= zobrist_key(x, y, mark, base)
+        if self.__evaluation is not None:
+            if undo:
+                self.__evaluation.remove(x, y, mark)
+            else:
+                self.__evaluation.place(x, y, mark)
+
+    def __result(self, board: list[list[str]]) -> str:
+        """Vrací výsledek aktuální pozice (viz `utils.is_terminate`). Během
+        volby tahu je výsledek vyhledán v udržovaných kódech linií."""
+        if self.__lines is not None:
+            return self.__lines.result
+        return is_terminate(board)
+
+    def __leaf_value(self, board: list[list[str]],
+                     is_maximizing: bool) -> float:
+        """Vrací hodnotu listu. Používá-li hráč mezipaměť, je hodnota nejprve
+        hledána v ní.
 
+        Hodnota je jinak získána z inkrementálního vyhodnocování, je-li
+        zapnuto, nebo vypočtena evaluačním jádrem (ze statistik linií
+        sestavených z udržovaných kódů linií)."""
+        cache = self.__cache
+        if cache is not None:
+            key = position_key(self.__position_hash, is_maximizing)
+            value = cache.probe(key)
+            if value is not None:
+                return value
 
+        if self.__evaluation is not None:
+            value = self.__evaluation.value
+        elif self.__lines is not None and self.__engine.uses_lines:
+            value = self.__engine.evaluate(
+                board, self.__lines.statistics(self.mark))
+        else:
+            value = self.evaluate(board)
 
+        if cache is not None:
+            cache.store(key, value)
+        return value
+
+    def __moves(self, board: list[list[str]],
+                hash_move: tuple[int, int] = None) -> list[tuple[int, int]]:
+        """Vrací souřadnice políček, na která má být v aktuálním uzlu
+        zkoušen tah. V kořeni jsou při využití symetrií vynechány tahy
+        symetrické s již zkoušenými a nejlepší tah předchozí hloubky (při
+        iterativním prohledávání) je zkoušen jako první.
+
+        Používá-li hráč řazení tahů, je pořadí určeno jím (parametr
+        `hash_move` je tah z transpoziční tabulky); jinak jsou tahy zkoušeny
+        po řádcích."""
+        base = len(board)
+        moves = [(x, y) for y in range(base) for x in range(base)
+                 if board[y][x] == ""]
+        if self.__ply == 0:
+            if self.__root_moves is not None:
+                moves = [move for move in moves if move in self.__root_moves]
+            hash_move = self.__first_move or hash_move
+        elif self.__ordering is None:
+            return moves
+
+        if self.__ordering is not None:
+            return self.__ordering.order(moves, base, self.__ply, hash_move)
+        if hash_move in moves:
+            moves.remove(hash_move)
+            moves.insert(0, hash_move)
+        return moves
+
+    def __check_budget(self):
+        """Přeruší prohledávání, je-li vyčerpán časový limit nebo limit
+        uzlů, případně bylo-li ukončeno přemýšlení v čase soupeře."""
+        if self.__abort is not None and self.__abort.is_set():
+            raise SearchAborted()
+        if ((self.__deadline is not None and
+             perf_counter() >= self.__deadline) or
+                (self.__max_nodes is not None and
+                 self.__nodes > self.__max_nodes)):
+            raise _BudgetExhausted()
+
+    def __table_key(self, is_maximizing: bool) -> tuple[int, int]:
+        """Vrací klíč aktuální pozice do transpoziční tabulky a index
+        transformace na její kanonický obraz."""
+        canonical, transform = self.__hasher.canonical
+        return position_key(canonical, is_maximizing), transform
+
+    def __entry_move(self, entry: TranspositionEntry, transform: int) -> str:
+        """Převede nejlepší tah záznamu tabulky z kanonického tvaru zpět
+        do souřadnic aktuální pozice."""
+        return transform_move(entry.best_move, INVERSE_TRANSFORMS[transform],
+                              self.__hasher.base)
+
+    def __hash_move(self, entry: TranspositionEntry,
+                    transform: int) -> tuple[int, int]:
+        """Vrací souřadnice nejlepšího tahu záznamu tabulky v aktuální
+        pozici, má-li být tah využit k řazení tahů."""
+        if self.__ordering is None or entry is None or not entry.best_move:
+            return None
+        x, y = map(int, self.__entry_move(entry, transform).split())
+        return x, y
+
+    def __store(self, key: int, transform: int, value: float, depth: int,
+                bound: int, best_move: str):
+        """Uloží výsledek aktuální pozice do transpoziční tabulky; nejlepší
+        tah je uložen v kanonickém tvaru pozice."""
+        self.__table.store(
+            key, value, depth, bound,
+            transform_move(best_move, transform, self.__hasher.base))
+
+    def evaluate(self, board: list[list[str]]) -> float:
+        """Vyhodnotí hrací plochu součtem hodnot všech evaluátorů. Hrací
+        plocha je přitom procházena jen jednou (viz `EvaluationEngine`)."""
+        return self.__engine.evaluate(board)
 
 
+class _BudgetExhausted(Exception):
+    """Výjimka, kterou je přerušeno prohledávání po vyčerpání limitu."""
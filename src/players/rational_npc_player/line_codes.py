@@ -0,0 +1,187 @@
+"""Tento modul obsahuje tabulky pro vyhodnocování jednotlivých linií hrací
+plochy.
+
+Každou linii (řádek, sloupec či diagonálu) lze zakódovat jako celé číslo
+v trojkové soustavě - políčko na pozici `i` je cifrou řádu `3 ** i`,
+přičemž prázdné políčko má cifru 0, značka `X` cifru 1 a značka `O` cifru 2.
+Linie délky `k` má tedy `3 ** k` možných kódů a vše, co o linii potřebujeme
+vědět (zda-li je vyhraná a kým, kolik obsahuje značek jednotlivých hráčů
+a jaký přináší postup), lze pro každý kód spočítat předem. Vyhodnocení
+linie je pak jen vyhledáním v tabulce.
+
+Tabulky jsou sestavovány líně, až při prvním použití dané délky linie,
+a uchovávány pro další použití.
+"""
+
+from functools import lru_cache
+from itertools import product
+from typing import NamedTuple
+
+from src.players.rational_npc_player.evaluators import LineStatistics
+
+# Obsah políček v pořadí dle jejich cifry v kódu linie
+MARKS = ("", "X", "O")
+
+
+class LineTable(NamedTuple):
+    """Tabulky vlastností všech linií dané délky."""
+
+    # Délka linie
+    length: int
+
+    # Kódy linií zadaných nticí obsahů jejich políček
+    codes: dict[tuple[str], int]
+
+    # Pro každý kód značka hráče, který linii celou vyplnil, nebo prázdný
+    # řetězec
+    winners: tuple[str]
+
+    # Pro každou značku a každý kód dvojice (počet políček se značkou,
+    # počet políček se značkou soupeře)
+    counts: dict[str, tuple[tuple[int, int]]]
+
+    # Pro každou značku a každý kód postup hráče s touto značkou v linii -
+    # druhá mocnina počtu jeho políček vydělená délkou linie, neobsahuje-li
+    # linie značku soupeře; jinak nula
+    progress: dict[str, tuple[float]]
+
+
+def line_code(line: tuple[str]) -> int:
+    """Vrací kód linie zadané nticí obsahů jejích políček."""
+    code = 0
+    for mark in reversed(line):
+        code = code * 3 + MARKS.index(mark)
+    return code
+
+
+@lru_cache(maxsize=None)
+def line_table(length: int) -> LineTable:
+    """Vrací tabulky vlastností linií dané délky. Tabulky jsou sestaveny
+    při prvním volání pro danou délku."""
+    # Linie seřazené dle kódu - index linie je tak zároveň jejím kódem
+    lines = sorted(product(MARKS, repeat=length), key=line_code)
+
+    winners = []
+    counts = {"X": [], "O": []}
+    progress = {"X": [], "O": []}
+    for line in lines:
+        winners.append(line[0] if line[0] and len(set(line)) == 1 else "")
+        for mark, opponent in (("X", "O"), ("O", "X")):
+            own, other = line.count(mark), line.count(opponent)
+            counts[mark].append((own, other))
+            progress[mark].append(0 if other else own ** 2 / length)
+
+    return LineTable(
+        length,
+        {line: code for code, line in enumerate(lines)},
+        tuple(winners),
+        {mark: tuple(values) for mark, values in counts.items()},
+        {mark: tuple(values) for mark, values in progress.items()})
+
+
+def board_lines(board: list[list[str]]) -> list[tuple[str]]:
+    """Vrací všechny linie hrací plochy coby ntice obsahů políček - nejprve
+    řádky, poté sloupce, první diagonálu (z levého horního rohu) a druhou
+    diagonálu (z levého dolního rohu)."""
+    length = len(board)
+    return ([tuple(row) for row in board] + list(zip(*board)) +
+            [tuple([board[i][i] for i in range(length)]),
+             tuple([board[length - i - 1][i] for i in range(length)])])
+
+
+def line_codes(board: list[list[str]]) -> list[int]:
+    """Vrací kódy všech linií hrací plochy v pořadí dle `board_lines`."""
+    codes = line_table(len(board)).codes
+    return [codes[line] for line in board_lines(board)]
+
+
+@lru_cache(maxsize=None)
+def cell_lines(base: int) -> tuple[tuple[tuple[int, int]]]:
+    """Vrací pro každé políčko (adresované indexem `y * base + x`) ntici
+    dvojic (index linie, řád políčka v kódu linie) všech linií, které přes
+    políčko vedou. Linie jsou indexovány v pořadí dle `board_lines`."""
+    result = []
+    for y in range(base):
+        for x in range(base):
+            lines = [(y, 3 ** x), (base + x, 3 ** y)]
+            if x == y:
+                lines.append((2 * base, 3 ** x))
+            if x == base - 1 - y:
+                lines.append((2 * base + 1, 3 ** x))
+            result.append(tuple(lines))
+    return tuple(result)
+
+
+class LineCodes:
+    """Instance této třídy udržují kódy všech linií hrací plochy během
+    prohledávání.
+
+    Označení či odznačení políčka změní jen kódy linií, které přes políčko
+    vedou. Test konce hry je pak jen vyhledáním těchto linií v tabulce
+    a statistiky linií pro evaluátory lze sestavit bez procházení hrací
+    plochy.
+    """
+
+    def __init__(self, board: list[list[str]]):
+        """Initor, který přijímá výchozí hrací plochu."""
+        self.__base = base = len(board)
+        self.__table = line_table(base)
+        self.__cell_lines = cell_lines(base)
+        self.__codes = [0] * (2 * base + 2)
+        self.__empty = base * base
+
+        # Počty linií celých vyplněných jednotlivými značkami
+        self.__won = {"X": 0, "O": 0}
+
+        for y in range(base):
+            for x in range(base):
+                if board[y][x]:
+                    self.place(x, y, board[y][x])
+
+    @property
+    def codes(self) -> tuple[int]:
+        """Kódy všech linií v pořadí dle funkce `board_lines`."""
+        return tuple(self.__codes)
+
+    @property
+    def result(self) -> str:
+        """Výsledek aktuální pozice ve stejném tvaru jako u funkce
+        `utils.is_terminate` - značka vítěze, `draw` při remíze nebo
+        prázdný řetězec, není-li hra u konce."""
+        if self.__won["X"]:
+            return "X"
+        elif self.__won["O"]:
+            return "O"
+        return "" if self.__empty else "draw"
+
+    def place(self, x: int, y: int, mark: str):
+        """Promítne označení políčka dodanou značkou."""
+        digit = MARKS.index(mark)
+        codes = self.__codes
+        winners = self.__table.winners
+        for line, power in self.__cell_lines[y * self.__base + x]:
+            codes[line] += digit * power
+            if winners[codes[line]]:
+                self.__won[mark] += 1
+        self.__empty -= 1
+
+    def remove(self, x: int, y: int, mark: str):
+        """Promítne odznačení políčka označeného dodanou značkou."""
+        digit = MARKS.index(mark)
+        codes = self.__codes
+        winners = self.__table.winners
+        for line, power in self.__cell_lines[y * self.__base + x]:
+            if winners[codes[line]]:
+                self.__won[mark] -= 1
+            codes[line] -= digit * power
+        self.__empty += 1
+
+    def statistics(self, player_mark: str) -> LineStatistics:
+        """Sestaví statistiky linií (viz `LineStatistics`) z pohledu hráče
+        s dodanou značkou."""
+        counts = self.__table.counts[player_mark]
+        lines = [counts[code] for code in self.__codes]
+        base = self.__base
+        return LineStatistics(base, tuple(lines[:base]),
+                              tuple(lines[base:2 * base]),
+                              lines[2 * base], lines[2 * base + 1])
@@ -2,8 +2,21 @@
 Cílem tohoto hráče je demonstrovat hledání optimální strategie.
 """
 
+import copy
+
 from src.game.board import BoardSnapshot
-from src.game.player import Player
+from src.game.player import Player, PlayerError
+from src.players.rational_npc_player.line_codes import LineCodes
+from src.players.rational_npc_player.move_ordering import MoveOrdering
+from src.players.rational_npc_player.parallel import ParallelSearch
+from src.players.rational_npc_player.pondering import (Ponderer,
+                                                       SearchAborted)
+from src.players.rational_npc_player.solved_db import SolvedDatabase
+from src.players.rational_npc_player.symmetry import (
+    INVERSE_TRANSFORMS, PositionHasher, transform_move, unique_moves)
+from src.players.rational_npc_player.transposition import (
+    EXACT, LOWER_BOUND, TranspositionEntry, TranspositionTable, bound_type,
+    position_key)
 from src.players.rational_npc_player.utils import is_terminate, translate_board
 
 
@@ -14,24 +27,86 @@ class MinmaxNPC(Player):
     remízy.
     """
 
-    # Distribuce výplat pro jednotlivé výsledky hry; slovník je inicializován
-    # z initoru instance této třídy v závislosti na přiřazené značce
-    __POINTS = {}
-
-    def __init__(self, player_name: str, mark: str):
+    def __init__(self, player_name: str, mark: str, alpha_beta: bool = False,
+                 transposition_table: TranspositionTable = None,
+                 symmetry: bool = False,
+                 solved_database: SolvedDatabase = None,
+                 move_ordering: MoveOrdering = None,
+                 parallel: ParallelSearch = None,
+                 pondering: bool = False):
         """Initor instance, který přijímá v parametru název hráče a značku,
         kterou má používat pro označování svých políček.
+
+        Volitelný parametr `alpha_beta` zapíná prohledávání s alfa-beta
+        prořezáváním, které vrací tentýž tah jako prostý minmax, ale
+        prohledá řádově méně uzlů.
+
+        Volitelný parametr `transposition_table` umožňuje dodat
+        transpoziční tabulku, do které si hráč ukládá výsledky prohledaných
+        pozic. Tabulka je zachována mezi jednotlivými tahy.
+
+        Volitelný parametr `symmetry` zapíná využití symetrií hrací plochy -
+        v kořeni jsou vynechány tahy symetricky ekvivalentní s již
+        zkoušenými a transpoziční tabulka ukládá pozice v kanonickém tvaru.
+
+        Volitelný parametr `solved_database` umožňuje dodat databázi
+        vyřešených pozic (viz modul `solved_db`). Je-li aktuální pozice
+        v databázi, je tah pouze vyhledán; jinak hráč tah dohledá
+        prohledáváním.
+
+        Volitelný parametr `move_ordering` určuje pořadí, ve kterém jsou
+        tahy zkoušeny (viz třída `MoveOrdering`). Bez něj jsou tahy zkoušeny
+        po řádcích. Vhodné pořadí zásadně zvyšuje účinnost alfa-beta
+        prořezávání; při shodném ohodnocení více tahů však může být zvolen
+        jiný z nich.
+
+        Volitelný parametr `parallel` umožňuje dodat skupinu pracovních
+        procesů (viz třída `ParallelSearch`), ve kterých jsou podstromy tahů
+        v kořeni prohledávány souběžně. Zvolený tah je totožný s tahem
+        sériového prohledávání.
+
+        Volitelný parametr `pondering` zapíná přemýšlení v čase soupeře
+        (metoda `ponder`, viz třída `Ponderer`).
         """
         # Volání initoru předka
         super().__init__(player_name, mark)
 
-        # Inicializace slovníku výplat
-        MinmaxNPC.__POINTS = {
+        if parallel is not None and pondering:
+            raise PlayerError("Přemýšlení v čase soupeře nelze kombinovat "
+                              "s paralelním prohledáváním", self)
+
+        self.__alpha_beta = alpha_beta
+        self.__table = transposition_table
+        self.__symmetry = symmetry
+        self.__database = solved_database
+        self.__ordering = move_ordering
+        self.__parallel = parallel
+        self.__nodes = 0
+
+        # Událost, jejíž nastavení přeruší prohledávání, a přemýšlení
+        # v čase soupeře
+        self.__abort = None
+        self.__ponderer = None
+
+        # Stav prohledávání - kódy linií a otisk aktuální pozice, vzdálenost
+        # od kořene, hloubka kořene a tahy v kořeni, které mají být zkoušeny
+        self.__lines = None
+        self.__hasher = None
+        self.__ply = 0
+        self.__root_depth = 0
+        self.__root_moves = None
+
+        # Distribuce výplat pro jednotlivé výsledky hry v závislosti na
+        # přiřazené značce
+        self.__points = {
             mark: 1,                 # Body za výhru
             self.opponent_mark: -1,  # Body za prohru
             "draw": 0                # Body za remízu
         }
 
+        if pondering:
+            self.__ponderer = Ponderer(copy.copy(self))
+
     def move(self, board: BoardSnapshot, valid_moves: tuple[str]) -> str:
         """Metoda odpovědná za výběr optimálního, leč racionálního tahu.
         Přijímá otisk hrací plochy, který si převádí do interní reprezentace
@@ -39,10 +114,115 @@ class MinmaxNPC(Player):
         `__translate_board(BoardSnapshot) -> list[list[str]]`. Tento proces
         byl zvolen jako výpočetně nejpoužitelnější.
 
-        Dále tato metoda iniciuje minimax algoritmus, který vrací zvolený tah.
+        Byla-li odpověď na tah soupeře nalezena již v jeho čase, je pouze
+        převzata. Je-li pozice v databázi vyřešených pozic, je tah převzat
+        z ní. Jinak tato metoda iniciuje minimax algoritmus, který vrací
+        zvolený tah.
         """
+        if self.__ponderer is not None:
+            answer = self.__ponderer.finish(board)
+            if answer in valid_moves:
+                return answer
+
         new_board = translate_board(board)
-        return self.minimax(new_board, True)[1]
+        self.__nodes = 0
+        if self.__database is not None:
+            solved = self.__database.lookup(new_board, self.mark)
+            if solved is not None:
+                return solved[1]
+        self.__prepare(new_board)
+        try:
+            if self.__parallel is not None:
+                best_move, self.__nodes = self.__parallel.search(
+                    self, new_board, self.__moves(new_board),
+                    self.alpha_beta)
+                return best_move
+            if self.alpha_beta:
+                return self.alphabeta(
+                    new_board, True, float("-inf"), float("inf"))[1]
+            return self.minimax(new_board, True)[1]
+        finally:
+            self.__lines = None
+
+    def ponder(self, board: BoardSnapshot):
+        """Zahájí přemýšlení v čase soupeře, je-li zapnuto."""
+        if self.__ponderer is not None:
+            self.__ponderer.start(board)
+
+    def stop_pondering(self):
+        """Ukončí přemýšlení v čase soupeře, je-li zapnuto."""
+        if self.__ponderer is not None:
+            self.__ponderer.stop()
+
+    def abort_on(self, event):
+        """Nastaví událost (`threading.Event`), jejíž nastavení přeruší
+        probíhající prohledávání výjimkou `SearchAborted`."""
+        self.__abort = event
+
+    def search_move(self, board: list[list[str]], x: int, y: int,
+                    alpha: float) -> tuple[int, int]:
+        """Prohledá podstrom tahu na políčko `[x, y]` v kořeni `board`.
+        Vrací hodnotu tahu a počet prohledaných uzlů.
+
+        Při alfa-beta prořezávání je podstrom prohledán s dolní mezí
+        `alpha`; vrácená hodnota je přesná, je-li vyšší než tato mez, jinak
+        jde o horní mez skutečné hodnoty. Metoda slouží paralelnímu
+        prohledávání (viz třída `ParallelSearch`)."""
+        self.__prepare(board)
+        try:
+            board[y][x] = self.mark
+            self.__play(x, y, self.mark, len(board))
+            if self.alpha_beta:
+                value = self.alphabeta(board, False, alpha, float("inf"))[0]
+            else:
+                value = self.minimax(board, False)[0]
+            self.__play(x, y, self.mark, len(board), undo=True)
+            board[y][x] = ""
+            return value, self.__nodes
+        finally:
+            self.__lines = None
+
+    @property
+    def alpha_beta(self) -> bool:
+        """Vrací, zda-li hráč prohledává s alfa-beta prořezáváním."""
+        return self.__alpha_beta
+
+    @property
+    def nodes(self) -> int:
+        """Počet uzlů prohledaných při volbě posledního tahu."""
+        return self.__nodes
+
+    @property
+    def transposition_table(self) -> TranspositionTable:
+        """Transpoziční tabulka hráče. Nepoužívá-li hráč tabulku, vrací None.
+        """
+        return self.__table
+
+    @property
+    def symmetry(self) -> bool:
+        """Vrací, zda-li hráč využívá symetrií hrací plochy."""
+        return self.__symmetry
+
+    @property
+    def move_ordering(self) -> MoveOrdering:
+        """Řazení tahů hráče. Zkouší-li hráč tahy po řádcích, vrací None."""
+        return self.__ordering
+
+    @property
+    def parallel(self) -> ParallelSearch:
+        """Skupina procesů pro paralelní prohledávání. Prohledává-li hráč
+        sériově, vrací None."""
+        return self.__parallel
+
+    @property
+    def ponderer(self) -> Ponderer:
+        """Přemýšlení v čase soupeře. Nepřemýšlí-li hráč, vrací None."""
+        return self.__ponderer
+
+    @property
+    def solved_database(self) -> SolvedDatabase:
+        """Databáze vyřešených pozic. Nepoužívá-li ji hráč, vrací None."""
+        return self.__database
 
     def minimax(self, board: list[list[str]], is_maximizing: bool) -> tuple[int, str]:
         """Samotná definice rekurzivního garančního algoritmu minmax, který
@@ -50,9 +230,22 @@ class MinmaxNPC(Player):
 
         Funkce vrací bodový zisk a tah, který k němu vede.
         """
+        self.__nodes += 1
+        if self.__abort is not None and self.__abort.is_set():
+            raise SearchAborted()
+
+        # Byla-li již pozice prohledána, převezmi výsledek z tabulky
+        table = self.__table
+        hash_move = None
+        if table is not None:
+            key, transform = self.__table_key(is_maximizing)
+            entry = table.probe(key)
+            if entry is not None and self.__ply > 0:
+                return entry.value, self.__entry_move(entry, transform)
+            hash_move = self.__hash_move(entry, transform)
 
         # Test terminality uzlu - uloží si výsledek
-        result = is_terminate(board)
+        result = self.__result(board)
 
         # Pokud je terminální (výsledek jiný než prázdný řetězec)
         if result:
@@ -62,42 +255,202 @@ class MinmaxNPC(Player):
         best_move = ""
         best_score = float("-inf") if is_maximizing else float("inf")
 
-        # Pro každé políčko
-        for y in range(len(board)):
-            for x in range(len(board)):
+        # Pro každé políčko, které lze vyplnit (a nejde-li v kořeni o tah
+        # symetrický s již zkoušeným)
+        for x, y in self.__moves(board, hash_move):
+
+            # Nastav políčku značku aktuálního hráče
+            mark = self.mark if is_maximizing else self.opponent_mark
+            board[y][x] = mark
+            self.__play(x, y, mark, len(board))
+
+            # Zjisti aktuální skóre rekurzivním zavoláním sebe sama
+            score = self.minimax(
+                board,
+                not is_maximizing
+            )[0]
+            self.__play(x, y, mark, len(board), undo=True)
+
+            # Pokud je skóre pro daného hráče výhodné, je to pro něj
+            # doposud nejlepší tah
+            if is_maximizing and score > best_score:
+                best_score = score
+                best_move = f"{x} {y}"
+            elif not is_maximizing and score < best_score:
+                best_score = score
+                best_move = f"{x} {y}"
+
+            # V rámci backtrackingu se vrať
+            board[y][x] = ""
+
+        # Ulož výsledek do transpoziční tabulky
+        if table is not None:
+            self.__store(key, transform, best_score, EXACT, best_move)
 
-                # Lze-li políčko vyplnit
-                if board[y][x] == "":
+        # Vrať nejlepší nalezené skóre při aplikaci vráceného tahu
+        return best_score, best_move
 
-                    # Nastav políčku značku aktuálního hráče
-                    board[y][x] = self.mark if is_maximizing else self.opponent_mark
+    def alphabeta(self, board: list[list[str]], is_maximizing: bool,
+                  alpha: float, beta: float) -> tuple[int, str]:
+        """Varianta algoritmu minmax s alfa-beta prořezáváním. Parametry
+        `alpha` a `beta` představují dolní a horní mez okna, ve kterém má
+        smysl hodnotu uzlu zpřesňovat. Jakmile se okno uzavře, zbylí
+        následníci již výsledek ovlivnit nemohou a nejsou prohledáváni.
 
-                    # Zjisti aktuální skóre rekurzivním zavoláním sebe sama
-                    score = self.minimax(
-                        board,
-                        not is_maximizing
-                    )[0]
+        Jde o tzv. *fail-soft* variantu - vrácená hodnota může ležet i mimo
+        okno; v takovém případě jde o mez skutečné hodnoty uzlu. Tahy jsou
+        zkoušeny ve stejném pořadí jako v metodě `minimax`, vrácený tah je
+        tedy totožný.
 
-                    # Pokud je skóre pro daného hráče výhodné, je to pro něj
-                    # doposud nejlepší tah
-                    if is_maximizing and score > best_score:
-                        best_score = score
-                        best_move = f"{x} {y}"
-                    elif not is_maximizing and score < best_score:
-                        best_score = score
-                        best_move = f"{x} {y}"
+        Používá-li hráč transpoziční tabulku, jsou mimo kořen využity
+        uložené výsledky - přesná hodnota přímo, mez pak k zúžení okna.
+        """
+        self.__nodes += 1
+        if self.__abort is not None and self.__abort.is_set():
+            raise SearchAborted()
+
+        table = self.__table
+        hash_move = None
+        if table is not None:
+            key, transform = self.__table_key(is_maximizing)
+            entry = table.probe(key)
+            hash_move = self.__hash_move(entry, transform)
+            if entry is not None and self.__ply > 0:
+                if entry.bound == EXACT:
+                    return entry.value, self.__entry_move(entry, transform)
+                elif entry.bound == LOWER_BOUND:
+                    alpha = max(alpha, entry.value)
+                else:
+                    beta = min(beta, entry.value)
+                if alpha >= beta:
+                    return entry.value, self.__entry_move(entry, transform)
+
+        # Okno, vůči kterému je určen typ výsledné hodnoty
+        window = (alpha, beta)
+
+        result = self.__result(board)
+        if result:
+            return self.points()[result], ""
 
-                    # V rámci backtrackingu se vrať
-                    board[y][x] = ""
+        best_move = ""
+        best_score = float("-inf") if is_maximizing else float("inf")
+        current_mark = self.mark if is_maximizing else self.opponent_mark
+
+        for x, y in self.__moves(board, hash_move):
+            board[y][x] = current_mark
+            self.__play(x, y, current_mark, len(board))
+            score = self.alphabeta(board, not is_maximizing, alpha, beta)[0]
+            self.__play(x, y, current_mark, len(board), undo=True)
+            board[y][x] = ""
+
+            if is_maximizing:
+                if score > best_score:
+                    best_score = score
+                    best_move = f"{x} {y}"
+                alpha = max(alpha, score)
+            else:
+                if score < best_score:
+                    best_score = score
+                    best_move = f"{x} {y}"
+                beta = min(beta, score)
+
+            # Okno se uzavřelo - zbylé tahy výsledek neovlivní
+            if alpha >= beta:
+                if self.__ordering is not None:
+                    self.__ordering.record_cutoff(
+                        (x, y), self.__ply, self.__root_depth - self.__ply)
+                break
+
+        if table is not None:
+            self.__store(key, transform, best_score,
+                         bound_type(best_score, *window), best_move)
 
-        # Vrať nejlepší nalezené skóre při aplikaci vráceného tahu
         return best_score, best_move
 
-    @classmethod
-    def points(cls):
-        """Třídní metoda vracející bodové ohodnocení pro jednotlivé výsledky.
-        """
-        return cls.__POINTS
+    def points(self) -> dict[str, int]:
+        """Metoda vracející bodové ohodnocení pro jednotlivé výsledky."""
+        return self.__points
+
+    def __prepare(self, board: list[list[str]]):
+        """Připraví stav prohledávání z dodaného kořene."""
+        self.__nodes = 0
+        self.__ply = 0
+        self.__root_depth = sum(row.count("") for row in board)
+        self.__root_moves = (set(unique_moves(board))
+                             if self.__symmetry else None)
+        if self.__table is not None:
+            self.__hasher = PositionHasher(board, self.__symmetry)
+        if self.__ordering is not None:
+            self.__ordering.new_search()
+        self.__lines = LineCodes(board)
+
+    def __play(self, x: int, y: int, mark: str, base: int,
+               undo: bool = False):
+        """Promítne provedení (případně vrácení) tahu do vzdálenosti od
+        kořene, do kódů linií a, používá-li hráč transpoziční tabulku, do
+        otisku aktuální pozice."""
+        self.__ply += -1 if undo else 1
+        if self.__table is not None:
+            self.__hasher.toggle(x, y, mark)
+        if self.__lines is not None:
+            if undo:
+                self.__lines.remove(x, y, mark)
+            else:
+                self.__lines.place(x, y, mark)
+
+    def __result(self, board: list[list[str]]) -> str:
+        """Vrací výsledek aktuální pozice (viz `utils.is_terminate`). Během
+        volby tahu je výsledek vyhledán v udržovaných kódech linií."""
+        if self.__lines is not None:
+            return self.__lines.result
+        return is_terminate(board)
+
+    def __moves(self, board: list[list[str]],
+                hash_move: tuple[int, int] = None) -> list[tuple[int, int]]:
+        """Vrací souřadnice políček, na která má být v aktuálním uzlu
+        zkoušen tah. V kořeni jsou při využití symetrií vynechány tahy
+        symetrické s již zkoušenými.
+
+        Používá-li hráč řazení tahů, je pořadí určeno jím (parametr
+        `hash_move` je tah z transpoziční tabulky); jinak jsou tahy zkoušeny
+        po řádcích."""
+        base = len(board)
+        moves = [(x, y) for y in range(base) for x in range(base)
+                 if board[y][x] == ""]
+        if self.__ply == 0 and self.__root_moves is not None:
+            moves = [move for move in moves if move in self.__root_moves]
+        if self.__ordering is not None:
+            return self.__ordering.order(moves, base, self.__ply, hash_move)
+        return moves
+
+    def __table_key(self, is_maximizing: bool) -> tuple[int, int]:
+        """Vrací klíč aktuální pozice do transpoziční tabulky a index
+        transformace na její kanonický obraz."""
+        canonical, transform = self.__hasher.canonical
+        return position_key(canonical, is_maximizing), transform
+
+    def __entry_move(self, entry: TranspositionEntry, transform: int) -> str:
+        """Převede nejlepší tah záznamu tabulky z kanonického tvaru zpět
+        do souřadnic aktuální pozice."""
+        return transform_move(entry.best_move, INVERSE_TRANSFORMS[transform],
+                              self.__hasher.base)
+
+    def __hash_move(self, entry: TranspositionEntry,
+                    transform: int) -> tuple[int, int]:
+        """Vrací souřadnice nejlepšího tahu záznamu tabulky v aktuální
+        pozici, má-li být tah využit k řazení tahů."""
+        if self.__ordering is None or entry is None or not entry.best_move:
+            return None
+        x, y = map(int, self.__entry_move(entry, transform).split())
+        return x, y
+
+    def __store(self, key: int, transform: int, value: float, bound: int,
+                best_move: str):
+        """Uloží výsledek aktuální pozice do transpoziční tabulky; nejlepší
+        tah je uložen v kanonickém tvaru pozice."""
+        self.__table.store(
+            key, value, self.__root_depth - self.__ply, bound,
+            transform_move(best_move, transform, self.__hasher.base))
 
 
 
@@ -0,0 +1,132 @@
+"""Tento modul obsahuje prostředky pro řazení tahů během prohledávání.
+
+Účinnost alfa-beta prořezávání závisí na pořadí, ve kterém jsou tahy
+zkoušeny - je-li nejlepší tah vyzkoušen jako první, okno se uzavře nejdříve
+a zbylé tahy není nutné prohledávat. Pořadí tahů je proto určeno několika
+heuristikami:
+
+- **tah z transpoziční tabulky** - nejlepší tah nalezený při dřívějším
+  prohledání téže pozice
+- **killer tahy** - tahy, které v téže vzdálenosti od kořene nedávno
+  způsobily prořezání
+- **historie** - tahy, které během prohledávání způsobily prořezání, jsou
+  tím více upřednostňovány, čím hlubší podstrom odřízly
+- **statická priorita** - políčka, kterými prochází více linií (střed, poté
+  rohy), jsou zkoušena dříve
+"""
+
+from functools import lru_cache
+
+from src.game.bitboard import cell_bit, line_masks
+
+# Počet killer tahů udržovaných pro každou vzdálenost od kořene
+KILLER_SLOTS = 2
+
+
+@lru_cache(maxsize=None)
+def static_priority(base: int) -> tuple[int]:
+    """Vrací pro každé políčko (adresované indexem `y * base + x`) jeho
+    pořadí dle statické priority - nižší číslo znamená vyšší prioritu.
+    Přednost mají políčka, kterými prochází více výherních linií, při
+    shodě pak políčka bližší středu hrací plochy."""
+    lines = line_masks(base)
+    center = (base - 1) / 2
+
+    def key(index: int):
+        x, y = index % base, index // base
+        crossing = sum(1 for line in lines if line & cell_bit(x, y, base))
+        return -crossing, (x - center) ** 2 + (y - center) ** 2, index
+
+    order = sorted(range(base * base), key=key)
+    priority = [0] * (base * base)
+    for rank, index in enumerate(order):
+        priority[index] = rank
+    return tuple(priority)
+
+
+class MoveOrdering:
+    """Instance této třídy určují pořadí, ve kterém jsou tahy v jednotlivých
+    uzlech prohledávání zkoušeny.
+
+    Jednotlivé heuristiky lze zapnout či vypnout parametry initoru. Tahy,
+    které heuristiky nerozliší, zůstávají v pořadí po řádcích.
+
+    Instance si během prohledávání udržuje stav (killer tahy a historii),
+    a je proto určena pro jediného hráče.
+    """
+
+    def __init__(self, hash_move: bool = True, killers: bool = True,
+                 history: bool = True, static: bool = True):
+        """Initor, který přijímá informace, které z heuristik mají být
+        použity - tah z transpoziční tabulky (`hash_move`), killer tahy
+        (`killers`), historie (`history`) a statická priorita políček
+        (`static`)."""
+        self.__hash_move = hash_move
+        self.__killers_enabled = killers
+        self.__history_enabled = history
+        self.__static = static
+        self.__killers: list[list[tuple[int, int]]] = []
+        self.__history: dict[tuple[int, int], int] = {}
+
+    @property
+    def hash_move(self) -> bool:
+        """Vrací, zda-li je jako první zkoušen tah z transpoziční tabulky."""
+        return self.__hash_move
+
+    @property
+    def killers(self) -> bool:
+        """Vrací, zda-li jsou upřednostňovány killer tahy."""
+        return self.__killers_enabled
+
+    @property
+    def history(self) -> bool:
+        """Vrací, zda-li jsou tahy řazeny dle historie prořezání."""
+        return self.__history_enabled
+
+    @property
+    def static(self) -> bool:
+        """Vrací, zda-li jsou tahy řazeny dle statické priority políček."""
+        return self.__static
+
+    def new_search(self):
+        """Připraví instanci na prohledávání nového tahu. Killer tahy jsou
+        zapomenuty a skóre historie sníženo na polovinu, aby převážila
+        zkušenost z aktuálního prohledávání."""
+        self.__killers = []
+        self.__history = {move: score // 2
+                          for move, score in self.__history.items()
+                          if score > 1}
+
+    def order(self, moves: list[tuple[int, int]], base: int, ply: int,
+              hash_move: tuple[int, int] = None) -> list[tuple[int, int]]:
+        """Seřadí dodané tahy (souřadnice volných políček) uzlu v dané
+        vzdálenosti od kořene. Parametr `hash_move` je nejlepší tah uzlu
+        uložený v transpoziční tabulce (je-li znám)."""
+        hash_move = hash_move if self.__hash_move else None
+        killers = (self.__killers[ply] if self.__killers_enabled and
+                   ply < len(self.__killers) else [])
+        history = self.__history if self.__history_enabled else {}
+        priority = static_priority(base) if self.__static else None
+
+        def key(move: tuple[int, int]):
+            x, y = move
+            return (move != hash_move,
+                    killers.index(move) if move in killers else KILLER_SLOTS,
+                    -history.get(move, 0),
+                    priority[y * base + x] if priority else 0)
+
+        return sorted(moves, key=key)
+
+    def record_cutoff(self, move: tuple[int, int], ply: int, depth: int):
+        """Zaznamená tah, který v dané vzdálenosti od kořene způsobil
+        prořezání podstromu o dané hloubce."""
+        if self.__killers_enabled:
+            while len(self.__killers) <= ply:
+                self.__killers.append([])
+            killers = self.__killers[ply]
+            if move in killers:
+                killers.remove(move)
+            killers.insert(0, move)
+            del killers[KILLER_SLOTS:]
+        if self.__history_enabled:
+            self.__history[move] = self.__history.get(move, 0) + depth * depth
@@ -0,0 +1,224 @@
+"""Tento modul obsahuje prostředky pro paralelní prohledávání stromu hry
+minimaxovými hráči.
+
+Prohledávání je paralelizováno v kořeni - podstromy jednotlivých tahů
+v kořeni jsou prohledávány v samostatných procesech (`ProcessPoolExecutor`).
+Nejstarší tah je prohledán jako první samostatně (tzv. *young brothers wait*),
+aby ostatní tahy mohly být prohledávány již s jeho hodnotou coby dolní mezí.
+
+Přesné hodnoty tahů v kořeni si procesy sdílejí ve sdílené paměti. Podstrom
+každého tahu je prohledáván s dolní mezí rovnou nejvyšší dosud známé hodnotě
+tahů, které mu v pořadí předcházejí - tedy s mezí nejvýše rovnou té, se
+kterou by jej prohledalo sériové alfa-beta prořezávání. Zvolený tah je proto
+totožný s tahem sériového prohledávání.
+"""
+
+import math
+import os
+import pickle
+import sys
+import uuid
+import weakref
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import Array
+
+# Maximální počet tahů v kořeni (pro největší hrací plochu 9×9)
+MAX_ROOT_MOVES = 81
+
+# Maximální počet hráčů, které si pracovní proces uchovává
+MAX_CACHED_PLAYERS = 2
+
+# Hráči, jejichž podstromy pracovní proces prohledává, dle jejich tokenů.
+# Hráči (a jejich transpoziční tabulky) jsou zachováni mezi tahy; nejdéle
+# nepoužitý hráč je zapomenut, je-li jich více než `MAX_CACHED_PLAYERS`
+_players = OrderedDict()
+
+# Sdílená paměť s přesnými hodnotami tahů v kořeni - pro každý tah dvojice
+# (číslo prohledávání, hodnota)
+_bounds = None
+
+
+def _initialize(bounds: Array):
+    """Inicializace pracovního procesu - převezme sdílenou paměť mezí."""
+    global _bounds
+    _bounds = bounds
+
+
+def _warm_up() -> int:
+    """Prázdná úloha, kterou je pracovní proces spuštěn předem."""
+    return os.getpid()
+
+
+def _search_move(token: str, payload: bytes, board: list[list[str]],
+                 move: tuple[int, int], index: int, generation: int,
+                 alpha_beta: bool) -> tuple[float, int]:
+    """Prohledá v pracovním procesu podstrom tahu v kořeni s daným pořadím.
+    Vrací hodnotu tahu a počet prohledaných uzlů."""
+    player = _players.get(token)
+    if player is None:
+        player = pickle.loads(payload)
+        _players[token] = player
+        if len(_players) > MAX_CACHED_PLAYERS:
+            _players.popitem(last=False)
+    else:
+        _players.move_to_end(token)
+
+    alpha = float("-inf")
+    if alpha_beta:
+        with _bounds.get_lock():
+            for previous in range(index):
+                if _bounds[2 * previous] == generation:
+                    alpha = max(alpha, _bounds[2 * previous + 1])
+
+    value, nodes = player.search_move(board, *move, alpha)
+
+    # Hodnota vyšší než dolní mez je přesná a může být sdílena
+    if alpha_beta and value > alpha:
+        with _bounds.get_lock():
+            _bounds[2 * index] = generation
+            _bounds[2 * index + 1] = value
+    return value, nodes
+
+
+class ParallelSearch:
+    """Instance této třídy reprezentují skupinu pracovních procesů, ve
+    kterých minimaxoví hráči paralelně prohledávají podstromy tahů v kořeni.
+
+    Procesy jsou spuštěny již při vytvoření instance a zachovány po celou
+    dobu její existence; mohou je sdílet i různí hráči. Každý proces si
+    udržuje vlastní kopii hráče (včetně jeho transpoziční tabulky) mezi
+    jednotlivými tahy.
+    """
+
+    def __init__(self, workers: int = None):
+        """Initor, který přijímá počet pracovních procesů. Není-li zadán,
+        odpovídá počtu procesorů."""
+        workers = workers or os.cpu_count()
+        if workers <= 0:
+            raise ValueError(
+                f"Počet pracovních procesů musí být kladný: {workers}")
+
+        self.__workers = workers
+        self.__bounds = Array("d", 2 * MAX_ROOT_MOVES)
+        self.__generation = 0
+        self.__tokens = weakref.WeakKeyDictionary()
+        self.__pool = ProcessPoolExecutor(
+            workers, initializer=_initialize, initargs=(self.__bounds,))
+        for future in [self.__pool.submit(_warm_up) for _ in range(workers)]:
+            future.result()
+
+    @property
+    def workers(self) -> int:
+        """Počet pracovních procesů."""
+        return self.__workers
+
+    def search(self, player, board: list[list[str]],
+               moves: list[tuple[int, int]],
+               alpha_beta: bool) -> tuple[str, int]:
+        """Paralelně prohledá podstromy dodaných tahů v kořeni (v pořadí,
+        ve kterém by je zkoušelo sériové prohledávání) a vrátí nejlepší tah
+        a celkový počet prohledaných uzlů.
+
+        Hráč musí poskytovat metodu `search_move(board, x, y, alpha)`, která
+        vrací hodnotu tahu (přesnou, je-li vyšší než `alpha`, jinak horní
+        mez) a počet prohledaných uzlů."""
+        if self.__pool is None:
+            raise RuntimeError("Paralelní prohledávání již bylo ukončeno")
+
+        self.__generation += 1
+        token, payload = self.__payload(player)
+
+        def submit(index: int):
+            return self.__pool.submit(
+                _search_move, token, payload, board, moves[index], index,
+                self.__generation, alpha_beta)
+
+        # Nejstarší tah je prohledán jako první, ostatní pak souběžně
+        first = submit(0).result()
+        results = [first] + [future.result() for future in
+                             [submit(index) for index in
+                              range(1, len(moves))]]
+
+        best_move, best_score, nodes = "", -math.inf, 1
+        for (x, y), (value, move_nodes) in zip(moves, results):
+            if value > best_score:
+                best_score, best_move = value, f"{x} {y}"
+            nodes += move_nodes
+        return best_move, nodes
+
+    def forget(self, player):
+        """Zapomene kopie hráče v pracovních procesech. Volá se při změně
+        nastavení hráče (např. přidání evaluátoru); při dalším prohledávání
+        procesy obdrží jeho aktuální kopii. Zastaralé kopie procesy samy
+        vytlačí (uchovávají nejvýše `MAX_CACHED_PLAYERS` hráčů)."""
+        self.__tokens.pop(player, None)
+
+    def close(self):
+        """Ukončí pracovní procesy."""
+        if self.__pool is not None:
+            self.__pool.shutdown()
+            self.__pool = None
+
+    def __payload(self, player) -> tuple[str, bytes]:
+        """Vrací token hráče a jeho serializovanou kopii pro pracovní
+        procesy. Kopie je vytvořena jen jednou, procesy si ji dle tokenu
+        uchovávají."""
+        if player not in self.__tokens:
+            self.__tokens[player] = uuid.uuid4().hex, pickle.dumps(player)
+        return self.__tokens[player]
+
+    def __getstate__(self) -> dict:
+        """Instance je předávána pracovním procesům jako součást hráče; ty
+        však paralelně neprohledávají, předán je proto jen počet procesů."""
+        return {"workers": self.__workers}
+
+    def __setstate__(self, state: dict):
+        """Obnoví zástupnou instanci bez pracovních procesů."""
+        self.__workers = state["workers"]
+        self.__bounds = None
+        self.__generation = 0
+        self.__tokens = weakref.WeakKeyDictionary()
+        self.__pool = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+
+if __name__ == "__main__":
+    # Měření zrychlení paralelního prohledávání oproti sériovému na plochách
+    # 4×4 a 5×5; volitelným argumentem je počet pracovních procesů
+    from time import perf_counter
+
+    from src.game.board import default_board
+    from src.players.rational_npc_player import (
+        LimitedMinmaxPlayer, OffensiveProgressInRow,
+        OffensiveProgressInColumn, DefensiveProgressInRow,
+        DefensiveProgressInColumn, WinInRow, WinInColumn)
+    from src.players.rational_npc_player import parallel
+
+    with parallel.ParallelSearch(
+            int(sys.argv[1]) if len(sys.argv) > 1 else None) as search:
+        for base, depth in ((4, 5), (5, 4)):
+            board = default_board(base)
+            board.mark(1, 1, "X")
+            snapshot = board.board_snapshot
+            times, moves = [], []
+            for pool in (None, search):
+                player = LimitedMinmaxPlayer(
+                    "benchmark", "O", [
+                        WinInRow(), WinInColumn(),
+                        OffensiveProgressInRow(weight=3),
+                        OffensiveProgressInColumn(weight=3),
+                        DefensiveProgressInRow(),
+                        DefensiveProgressInColumn()],
+                    max_depth=depth, alpha_beta=True, parallel=pool)
+                start = perf_counter()
+                moves.append(player.move(snapshot, snapshot.valid_moves))
+                times.append(perf_counter() - start)
+            print(f"{base}×{base}, hloubka {depth}: sériově {times[0]:.2f} s, "
+                  f"paralelně {times[1]:.2f} s ({search.workers} procesů), "
+                  f"zrychlení {times[0] / times[1]:.2f}×, tahy {moves}")
@@ -0,0 +1,149 @@
+"""Tento modul obsahuje prostředky pro přemýšlení v čase soupeře (tzv.
+*pondering*).
+
+Zatímco soupeř volí svůj tah, hráč v pozadí (ve vlákně) předem vybírá své
+odpovědi na soupeřovy možné tahy - nejprve na ty nejpravděpodobnější.
+Jakmile soupeř skutečně táhne, je-li odpověď na jeho tah již známa, hráč ji
+zahraje okamžitě; je-li právě hledána, hledání dokončí. Ostatní práce je
+zahozena.
+
+Přemýšlení se vyplácí především proti lidskému hráči - ten při čekání na
+vstup z konzole procesor nevyužívá.
+"""
+
+from threading import Event, Lock, Thread
+
+from src.game.board import BoardSnapshot, default_board
+from src.game.player import Player
+from src.players.rational_npc_player.move_ordering import static_priority
+
+
+class SearchAborted(Exception):
+    """Výjimka, kterou hráč přeruší prohledávání, bylo-li přemýšlení v čase
+    soupeře ukončeno."""
+
+
+class Ponderer:
+    """Instance této třídy reprezentují přemýšlení hráče v čase soupeře.
+
+    Přemýšlí se pomocí samostatné kopie hráče (aby nedošlo ke střetu se
+    stavem prohledávání hráče samotného). Kopie musí umožňovat přerušení
+    prohledávání událostí (metodou `abort_on(Event)`, viz výjimka
+    `SearchAborted`).
+
+    Hráč s přemýšlením (např. `MinmaxNPC` či `LimitedMinmaxPlayer`
+    s parametrem `pondering`) je po svém tahu vyzván metodou `ponder`;
+    na pozadí pak volí odpovědi na pravděpodobné tahy soupeře a při dalším
+    tahu je případně jen převezme. Přemýšlení nelze kombinovat s paralelním
+    prohledáváním - kopie hráče by soupeřila o tytéž pracovní procesy.
+    """
+
+    def __init__(self, player: Player):
+        """Initor, který přijímá kopii hráče, jež bude v čase soupeře
+        volit odpovědi."""
+        self.__player = player
+        self.__abort = Event()
+        self.__lock = Lock()
+        self.__thread = None
+        player.abort_on(self.__abort)
+
+        # Nalezené odpovědi dle otisku pozice po tahu soupeře, otisk pozice,
+        # pro kterou je odpověď právě hledána, a pozice, na kterou soupeř
+        # skutečně táhl
+        self.__answers: dict[int, str] = {}
+        self.__current = None
+        self.__target = None
+
+        # Počet tahů zahraných z předem nalezených odpovědí
+        self.__hits = 0
+
+    @property
+    def hits(self) -> int:
+        """Počet tahů, jejichž odpověď byla nalezena v čase soupeře."""
+        return self.__hits
+
+    @property
+    def is_pondering(self) -> bool:
+        """Vrací, zda-li přemýšlení právě probíhá."""
+        return self.__thread is not None and self.__thread.is_alive()
+
+    def start(self, board: BoardSnapshot):
+        """Zahájí přemýšlení v pozici, ve které je na tahu soupeř. Dříve
+        nalezené odpovědi jsou zahozeny."""
+        self.stop()
+        self.__answers = {}
+        self.__current = None
+        self.__target = None
+        self.__abort.clear()
+        self.__thread = Thread(target=self.__run, args=(board,), daemon=True)
+        self.__thread.start()
+
+    def finish(self, board: BoardSnapshot) -> str:
+        """Ukončí přemýšlení, neboť soupeř táhl do dodané pozice. Je-li
+        odpověď na tento tah známa (či právě hledána), vrací ji; jinak vrací
+        None."""
+        if self.__thread is None:
+            return None
+        with self.__lock:
+            self.__target = board.zobrist_hash
+            if self.__current != self.__target:
+                self.__abort.set()
+        self.__thread.join()
+        self.__thread = None
+
+        answer = self.__answers.get(board.zobrist_hash)
+        if answer is not None:
+            self.__hits += 1
+        return answer
+
+    def stop(self):
+        """Ukončí přemýšlení a zahodí rozpracovanou práci."""
+        if self.__thread is not None:
+            self.__abort.set()
+            self.__thread.join()
+            self.__thread = None
+
+    def __run(self, board: BoardSnapshot):
+        """Tělo vlákna - postupně volí odpovědi na možné tahy soupeře."""
+        position = default_board(board.board_base)
+        for field in board.played_fields:
+            position.mark(field.x, field.y, field.mark)
+
+        for reply in self.__replies(board):
+            after = position.copy
+            after.mark(*board.move_coords(reply),
+                       self.__player.opponent_mark)
+            if (after.has_line(self.__player.opponent_mark) or
+                    after.is_full):
+                continue
+
+            key = after.zobrist_hash
+            with self.__lock:
+                if self.__abort.is_set() or self.__target is not None:
+                    return
+                self.__current = key
+
+            snapshot = after.board_snapshot
+            try:
+                answer = self.__player.move(snapshot, snapshot.valid_moves)
+            except SearchAborted:
+                return
+            self.__answers[key] = answer
+
+            with self.__lock:
+                self.__current = None
+                if self.__target is not None:
+                    return
+
+    @staticmethod
+    def __replies(board: BoardSnapshot) -> list[str]:
+        """Seřadí možné tahy soupeře od nejpravděpodobnějšího - dle
+        statické priority políček (viz `move_ordering.static_priority`)."""
+        base = board.board_base
+        priority = static_priority(base)
+
+        def key(move: str) -> int:
+            x, y = board.move_coords(move)
+            return priority[y * base + x]
+
+        return sorted(board.valid_moves, key=key)
@@ -0,0 +1,235 @@
+"""Tento modul obsahuje transpoziční tabulku uloženou ve sdílené paměti.
+
+Tabulku mohou současně číst i zapisovat hráči běžící v různých procesech
+(např. v pracovních procesech `ParallelSearch`), kteří si tak předávají
+výsledky prohledaných pozic. Tabulka nepoužívá zámky - každý záznam má pevnou
+délku tří 64bitových slov (kontrolní slovo, hodnota a metadata), přičemž
+kontrolní slovo je otisk pozice sloučený operací XOR s ostatními slovy.
+Záznam, jehož zápis byl přerušen zápisem jiného procesu, tak při čtení
+neodpovídá žádnému otisku a je považován za chybějící.
+"""
+
+import os
+import struct
+from multiprocessing import resource_tracker
+from multiprocessing.shared_memory import SharedMemory
+
+from src.players.rational_npc_player.transposition import TranspositionEntry
+
+# Formát záznamu - kontrolní slovo, bity hodnoty a metadata
+ENTRY = struct.Struct("<QQQ")
+
+# Převod hodnoty na její bity a zpět
+DOUBLE = struct.Struct("<d")
+WORD = struct.Struct("<Q")
+
+# Příznak obsazeného záznamu v metadatech
+OCCUPIED = 1 << 31
+
+
+def pack_meta(depth: int, bound: int, best_move: str) -> int:
+    """Zakóduje hloubku, typ hodnoty a nejlepší tah do slova metadat.
+    Hloubka zabírá 16 bitů, typ hodnoty 2 bity, příznak tahu 1 bit a
+    souřadnice tahu po 4 bitech."""
+    meta = OCCUPIED | depth & 0xFFFF | bound << 16
+    if best_move:
+        x, y = map(int, best_move.split())
+        meta |= 1 << 18 | x << 19 | y << 23
+    return meta
+
+
+def unpack_meta(meta: int) -> tuple[int, int, str]:
+    """Dekóduje slovo metadat na hloubku, typ hodnoty a nejlepší tah."""
+    best_move = (f"{meta >> 19 & 0xF} {meta >> 23 & 0xF}"
+                 if meta >> 18 & 1 else "")
+    return meta & 0xFFFF, meta >> 16 & 0x3, best_move
+
+
+def tracker_identity() -> tuple[int, int]:
+    """Vrací identitu procesu `resource_tracker`, se kterým aktuální proces
+    komunikuje (zařízení a i-uzel jeho roury), případně None, neběží-li.
+
+    Potomci procesu (při spuštění metodou `fork`, `spawn` i `forkserver`)
+    zdědí rouru rodiče, a sdílejí tak týž proces `resource_tracker`."""
+    fd = resource_tracker._resource_tracker._fd
+    if fd is None:
+        return None
+    try:
+        info = os.fstat(fd)
+    except OSError:
+        return None
+    return info.st_dev, info.st_ino
+
+
+class SharedTranspositionTable:
+    """Instance této třídy reprezentují transpoziční tabulku s omezenou
+    velikostí uloženou ve sdílené paměti (`multiprocessing.shared_memory`).
+
+    Tabulka má stejné rozhraní i stejnou strategii nahrazování (koše
+    o přihrádce *depth-preferred* a *always-replace*) jako
+    `TranspositionTable` a lze ji hráčům dodat namísto ní. Při předání jinému
+    procesu (např. jako součást hráče) se instance připojí k téže sdílené
+    paměti.
+
+    Paměť vlastní proces, který tabulku vytvořil; ten ji metodou `close`
+    (či opuštěním bloku `with`) uvolní. Připojené instance se od paměti
+    pouze odpojují. Počítadla dotazů jsou vedena pro každý proces zvlášť.
+    """
+
+    # Velikost jednoho záznamu v bajtech
+    ENTRY_SIZE = ENTRY.size
+
+    def __init__(self, memory_mb: float = 16):
+        """Initor, který přijímá paměťový limit tabulky v megabajtech. Z něj
+        je odvozen počet košů tabulky."""
+        if memory_mb <= 0:
+            raise ValueError(
+                f"Paměťový limit tabulky musí být kladný: {memory_mb}")
+
+        bucket_count = max(
+            1, int(memory_mb * 2 ** 20) // (2 * self.ENTRY_SIZE))
+        self.__attach(SharedMemory(
+            create=True, size=2 * bucket_count * self.ENTRY_SIZE),
+            memory_mb, bucket_count, True)
+
+        # Proces `resource_tracker`, který paměť eviduje (a uvolní ji,
+        # skončí-li vlastník bez jejího uvolnění)
+        self.__tracker = tracker_identity()
+
+    def __attach(self, memory: SharedMemory, memory_mb: float,
+                 bucket_count: int, owner: bool):
+        """Nastaví instanci nad dodanou sdílenou pamětí."""
+        self.__memory = memory
+        self.__buffer = memory.buf
+        self.__memory_mb = memory_mb
+        self.__bucket_count = bucket_count
+        self.__owner = owner
+        self.__hits = 0
+        self.__misses = 0
+
+    @property
+    def name(self) -> str:
+        """Jméno sdílené paměti tabulky."""
+        return self.__memory.name
+
+    @property
+    def memory_mb(self) -> float:
+        """Paměťový limit tabulky v megabajtech."""
+        return self.__memory_mb
+
+    @property
+    def capacity(self) -> int:
+        """Maximální počet záznamů, které tabulka pojme."""
+        return 2 * self.__bucket_count
+
+    @property
+    def hits(self) -> int:
+        """Počet úspěšných dotazů do tabulky v aktuálním procesu."""
+        return self.__hits
+
+    @property
+    def misses(self) -> int:
+        """Počet neúspěšných dotazů do tabulky v aktuálním procesu."""
+        return self.__misses
+
+    @property
+    def hit_rate(self) -> float:
+        """Podíl úspěšných dotazů ze všech dotazů v aktuálním procesu."""
+        total = self.__hits + self.__misses
+        return self.__hits / total if total else 0.0
+
+    def __len__(self) -> int:
+        """Počet obsazených přihrádek tabulky."""
+        return sum(1 for slot in range(self.capacity)
+                   if self.__read(slot) is not None)
+
+    def probe(self, key: int) -> TranspositionEntry:
+        """Vyhledá záznam pozice s dodaným klíčem. Pokud záznam v tabulce
+        není (nebo byl poškozen souběžným zápisem), vrací None."""
+        index = 2 * (key % self.__bucket_count)
+        for slot in (index, index + 1):
+            entry = self.__read(slot)
+            if entry is not None and entry.key == key:
+                self.__hits += 1
+                return entry
+        self.__misses += 1
+        return None
+
+    def store(self, key: int, value: float, depth: int, bound: int,
+              best_move: str):
+        """Uloží výsledek prohledávání pozice s dodaným klíčem.
+
+        Záznam nahradí záznam v první přihrádce koše, jde-li o tutéž pozici
+        nebo byl-li prohledán alespoň do stejné hloubky. V opačném případě
+        je uložen do druhé přihrádky.
+        """
+        index = 2 * (key % self.__bucket_count)
+        preferred = self.__read(index)
+        if (preferred is None or preferred.key == key or
+                depth >= preferred.depth):
+            slot = index
+        else:
+            slot = index + 1
+
+        bits = WORD.unpack(DOUBLE.pack(value))[0]
+        meta = pack_meta(depth, bound, best_move)
+        ENTRY.pack_into(self.__buffer, slot * self.ENTRY_SIZE,
+                        key ^ bits ^ meta, bits, meta)
+
+    def clear(self):
+        """Vyprázdní tabulku (pro všechny procesy) a vynuluje počítadla
+        dotazů aktuálního procesu."""
+        self.__buffer[:] = bytes(len(self.__buffer))
+        self.__hits = 0
+        self.__misses = 0
+
+    def close(self):
+        """Odpojí instanci od sdílené paměti. Vlastní-li ji aktuální proces,
+        je paměť uvolněna."""
+        if self.__buffer is None:
+            return
+        self.__buffer.release()
+        self.__buffer = None
+        self.__memory.close()
+        if self.__owner:
+            self.__memory.unlink()
+
+    def __read(self, slot: int) -> TranspositionEntry:
+        """Přečte záznam přihrádky. Je-li přihrádka prázdná nebo záznam
+        poškozený, vrací None."""
+        check, bits, meta = ENTRY.unpack_from(
+            self.__buffer, slot * self.ENTRY_SIZE)
+        if not meta & OCCUPIED:
+            return None
+        key = check ^ bits ^ meta
+        depth, bound, best_move = unpack_meta(meta)
+        return TranspositionEntry(key, DOUBLE.unpack(WORD.pack(bits))[0],
+                                  depth, bound, best_move)
+
+    def __getstate__(self) -> dict:
+        """Jiným procesům je předáno jen jméno sdílené paměti."""
+        return {"name": self.name, "memory_mb": self.__memory_mb,
+                "bucket_count": self.__bucket_count,
+                "tracker": self.__tracker}
+
+    def __setstate__(self, state: dict):
+        """Připojí instanci k sdílené paměti tabulky jiného procesu.
+
+        Připojením je paměť zaevidována u procesu `resource_tracker`
+        aktuálního procesu. Jde-li o jiný proces než ten, který paměť
+        eviduje pro vlastníka, je evidence zrušena - jinak by paměť uvolnil
+        při ukončení aktuálního procesu. Sdílí-li aktuální proces
+        `resource_tracker` s vlastníkem, evidence zrušena být nesmí - šlo by
+        o evidenci vlastníka a paměť by po jeho havárii nebyla uvolněna."""
+        memory = SharedMemory(name=state["name"])
+        self.__tracker = state["tracker"]
+        if tracker_identity() != self.__tracker:
+            resource_tracker.unregister(memory._name, "shared_memory")
+        self.__attach(memory, state["memory_mb"], state["bucket_count"],
+                      False)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
@@ -0,0 +1,252 @@
+"""Tento modul obsahuje databázi vyřešených pozic.
+
+Hra piškvorky na ploše `3x3` má jen několik tisíc dosažitelných pozic. Je
+tedy možné všechny pozice vyřešit předem a výsledek uložit do souboru.
+Výběr tahu je pak pouhým vyhledáním v tabulce.
+
+Soubor databáze obsahuje hlavičku (viz `MAGIC` a `HEADER_SIZE`) a za ní
+pro každou pozici jeden bajt. Pozice je adresována svým pořadím
+(tzv. *rank*) v trojkové soustavě - políčko s indexem `y * base + x` je
+cifrou řádu `3 ** index`; prázdné políčko má cifru 0, políčko hráče na
+tahu cifru 1 a políčko soupeře cifru 2. Pozice je tedy vždy uložena
+z pohledu hráče na tahu a databáze nezávisí na tom, kdo hru začal.
+
+Bajt záznamu obsahuje v nejnižších dvou bitech výsledek hry při optimální
+hře obou stran (viz `WIN`, `DRAW` a `LOSS`) a ve zbylých bitech index
+políčka nejlepšího tahu. Nulový bajt značí pozici, která v databázi není
+(nedosažitelnou nebo již ukončenou).
+
+Databázi lze sestavit funkcí `build_database` nebo z příkazové řádky:
+
+    python -m src.players.rational_npc_player.solved_db 3 solved_3x3.db
+"""
+
+import mmap
+import sys
+from concurrent.futures import ProcessPoolExecutor
+
+from src.game.bitboard import full_mask, line_masks
+
+# Identifikátor formátu souboru a velikost hlavičky v bajtech. Hlavička
+# obsahuje identifikátor a bazální velikost hrací plochy
+MAGIC = b"TTTS"
+HEADER_SIZE = 8
+
+# Kódy výsledků (z pohledu hráče na tahu)
+WIN = 1
+DRAW = 2
+LOSS = 3
+
+# Převod kódu výsledku na bodové ohodnocení a zpět
+OUTCOME_VALUES = {WIN: 1, DRAW: 0, LOSS: -1}
+VALUE_OUTCOMES = {1: WIN, 0: DRAW, -1: LOSS}
+
+# Největší podporovaná bazální velikost hrací plochy
+MAX_BASE = 4
+
+
+def table_size(base: int) -> int:
+    """Vrací počet záznamů databáze pro danou bazální velikost."""
+    return 3 ** (base * base)
+
+
+def position_rank(board: list[list[str]], mark: str) -> int:
+    """Vypočítá pořadí pozice z pohledu hráče s dodanou značkou, který je
+    na tahu."""
+    base = len(board)
+    rank = 0
+    power = 1
+    for y in range(base):
+        for x in range(base):
+            if board[y][x]:
+                rank += power if board[y][x] == mark else 2 * power
+            power *= 3
+    return rank
+
+
+def encode_entry(value: int, move_index: int) -> int:
+    """Sestaví bajt záznamu z ohodnocení pozice a indexu nejlepšího tahu."""
+    return move_index << 2 | VALUE_OUTCOMES[value]
+
+
+def decode_entry(entry: int, base: int) -> tuple[int, str]:
+    """Rozloží bajt záznamu na ohodnocení pozice a nejlepší tah ve formátu
+    `X Y`."""
+    move_index = entry >> 2
+    return (OUTCOME_VALUES[entry & 3],
+            f"{move_index % base} {move_index // base}")
+
+
+def check_base(base: int):
+    """Ověří, že je databázi možné sestavit pro danou bazální velikost."""
+    if not 2 <= base <= MAX_BASE:
+        raise ValueError(
+            f"Databázi lze sestavit jen pro plochy o bazální velikosti "
+            f"2 až {MAX_BASE}: {base}")
+
+
+class SolvedDatabase:
+    """Instance této třídy zpřístupňují databázi vyřešených pozic uloženou
+    v souboru.
+
+    Soubor je do paměti mapován (pomocí `mmap`), vyhledání pozice tak
+    nevyžaduje načtení celé databáze a operační systém může mapovanou
+    paměť sdílet mezi procesy.
+    """
+
+    def __init__(self, path: str):
+        """Initor, který přijímá cestu k souboru databáze."""
+        self.__path = path
+        with open(path, "rb") as file:
+            self.__data = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+
+        header = self.__data[:HEADER_SIZE]
+        self.__base = header[len(MAGIC)] if len(header) == HEADER_SIZE else 0
+        if (header[:len(MAGIC)] != MAGIC or
+                len(self.__data) != HEADER_SIZE + table_size(self.__base)):
+            self.__data.close()
+            raise SolvedDatabaseError(
+                "Soubor není platnou databází vyřešených pozic", path)
+
+    @property
+    def path(self) -> str:
+        """Cesta k souboru databáze."""
+        return self.__path
+
+    @property
+    def base(self) -> int:
+        """Bazální velikost hrací plochy, pro kterou je databáze sestavena.
+        """
+        return self.__base
+
+    def lookup(self, board: list[list[str]],
+               mark: str) -> tuple[int, str]:
+        """Vyhledá pozici, ve které je na tahu hráč s dodanou značkou.
+        Vrací ohodnocení pozice z pohledu tohoto hráče (1 za výhru, 0 za
+        remízu a -1 za prohru) a nejlepší tah. Není-li pozice v databázi
+        (nebo jde-li o plochu jiné velikosti), vrací None."""
+        if len(board) != self.__base:
+            return None
+        entry = self.__data[HEADER_SIZE + position_rank(board, mark)]
+        if not entry:
+            return None
+        return decode_entry(entry, self.__base)
+
+    def __reduce__(self):
+        """Při předání jinému procesu je soubor databáze namapován znovu."""
+        return SolvedDatabase, (self.__path,)
+
+    def close(self):
+        """Uvolní mapování souboru databáze."""
+        self.__data.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+
+class SolvedDatabaseError(Exception):
+    """Výjimka reprezentující chybu při práci s databází vyřešených pozic.
+    Udržuje cestu k souboru, v jehož kontextu k chybě došlo."""
+
+    def __init__(self, message: str, path: str):
+        """Initor, který přijímá kromě textové zprávy o chybě také cestu
+        k souboru databáze."""
+        Exception.__init__(self, message)
+        self._path = path
+
+    @property
+    def path(self) -> str:
+        """Cesta k souboru, v jehož kontextu došlo k chybě."""
+        return self._path
+
+
+class _Solver:
+    """Pomocná třída, která řeší pozice prohledáním stromu hry a výsledky
+    zapisuje do mapovaného souboru databáze. Již zapsané záznamy slouží
+    zároveň jako paměť vyřešených pozic."""
+
+    def __init__(self, table: mmap.mmap, base: int):
+        self.__table = table
+        self.__base = base
+        self.__lines = line_masks(base)
+        self.__full = full_mask(base)
+        self.__powers = tuple(3 ** index for index in range(base * base))
+
+    def solve(self, mover: int, opponent: int, rank: int,
+              opponent_rank: int) -> int:
+        """Vyřeší pozici zadanou bitovými maskami políček hráče na tahu
+        a jeho soupeře a pořadím pozice z pohledu obou hráčů. Vrací
+        ohodnocení pozice z pohledu hráče na tahu.
+
+        Tahy jsou zkoušeny po řádcích a nejlepším tahem je první
+        z optimálních - stejně jako u hráče `MinmaxNPC`."""
+        entry = self.__table[HEADER_SIZE + rank]
+        if entry:
+            return OUTCOME_VALUES[entry & 3]
+
+        occupied = mover | opponent
+        best_value = -2
+        best_index = 0
+        for index, power in enumerate(self.__powers):
+            bit = 1 << index
+            if occupied & bit:
+                continue
+            played = mover | bit
+            if any(played & line == line for line in self.__lines):
+                value = 1
+            elif occupied | bit == self.__full:
+                value = 0
+            else:
+                value = -self.solve(opponent, played,
+                                    opponent_rank + 2 * power, rank + power)
+            if value > best_value:
+                best_value, best_index = value, index
+
+        self.__table[HEADER_SIZE + rank] = encode_entry(best_value,
+                                                        best_index)
+        return best_value
+
+
+def _solve_subtree(path: str, base: int, first_move: int):
+    """Vyřeší všechny pozice dosažitelné po daném prvním tahu a zapíše je
+    do souboru databáze. Je spouštěna v samostatných procesech; souběžné
+    zápisy téže pozice zapisují tentýž bajt, a proto si nepřekáží."""
+    power = 3 ** first_move
+    with open(path, "r+b") as file, mmap.mmap(file.fileno(), 0) as table:
+        _Solver(table, base).solve(0, 1 << first_move, 2 * power, power)
+
+
+def build_database(path: str, base: int = 3, workers: int = 1):
+    """Vyřeší všechny pozice dosažitelné z prázdné hrací plochy dané
+    bazální velikosti a uloží je do souboru databáze.
+
+    Je-li `workers` větší než jedna, jsou podstromy jednotlivých prvních
+    tahů řešeny paralelně v daném počtu procesů (vhodné pro plochu `4x4`,
+    jejíž vyřešení v jediném procesu trvá velmi dlouho).
+    """
+    check_base(base)
+    with open(path, "wb") as file:
+        file.write(MAGIC + bytes([base]) +
+                   bytes(HEADER_SIZE - len(MAGIC) - 1))
+        file.truncate(HEADER_SIZE + table_size(base))
+
+    if workers > 1:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            for future in [executor.submit(_solve_subtree, path, base, index)
+                           for index in range(base * base)]:
+                future.result()
+
+    with open(path, "r+b") as file, mmap.mmap(file.fileno(), 0) as table:
+        _Solver(table, base).solve(0, 0, 0, 0)
+        table.flush()
+
+
+if __name__ == "__main__":
+    if len(sys.argv) not in (3, 4):
+        sys.exit(f"Použití: python -m {__spec__.name} "
+                 f"<bazální velikost> <soubor> [počet procesů]")
+    build_database(sys.argv[2], int(sys.argv[1]),
+                   int(sys.argv[3]) if len(sys.argv) == 4 else 1)
@@ -0,0 +1,152 @@
+"""Tento modul obsahuje prostředky pro práci se symetriemi hrací plochy.
+
+Čtvercová hrací plocha má osm symetrií (tzv. dihedrální grupa D4) - identitu,
+tři otočení a čtyři zrcadlení. Pozice, které lze jednu na druhou převést
+některou ze symetrií, mají stejnou hodnotu. Díky tomu je lze v rámci
+prohledávání považovat za jedinou (tzv. kanonickou) pozici a prohledat je
+jen jednou.
+
+Transformace jsou identifikovány indexem do ntice `TRANSFORMS`.
+"""
+
+from functools import lru_cache
+from typing import Callable
+
+from src.game.zobrist import zobrist_keys
+
+# Transformace souřadnic `(x, y)` na hrací ploše, kde `n` je nejvyšší
+# souřadnice (tedy bazální velikost zmenšená o jedna)
+TRANSFORMS: tuple[Callable[[int, int, int], tuple[int, int]]] = (
+    lambda x, y, n: (x, y),            # Identita
+    lambda x, y, n: (n - y, x),        # Otočení o 90°
+    lambda x, y, n: (n - x, n - y),    # Otočení o 180°
+    lambda x, y, n: (y, n - x),        # Otočení o 270°
+    lambda x, y, n: (n - x, y),        # Zrcadlení podle svislé osy
+    lambda x, y, n: (x, n - y),        # Zrcadlení podle vodorovné osy
+    lambda x, y, n: (y, x),            # Zrcadlení podle hlavní diagonály
+    lambda x, y, n: (n - y, n - x),    # Zrcadlení podle vedlejší diagonály
+)
+
+# Indexy inverzních transformací
+INVERSE_TRANSFORMS = (0, 3, 2, 1, 4, 5, 6, 7)
+
+
+@lru_cache(maxsize=None)
+def cell_permutations(base: int) -> tuple[tuple[int]]:
+    """Pro každou transformaci vrací permutaci indexů políček - na pozici
+    `i` je index (`y * base + x`), na který transformace přesune políčko
+    s indexem `i`."""
+    permutations = []
+    for transform in TRANSFORMS:
+        permutation = []
+        for index in range(base * base):
+            x, y = transform(index % base, index // base, base - 1)
+            permutation.append(y * base + x)
+        permutations.append(tuple(permutation))
+    return tuple(permutations)
+
+
+def transform_board(board: list[list[str]],
+                    transform: int) -> list[list[str]]:
+    """Vrací novou hrací plochu vzniklou aplikací dané transformace."""
+    base = len(board)
+    new_board = [[""] * base for _ in range(base)]
+    for y in range(base):
+        for x in range(base):
+            new_x, new_y = TRANSFORMS[transform](x, y, base - 1)
+            new_board[new_y][new_x] = board[y][x]
+    return new_board
+
+
+def transform_move(move: str, transform: int, base: int) -> str:
+    """Transformuje tah ve formátu `X Y` danou transformací. Prázdný tah
+    zůstává prázdný."""
+    if not move:
+        return move
+    x, y = map(int, move.split())
+    new_x, new_y = TRANSFORMS[transform](x, y, base - 1)
+    return f"{new_x} {new_y}"
+
+
+def canonicalize(
+        board: list[list[str]]) -> tuple[tuple[tuple[str]], int]:
+    """Převede hrací plochu na její kanonický tvar - nejmenší (lexikálně
+    porovnáno) ze všech osmi symetrických obrazů. Vrací kanonický tvar
+    coby neměnnou ntici ntic a index transformace, která na něj dodanou
+    hrací plochu převádí."""
+    best = None
+    best_transform = 0
+    for transform in range(len(TRANSFORMS)):
+        image = tuple(tuple(row) for row in transform_board(board, transform))
+        if best is None or image < best:
+            best = image
+            best_transform = transform
+    return best, best_transform
+
+
+def stabilizer(board: list[list[str]]) -> tuple[int]:
+    """Vrací indexy transformací, které dodanou hrací plochu nemění."""
+    return tuple([t for t in range(len(TRANSFORMS))
+                  if transform_board(board, t) == board])
+
+
+def unique_moves(board: list[list[str]]) -> list[tuple[int, int]]:
+    """Vrací souřadnice volných políček, jejichž označení vede k navzájem
+    nesymetrickým pozicím. Z každé skupiny symetricky ekvivalentních tahů
+    je ponechán ten první v pořadí po řádcích."""
+    base = len(board)
+    symmetries = stabilizer(board)
+    seen = set()
+    moves = []
+    for y in range(base):
+        for x in range(base):
+            if board[y][x] or (x, y) in seen:
+                continue
+            moves.append((x, y))
+            for transform in symmetries:
+                seen.add(TRANSFORMS[transform](x, y, base - 1))
+    return moves
+
+
+class PositionHasher:
+    """Instance této třídy udržují během prohledávání Zobristův otisk
+    aktuální pozice.
+
+    Je-li zapnuto využití symetrií, je udržováno osm otisků - po jednom
+    pro každý symetrický obraz pozice. Kanonickým otiskem je pak nejmenší
+    z nich, díky čemuž mají všechny symetricky ekvivalentní pozice tentýž
+    kanonický otisk.
+    """
+
+    def __init__(self, board: list[list[str]], symmetric: bool = False):
+        """Initor, který přijímá výchozí hrací plochu a informaci, zda-li
+        mají být využívány symetrie."""
+        self.__base = len(board)
+        self.__keys = zobrist_keys(self.__base)
+        permutations = cell_permutations(self.__base)
+        self.__permutations = permutations if symmetric else permutations[:1]
+        self.__hashes = [0] * len(self.__permutations)
+        for y in range(self.__base):
+            for x in range(self.__base):
+                if board[y][x]:
+                    self.toggle(x, y, board[y][x])
+
+    @property
+    def base(self) -> int:
+        """Bazální velikost hrací plochy."""
+        return self.__base
+
+    @property
+    def canonical(self) -> tuple[int, int]:
+        """Kanonický otisk aktuální pozice a index transformace, která
+        pozici převádí na její kanonický obraz."""
+        hashes = self.__hashes
+        best = min(hashes)
+        return best, hashes.index(best)
+
+    def toggle(self, x: int, y: int, mark: str):
+        """Promítne označení (či odznačení) políčka do otisků pozice."""
+        keys = self.__keys[mark]
+        index = y * self.__base + x
+        for transform, permutation in enumerate(self.__permutations):
+            self.__hashes[transform] ^= keys[permutation[index]]
@@ -0,0 +1,154 @@
+"""Tento modul obsahuje transpoziční tabulku pro racionální hráče.
+
+Transpoziční tabulka slouží k zapamatování výsledků prohledávání pozic,
+ke kterým lze během prohledávání dospět různými posloupnostmi tahů. Jednou
+vyhodnocenou pozici pak již není nutné prohledávat znovu.
+
+Pozice jsou v tabulce identifikovány Zobristovým otiskem (viz modul
+`src.game.zobrist`) doplněným o informaci, který z hráčů je na tahu.
+"""
+
+from typing import NamedTuple
+
+# Typy uložených hodnot - přesná hodnota, dolní a horní mez skutečné hodnoty
+EXACT = 0
+LOWER_BOUND = 1
+UPPER_BOUND = 2
+
+# Klíč, kterým je otisk pozice upraven, je-li na tahu maximalizující hráč
+MAXIMIZING_KEY = 0x9E3779B97F4A7C15
+
+
+class TranspositionEntry(NamedTuple):
+    """Záznam transpoziční tabulky."""
+
+    # Otisk pozice
+    key: int
+
+    # Hodnota pozice
+    value: float
+
+    # Hloubka, do které byla pozice prohledána
+    depth: int
+
+    # Typ hodnoty (`EXACT`, `LOWER_BOUND` nebo `UPPER_BOUND`)
+    bound: int
+
+    # Nejlepší nalezený tah ve formátu `X Y`
+    best_move: str
+
+
+def bound_type(value: float, alpha: float, beta: float) -> int:
+    """Určí typ hodnoty vrácené prohledáváním s oknem (`alpha`, `beta`).
+
+    Hodnota nejvýše `alpha` je horní mezí skutečné hodnoty, hodnota alespoň
+    `beta` její dolní mezí. Hodnota uvnitř okna je přesná.
+    """
+    if value <= alpha:
+        return UPPER_BOUND
+    elif value >= beta:
+        return LOWER_BOUND
+    return EXACT
+
+
+def position_key(zobrist_hash: int, is_maximizing: bool) -> int:
+    """Sestaví klíč pozice z jejího otisku a informace, zda-li je na tahu
+    maximalizující hráč."""
+    return zobrist_hash ^ MAXIMIZING_KEY if is_maximizing else zobrist_hash
+
+
+class TranspositionTable:
+    """Instance této třídy reprezentují transpoziční tabulku s omezenou
+    velikostí.
+
+    Tabulka je rozdělena do košů o dvou přihrádkách. První přihrádka
+    upřednostňuje záznamy prohledané do větší hloubky (tzv. *depth-preferred*),
+    druhá je přepsána vždy (tzv. *always-replace*). Díky tomu tabulka
+    uchovává cenné hluboké výsledky a zároveň se přizpůsobuje aktuálně
+    prohledávané části stromu.
+
+    Tabulka je určena pro jediného hráče - uložené hodnoty jsou vždy
+    z pohledu hráče, který tabulku používá.
+    """
+
+    # Odhad paměťové náročnosti jednoho záznamu v bajtech
+    ENTRY_SIZE = 200
+
+    def __init__(self, memory_mb: float = 16):
+        """Initor, který přijímá paměťový limit tabulky v megabajtech. Z něj
+        je odvozen počet košů tabulky."""
+        if memory_mb <= 0:
+            raise ValueError(
+                f"Paměťový limit tabulky musí být kladný: {memory_mb}")
+
+        self.__memory_mb = memory_mb
+        self.__bucket_count = max(
+            1, int(memory_mb * 2 ** 20) // (2 * self.ENTRY_SIZE))
+        self.__slots: list[TranspositionEntry] = [None] * (
+                2 * self.__bucket_count)
+        self.__hits = 0
+        self.__misses = 0
+
+    @property
+    def memory_mb(self) -> float:
+        """Paměťový limit tabulky v megabajtech."""
+        return self.__memory_mb
+
+    @property
+    def capacity(self) -> int:
+        """Maximální počet záznamů, které tabulka pojme."""
+        return len(self.__slots)
+
+    @property
+    def hits(self) -> int:
+        """Počet úspěšných dotazů do tabulky."""
+        return self.__hits
+
+    @property
+    def misses(self) -> int:
+        """Počet neúspěšných dotazů do tabulky."""
+        return self.__misses
+
+    @property
+    def hit_rate(self) -> float:
+        """Podíl úspěšných dotazů ze všech dotazů."""
+        total = self.__hits + self.__misses
+        return self.__hits / total if total else 0.0
+
+    def __len__(self) -> int:
+        """Počet obsazených přihrádek tabulky."""
+        return sum(1 for entry in self.__slots if entry is not None)
+
+    def probe(self, key: int) -> TranspositionEntry:
+        """Vyhledá záznam pozice s dodaným klíčem. Pokud záznam v tabulce
+        není, vrací None."""
+        index = 2 * (key % self.__bucket_count)
+        for entry in (self.__slots[index], self.__slots[index + 1]):
+            if entry is not None and entry.key == key:
+                self.__hits += 1
+                return entry
+        self.__misses += 1
+        return None
+
+    def store(self, key: int, value: float, depth: int, bound: int,
+              best_move: str):
+        """Uloží výsledek prohledávání pozice s dodaným klíčem.
+
+        Záznam nahradí záznam v první přihrádce koše, jde-li o tutéž pozici
+        nebo byl-li prohledán alespoň do stejné hloubky. V opačném případě
+        je uložen do druhé přihrádky.
+        """
+        entry = TranspositionEntry(key, value, depth, bound, best_move)
+        index = 2 * (key % self.__bucket_count)
+        preferred = self.__slots[index]
+        if (preferred is None or preferred.key == key or
+                depth >= preferred.depth):
+            self.__slots[index] = entry
+        else:
+            self.__slots[index + 1] = entry
+
+    def clear(self):
+        """Vyprázdní tabulku a vynuluje počítadla dotazů."""
+        self.__slots = [None] * len(self.__slots)
+        self.__hits = 0
+        self.__misses = 0
@@ -2,6 +2,8 @@
 
 
 from src.game.board import BoardSnapshot
+from src.game.zobrist import zobrist_keys
+from src.players.rational_npc_player.line_codes import board_lines, line_table
 
 
 def is_terminate(board: list[list[str]]) -> str:
@@ -9,18 +11,27 @@ def is_terminate(board: list[list[str]]) -> str:
     stromu (terminální uzel). Pokud ano, vrací značku výherce nebo textový
     řetězec `draw`. V opačném případě vrací prázdný řetězec.
     """
-    return (check_horizontals(board) or check_verticals(board) or
-            check_diagonals(board) or check_draw(board) or "")
+    table = line_table(len(board))
+    codes, winners = table.codes, table.winners
+    for line in board_lines(board):
+        winner = winners[codes[line]]
+        if winner:
+            return winner
+    return check_draw(board)
 
 
 def check_horizontals(board: list[list[str]]) -> str:
     """Funkce odpovědná za kontrolu řádků. Pokud jsou v některém z řádků
     vyplněna všechna políčka jedním hráčem, vrací funkce značku tohoto
     hráče, jinak vrací prázdný řetězec.
+
+    Vítěz linie je vyhledán v předpočítané tabulce (viz modul `line_codes`).
     """
+    table = line_table(len(board))
     for line in board:
-        if len(set(line)) == 1:
-            return line[0]
+        winner = table.winners[table.codes[tuple(line)]]
+        if winner:
+            return winner
     return ""
 
 
@@ -29,12 +40,11 @@ def check_verticals(board: list[list[str]]) -> str:
     sloupečků hrací plochy značkami jednoho hráče. Pokud ano, vrací jeho
     značku, jinak prázdný řetězec.
     """
-    for x in range(len(board[0])):
-        line = []
-        for y in range(len(board)):
-            line.append(board[y][x])
-        if len(set(line)) == 1:
-            return line[0]
+    table = line_table(len(board))
+    for line in zip(*board):
+        winner = table.winners[table.codes[line]]
+        if winner:
+            return winner
     return ""
 
 
@@ -43,17 +53,12 @@ def check_diagonals(board: list[list[str]]) -> str:
     jedna diagonála vyplněna stejnou značkou, vrací tuto značku. Jinak vrací
     prázdný řetězec.
     """
-    first_diagonal = []
-    second_diagonal = []
-    for i in range(len(board)):
-        first_diagonal.append(board[i][i])
-        second_diagonal.append(board[len(board) - i - 1][i])
-    if len(set(first_diagonal)) == 1:
-        return first_diagonal[0]
-    elif len(set(second_diagonal)) == 1:
-        return second_diagonal[0]
-    else:
-        return ""
+    length = len(board)
+    table = line_table(length)
+    first_diagonal = tuple([board[i][i] for i in range(length)])
+    second_diagonal = tuple([board[length - i - 1][i] for i in range(length)])
+    return (table.winners[table.codes[first_diagonal]] or
+            table.winners[table.codes[second_diagonal]])
 
 
 def check_draw(board: list[list[str]]) -> str:
@@ -62,10 +67,9 @@ def check_draw(board: list[list[str]]) -> str:
     vrací prázdný řetězec; pokud takové políčko neexistuje, vrací textový
     řetězec `draw`.
     """
-    for y in range(len(board)):
-        for x in range(len(board)):
-            if not board[y][x]:
-                return ""
+    for row in board:
+        if "" in row:
+            return ""
     return "draw"
 
 
@@ -81,3 +85,21 @@ def translate_board(board: BoardSnapshot) -> list[list[str]]:
             [board.find_closure(x, y).mark for x in range(base)]
         )
     return new_board
+
+
+def zobrist_hash(board: list[list[str]]) -> int:
+    """Funkce vypočítá 64bitový Zobristův otisk dvoudimenzionální hrací
+    plochy. Otisk odpovídá otisku `BoardSnapshot.zobrist_hash` pro totéž
+    rozložení.
+
+    Během prohledávání lze otisk udržovat inkrementálně pomocí operace XOR
+    s klíčem z funkce `src.game.zobrist.zobrist_key`.
+    """
+    base = len(board)
+    keys = zobrist_keys(base)
+    result = 0
+    for y in range(base):
+        for x in range(base):
+            if board[y][x]:
+                result ^= keys[board[y][x]][y * base + x]
+    return result
@@ -0,0 +1,101 @@
+"""Tento modul obsahuje generátor zátěže herního serveru.
+
+Generátor otevře daný počet spojení a na každém z nich odehrává jednu hru po
+druhé, dokud nejsou odehrány všechny hry. Klient volí tahy náhodně; měří se
+doba od odeslání tahu po přijetí odpovědi serveru (včetně tahu enginu).
+Výsledkem je propustnost serveru (hry za sekundu) a rozložení latencí tahů.
+"""
+
+import asyncio
+import random
+import sys
+from time import perf_counter
+from typing import NamedTuple
+
+from src.server.protocol import GameClient
+
+
+class LoadReport(NamedTuple):
+    """Shrnutí zátěžového testu."""
+
+    # Počet odehraných her
+    games: int
+
+    # Doba trvání testu v sekundách
+    seconds: float
+
+    # Seřazené latence všech tahů klientů v sekundách
+    latencies: tuple[float]
+
+    @property
+    def games_per_second(self) -> float:
+        """Průměrný počet her odehraných za sekundu."""
+        return self.games / self.seconds if self.seconds else 0.0
+
+    def latency_percentile(self, percentile: float) -> float:
+        """Vrací latenci tahu na daném percentilu (v sekundách)."""
+        if not self.latencies:
+            return 0.0
+        index = min(len(self.latencies) - 1,
+                    int(len(self.latencies) * percentile / 100))
+        return self.latencies[index]
+
+    @property
+    def p99_latency(self) -> float:
+        """Latence tahu na 99. percentilu (v sekundách)."""
+        return self.latency_percentile(99)
+
+    def __str__(self) -> str:
+        return (f"{self.games} her za {self.seconds:.2f} s "
+                f"({self.games_per_second:.0f} her/s), latence tahu: "
+                f"medián {self.latency_percentile(50) * 1000:.2f} ms, "
+                f"p99 {self.p99_latency * 1000:.2f} ms")
+
+
+async def generate_load(host: str, port: int, games: int,
+                        connections: int = 64, base: int = 3,
+                        engine: int = 0, seed: int = 0) -> LoadReport:
+    """Odehraje na serveru na dodané adrese daný počet her proti enginu
+    s daným pořadím a vrátí shrnutí. Hry jsou rozděleny mezi daný počet
+    souběžných spojení; klient začíná v každé sudé hře."""
+    if games <= 0:
+        raise ValueError(f"Počet her musí být kladný: {games}")
+
+    remaining = iter(range(games))
+    latencies: list[float] = []
+
+    async def connection(index: int):
+        rng = random.Random(f"{seed}-{index}")
+        client = await GameClient.connect(host, port)
+        try:
+            for game in remaining:
+                state = await client.new_game(base, engine, game % 2 == 0)
+                while not state.is_finished:
+                    x, y = rng.choice(state.empty_cells)
+                    start = perf_counter()
+                    state = await client.move(state.session, x, y)
+                    latencies.append(perf_counter() - start)
+        finally:
+            await client.close()
+
+    start = perf_counter()
+    await asyncio.gather(*(connection(index) for index in
+                           range(min(connections, games))))
+    return LoadReport(games, perf_counter() - start,
+                      tuple(sorted(latencies)))
+
+
+if __name__ == "__main__":
+    # Zátěžový test serveru spuštěného v témže procesu; volitelnými
+    # argumenty jsou počet her, počet spojení a pořadí enginu
+    from src.server.server import GameServer
+
+    async def main():
+        games = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+        connections = int(sys.argv[2]) if len(sys.argv) > 2 else 64
+        engine = int(sys.argv[3]) if len(sys.argv) > 3 else 0
+        async with GameServer() as server:
+            print(await generate_load("127.0.0.1", server.port, games,
+                                      connections, engine=engine))
+
+    asyncio.run(main())
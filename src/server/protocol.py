@@ -0,0 +1,189 @@
+"""Tento modul obsahuje binární protokol herního serveru.
+
+Každá zpráva začíná hlavičkou o třech bajtech - typem zprávy a délkou jejího
+obsahu (v síťovém pořadí bajtů). Obsah zpráv je tvořen pevnými strukturami:
+
+    - `NEW_GAME` (klient): bazální velikost plochy, pořadí enginu a příznak,
+      zda-li začíná klient
+    - `MOVE` (klient): číslo relace a souřadnice tahu klienta
+    - `STATE` (server): číslo relace, stav hry, bazální velikost a hrací
+      plocha coby dvojice bitových masek (viz modul `bitboard`)
+    - `ERROR` (server): číslo relace a kód chyby
+
+Začínající hráč používá vždy značku `X`. Hrací plocha 3×3 je tak přenášena
+v deseti bajtech obsahu oproti textové podobě `BoardSnapshot.stringify`.
+"""
+
+import asyncio
+import struct
+from typing import NamedTuple
+
+from src.game.bitboard import cell_bit, full_mask
+
+# Hlavička zprávy - typ a délka obsahu
+HEADER = struct.Struct("!BH")
+
+# Typy zpráv
+NEW_GAME = 0x01
+MOVE = 0x02
+STATE = 0x81
+ERROR = 0x82
+
+# Obsahy zpráv (bez bitových masek hrací plochy)
+NEW_GAME_BODY = struct.Struct("!BBB")
+MOVE_BODY = struct.Struct("!IBB")
+STATE_BODY = struct.Struct("!IBB")
+ERROR_BODY = struct.Struct("!IB")
+
+# Stavy hry
+PLAYING = 0
+X_WON = 1
+O_WON = 2
+DRAW = 3
+
+# Kódy chyb
+UNKNOWN_SESSION = 1
+INVALID_MOVE = 2
+BAD_REQUEST = 3
+NOT_YOUR_TURN = 4
+ENGINE_ERROR = 5
+
+
+class ProtocolError(Exception):
+    """Výjimka reprezentující chybu protokolu - poškozenou zprávu, či chybu
+    ohlášenou protistranou. Udržuje kód chyby (viz kódy chyb modulu)."""
+
+    def __init__(self, message: str, code: int):
+        """Initor, který přijímá kromě textové zprávy o chybě také její kód.
+        """
+        Exception.__init__(self, message)
+        self._code = code
+
+    @property
+    def code(self) -> int:
+        """Kód chyby."""
+        return self._code
+
+
+class BoardState(NamedTuple):
+    """Stav hry relace, jak jej server zasílá klientovi."""
+
+    # Číslo relace
+    session: int
+
+    # Stav hry (`PLAYING`, `X_WON`, `O_WON`, nebo `DRAW`)
+    status: int
+
+    # Bazální velikost hrací plochy
+    base: int
+
+    # Bitové masky políček označených značkami `X` a `O`
+    x_bits: int
+    o_bits: int
+
+    @property
+    def is_finished(self) -> bool:
+        """Vrací, zda-li hra skončila."""
+        return self.status != PLAYING
+
+    @property
+    def empty_cells(self) -> tuple[tuple[int, int]]:
+        """Vrací ntici souřadnic všech neoznačených políček."""
+        occupied = self.x_bits | self.o_bits
+        return tuple((x, y) for y in range(self.base)
+                     for x in range(self.base)
+                     if not occupied & cell_bit(x, y, self.base))
+
+
+def mask_size(base: int) -> int:
+    """Počet bajtů bitové masky hrací plochy o dané bazální velikosti."""
+    return (base * base + 7) // 8
+
+
+def encode(message_type: int, body: bytes) -> bytes:
+    """Sestaví zprávu daného typu s dodaným obsahem."""
+    return HEADER.pack(message_type, len(body)) + body
+
+
+def encode_state(state: BoardState) -> bytes:
+    """Sestaví zprávu `STATE` s dodaným stavem hry."""
+    size = mask_size(state.base)
+    return encode(STATE, STATE_BODY.pack(state.session, state.status,
+                                         state.base) +
+                  state.x_bits.to_bytes(size, "little") +
+                  state.o_bits.to_bytes(size, "little"))
+
+
+def decode_state(body: bytes) -> BoardState:
+    """Dekóduje obsah zprávy `STATE`."""
+    session, status, base = STATE_BODY.unpack_from(body)
+    size = mask_size(base)
+    offset = STATE_BODY.size
+    if len(body) != offset + 2 * size:
+        raise ProtocolError("Poškozená zpráva se stavem hry", BAD_REQUEST)
+
+    x_bits = int.from_bytes(body[offset:offset + size], "little")
+    o_bits = int.from_bytes(body[offset + size:], "little")
+    if (x_bits | o_bits) & ~full_mask(base):
+        raise ProtocolError("Poškozená zpráva se stavem hry", BAD_REQUEST)
+    return BoardState(session, status, base, x_bits, o_bits)
+
+
+async def read_message(reader: asyncio.StreamReader) -> tuple[int, bytes]:
+    """Přečte ze streamu jednu zprávu a vrátí její typ a obsah."""
+    message_type, length = HEADER.unpack(
+        await reader.readexactly(HEADER.size))
+    return message_type, await reader.readexactly(length)
+
+
+class GameClient:
+    """Instance této třídy reprezentují klienta herního serveru nad jedním
+    spojením.
+
+    Klient čeká na odpověď každého požadavku, než odešle další - na jednom
+    spojení tak v každém okamžiku probíhá nejvýše jeden požadavek.
+    """
+
+    def __init__(self, reader: asyncio.StreamReader,
+                 writer: asyncio.StreamWriter):
+        """Initor, který přijímá otevřené spojení se serverem."""
+        self.__reader = reader
+        self.__writer = writer
+
+    @classmethod
+    async def connect(cls, host: str, port: int) -> "GameClient":
+        """Připojí se k serveru na dodané adrese."""
+        return cls(*await asyncio.open_connection(host, port))
+
+    async def new_game(self, base: int = 3, engine: int = 0,
+                       client_first: bool = True) -> BoardState:
+        """Založí novou relaci proti enginu s daným pořadím (viz
+        `GameServer.engines`) a vrátí počáteční stav hry."""
+        return await self.__request(encode(NEW_GAME, NEW_GAME_BODY.pack(
+            base, engine, client_first)))
+
+    async def move(self, session: int, x: int, y: int) -> BoardState:
+        """Zahraje v relaci tah a vrátí stav hry po odpovědi enginu."""
+        return await self.__request(
+            encode(MOVE, MOVE_BODY.pack(session, x, y)))
+
+    async def close(self):
+        """Uzavře spojení."""
+        self.__writer.close()
+        await self.__writer.wait_closed()
+
+    async def __request(self, message: bytes) -> BoardState:
+        """Odešle požadavek a vrátí stav hry z odpovědi serveru. Ohlásí-li
+        server chybu, je vyhozena výjimka `ProtocolError`."""
+        self.__writer.write(message)
+        await self.__writer.drain()
+
+        message_type, body = await read_message(self.__reader)
+        if message_type == STATE:
+            return decode_state(body)
+        elif message_type == ERROR:
+            session, code = ERROR_BODY.unpack(body)
+            raise ProtocolError(
+                f"Server ohlásil chybu {code} (relace {session})", code)
+        raise ProtocolError(
+            f"Neznámý typ zprávy: {message_type}", BAD_REQUEST)
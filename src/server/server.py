@@ -0,0 +1,383 @@
+"""Tento modul obsahuje herní server, který vzdáleným klientům zprostředkovává
+hry proti enginům (NPC hráčům).
+
+Server je postaven nad `asyncio` - jediná smyčka událostí obsluhuje všechna
+spojení, každé spojení může vést libovolný počet souběžných relací (her).
+Stav relace je udržován úsporně, jen jako dvojice bitových masek hrací plochy
+(viz modul `bitboard`). Tahy enginů jsou voleny ve sdílené skupině pracovních
+procesů (`ProcessPoolExecutor`); každý proces si udržuje vlastní instance
+enginů (včetně např. jejich transpozičních tabulek) mezi tahy.
+
+Komunikace probíhá binárním protokolem modulu `protocol`.
+"""
+
+import asyncio
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from functools import partial
+from typing import Callable
+
+from src.game.bitboard import cell_bit, full_mask, has_line
+from src.game.board import default_board
+from src.game.player import Player
+from src.players import MCTSPlayer, MinmaxNPC, RandomNPCPlayer
+from src.server.protocol import (
+    BAD_REQUEST, DRAW, ENGINE_ERROR, ERROR, ERROR_BODY, INVALID_MOVE, MOVE,
+    MOVE_BODY, NEW_GAME, NEW_GAME_BODY, NOT_YOUR_TURN, O_WON, PLAYING,
+    UNKNOWN_SESSION, X_WON, BoardState, encode, encode_state, read_message)
+
+# Továrna enginu - ze značky vytvoří nového hráče
+EngineFactory = Callable[[str], Player]
+
+# Výchozí enginy serveru; klient volí engine jeho pořadím
+DEFAULT_ENGINES: tuple[EngineFactory] = (
+    partial(RandomNPCPlayer, "Server"),
+    partial(MinmaxNPC, "Server", alpha_beta=True),
+    partial(MCTSPlayer, "Server", playouts=500),
+)
+
+# Počet pokusů, během kterých musí engine zadat platný tah
+MAX_ENGINE_ATTEMPTS = 10
+
+# Enginy, jejichž tahy pracovní proces volí, a jejich instance dle pořadí
+# enginu a značky
+_engines: tuple[EngineFactory] = ()
+_players: dict[tuple[int, str], Player] = {}
+
+
+def _initialize(engines: tuple[EngineFactory]):
+    """Inicializace pracovního procesu - převezme továrny enginů."""
+    global _engines
+    _engines = engines
+
+
+def _engine_move(engine: int, mark: str, base: int, x_bits: int,
+                 o_bits: int) -> tuple[int, int]:
+    """Zvolí v pracovním procesu tah enginu s daným pořadím v pozici dané
+    bitovými maskami. Vrací souřadnice tahu, případně None, nezadá-li engine
+    platný tah ani na `MAX_ENGINE_ATTEMPTS` pokusů."""
+    player = _players.get((engine, mark))
+    if player is None:
+        player = _engines[engine](mark)
+        _players[engine, mark] = player
+
+    board = default_board(base)
+    for index in range(base * base):
+        if x_bits >> index & 1:
+            board.mark(index % base, index // base, "X")
+        elif o_bits >> index & 1:
+            board.mark(index % base, index // base, "O")
+
+    # Neplatný tah musí engine opakovat (stejně jako ve hře)
+    snapshot = board.board_snapshot
+    for _ in range(MAX_ENGINE_ATTEMPTS):
+        move = player.move(snapshot, snapshot.valid_moves).strip().upper()
+        if move in snapshot.valid_moves:
+            return snapshot.move_coords(move)
+    return None
+
+
+def board_status(base: int, x_bits: int, o_bits: int) -> int:
+    """Vrací stav hry (viz stavy modulu `protocol`) v pozici dané bitovými
+    maskami.
+
+    Relace serveru neudržují instanci `Game` ani `EndDetector` (s hrací
+    plochou a čítači linií) - konec hry je rozpoznán přímo nad bitovými
+    maskami týmiž funkcemi modulu `bitboard`, které používá `Board`."""
+    if has_line(x_bits, base):
+        return X_WON
+    elif has_line(o_bits, base):
+        return O_WON
+    elif x_bits | o_bits == full_mask(base):
+        return DRAW
+    return PLAYING
+
+
+class _Session:
+    """Úsporný stav jedné relace (hry) serveru."""
+
+    __slots__ = ("base", "engine", "client_mark", "x_bits", "o_bits",
+                 "busy")
+
+    def __init__(self, base: int, engine: int, client_mark: str):
+        """Initor, který přijímá bazální velikost hrací plochy, pořadí
+        enginu a značku klienta. Hrací plocha relace je prázdná."""
+        self.base = base
+        self.engine = engine
+        self.client_mark = client_mark
+        self.x_bits = 0
+        self.o_bits = 0
+
+        # Příznak, že relace čeká na tah enginu
+        self.busy = False
+
+    @property
+    def engine_mark(self) -> str:
+        """Značka, kterou označuje svá políčka engine."""
+        return "O" if self.client_mark == "X" else "X"
+
+    def mark(self, x: int, y: int, mark: str):
+        """Označí políčko na dodaných souřadnicích dodanou značkou."""
+        if mark == "X":
+            self.x_bits |= cell_bit(x, y, self.base)
+        else:
+            self.o_bits |= cell_bit(x, y, self.base)
+
+    def unmark(self, x: int, y: int):
+        """Zruší označení políčka na dodaných souřadnicích (např. vrací-li
+        se tah klienta)."""
+        bit = cell_bit(x, y, self.base)
+        self.x_bits &= ~bit
+        self.o_bits &= ~bit
+
+    def is_empty(self, x: int, y: int) -> bool:
+        """Vrací, zda-li dodané souřadnice leží na hrací ploše a políčko na
+        nich není označeno."""
+        return (x < self.base and y < self.base and
+                not (self.x_bits | self.o_bits) & cell_bit(x, y, self.base))
+
+    def state(self, session: int) -> BoardState:
+        """Vrací stav hry relace s dodaným číslem, jak jej server zasílá
+        klientovi."""
+        return BoardState(session, board_status(
+            self.base, self.x_bits, self.o_bits), self.base, self.x_bits,
+            self.o_bits)
+
+
+class GameServer:
+    """Instance této třídy reprezentují herní server naslouchající na
+    lokálním TCP soketu.
+
+    Server se spouští korutinou `start` (či vstupem do bloku `async with`)
+    a ukončuje korutinou `close`. Dokončené relace server zapomíná; relace
+    spojení jsou zapomenuty i při jeho uzavření.
+    """
+
+    def __init__(self, host: str = "127.0.0.1", port: int = 0,
+                 workers: int = None,
+                 engines: tuple[EngineFactory] = DEFAULT_ENGINES):
+        """Initor, který přijímá adresu, na které má server naslouchat
+        (port `0` zvolí volný port), počet pracovních procesů enginů (výchozí
+        je počet procesorů) a továrny enginů, které server nabízí. Továrny
+        musí být serializovatelné (modulem `pickle`)."""
+        workers = workers or os.cpu_count()
+        if workers <= 0:
+            raise ValueError(
+                f"Počet pracovních procesů musí být kladný: {workers}")
+        elif not engines:
+            raise ValueError("Server musí nabízet alespoň jeden engine")
+
+        self.__host = host
+        self.__port = port
+        self.__workers = workers
+        self.__engines = tuple(engines)
+        self.__pool = None
+        self.__server = None
+        self.__sessions: dict[int, _Session] = {}
+        self.__next_session = 1
+
+        # Obsluhy otevřených spojení a jejich streamy pro zápis
+        self.__connections: dict[asyncio.Task, asyncio.StreamWriter] = {}
+
+    @property
+    def engines(self) -> tuple[EngineFactory]:
+        """Továrny enginů, které server nabízí, v pořadí, kterým je klient
+        volí."""
+        return self.__engines
+
+    @property
+    def port(self) -> int:
+        """Port, na kterém server naslouchá."""
+        if self.__server is not None:
+            return self.__server.sockets[0].getsockname()[1]
+        return self.__port
+
+    @property
+    def session_count(self) -> int:
+        """Počet právě probíhajících relací."""
+        return len(self.__sessions)
+
+    async def start(self):
+        """Spustí pracovní procesy a začne naslouchat."""
+        self.__pool = self.__create_pool()
+        self.__server = await asyncio.start_server(
+            self.__handle, self.__host, self.__port)
+
+    async def serve_forever(self):
+        """Obsluhuje klienty, dokud není server ukončen."""
+        if self.__server is None:
+            await self.start()
+        await self.__server.serve_forever()
+
+    async def close(self):
+        """Přestane naslouchat, uzavře otevřená spojení a ukončí pracovní
+        procesy."""
+        if self.__server is not None:
+            self.__server.close()
+            for writer in self.__connections.values():
+                writer.close()
+            await asyncio.gather(*self.__connections,
+                                 return_exceptions=True)
+            await self.__server.wait_closed()
+            self.__server = None
+        if self.__pool is not None:
+            self.__pool.shutdown()
+            self.__pool = None
+
+    def __create_pool(self) -> ProcessPoolExecutor:
+        """Vytvoří skupinu pracovních procesů enginů."""
+        return ProcessPoolExecutor(
+            self.__workers, initializer=_initialize,
+            initargs=(self.__engines,))
+
+    async def __handle(self, reader: asyncio.StreamReader,
+                       writer: asyncio.StreamWriter):
+        """Obsluha jednoho spojení. Každý požadavek je vyřizován samostatnou
+        úlohou, relace spojení tak na enginy čekají souběžně."""
+        owned: set[int] = set()
+        tasks: set[asyncio.Task] = set()
+        handler = asyncio.current_task()
+        self.__connections[handler] = writer
+        try:
+            while True:
+                message_type, body = await read_message(reader)
+                task = asyncio.create_task(
+                    self.__respond(message_type, body, owned, writer))
+                tasks.add(task)
+                task.add_done_callback(tasks.discard)
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            for task in tasks:
+                task.cancel()
+            for session in owned:
+                self.__sessions.pop(session, None)
+            del self.__connections[handler]
+            writer.close()
+
+    async def __respond(self, message_type: int, body: bytes,
+                        owned: set[int], writer: asyncio.StreamWriter):
+        """Vyřídí požadavek a odešle odpověď."""
+        try:
+            if message_type == NEW_GAME and len(body) == NEW_GAME_BODY.size:
+                response = await self.__new_game(
+                    *NEW_GAME_BODY.unpack(body), owned)
+            elif message_type == MOVE and len(body) == MOVE_BODY.size:
+                response = await self.__move(*MOVE_BODY.unpack(body), owned)
+            else:
+                response = encode(ERROR, ERROR_BODY.pack(0, BAD_REQUEST))
+        except Exception:
+            response = encode(ERROR, ERROR_BODY.pack(0, ENGINE_ERROR))
+        writer.write(response)
+        try:
+            await writer.drain()
+        except ConnectionError:
+            pass
+
+    async def __new_game(self, base: int, engine: int, client_first: int,
+                         owned: set[int]) -> bytes:
+        """Založí novou relaci; nezačíná-li klient, táhne nejprve engine."""
+        if not 1 <= base <= 9 or engine >= len(self.__engines):
+            return encode(ERROR, ERROR_BODY.pack(0, BAD_REQUEST))
+
+        session_id = self.__next_session
+        self.__next_session = self.__next_session % 0xFFFFFFFF + 1
+        session = _Session(base, engine, "X" if client_first else "O")
+        self.__sessions[session_id] = session
+        owned.add(session_id)
+
+        if not client_first:
+            try:
+                played = await self.__engine_turn(session)
+            except Exception:
+                played = False
+            if not played:
+                # Relace, ve které engine nedokázal zahájit hru, je zahozena
+                self.__forget(session_id, owned)
+                return encode(ERROR, ERROR_BODY.pack(session_id,
+                                                     ENGINE_ERROR))
+        return self.__reply(session_id, session, owned)
+
+    async def __move(self, session_id: int, x: int, y: int,
+                     owned: set[int]) -> bytes:
+        """Zahraje tah klienta a odpověď enginu."""
+        session = self.__sessions.get(session_id)
+        if session is None or session_id not in owned:
+            return encode(ERROR, ERROR_BODY.pack(session_id, UNKNOWN_SESSION))
+        elif session.busy:
+            return encode(ERROR, ERROR_BODY.pack(session_id, NOT_YOUR_TURN))
+        elif not session.is_empty(x, y):
+            return encode(ERROR, ERROR_BODY.pack(session_id, INVALID_MOVE))
+
+        session.mark(x, y, session.client_mark)
+        if board_status(session.base, session.x_bits,
+                        session.o_bits) == PLAYING:
+            try:
+                played = await self.__engine_turn(session)
+            except Exception:
+                # Tah klienta je vrácen - klient jej může zopakovat
+                session.unmark(x, y)
+                return encode(ERROR, ERROR_BODY.pack(session_id,
+                                                     ENGINE_ERROR))
+            if not played:
+                # Engine, který nezadává platné tahy, nemá smysl dál
+                # vyzývat - relace je ukončena
+                self.__forget(session_id, owned)
+                return encode(ERROR, ERROR_BODY.pack(session_id,
+                                                     ENGINE_ERROR))
+        return self.__reply(session_id, session, owned)
+
+    async def __engine_turn(self, session: _Session) -> bool:
+        """Nechá engine relace táhnout v pracovním procesu a vrátí, zda-li
+        engine zadal platný tah. Havaruje-li pracovní proces, je skupina
+        procesů vytvořena znovu a výjimka vyhozena dál."""
+        session.busy = True
+        pool = self.__pool
+        try:
+            move = await asyncio.get_running_loop().run_in_executor(
+                pool, _engine_move, session.engine,
+                session.engine_mark, session.base, session.x_bits,
+                session.o_bits)
+        except BrokenProcessPool:
+            # Skupinu obnoví jen první z požadavků, které havárii zjistily
+            if self.__pool is pool:
+                pool.shutdown(wait=False)
+                self.__pool = self.__create_pool()
+            raise
+        finally:
+            session.busy = False
+        if move is None:
+            return False
+        session.mark(*move, session.engine_mark)
+        return True
+
+    def __reply(self, session_id: int, session: _Session,
+                owned: set[int]) -> bytes:
+        """Sestaví odpověď se stavem hry; skončila-li hra, relaci zapomene.
+        """
+        state = session.state(session_id)
+        if state.is_finished:
+            self.__forget(session_id, owned)
+        return encode_state(state)
+
+    def __forget(self, session_id: int, owned: set[int]):
+        """Zapomene relaci s dodaným číslem."""
+        self.__sessions.pop(session_id, None)
+        owned.discard(session_id)
+
+    async def __aenter__(self):
+        await self.start()
+        return self
+
+    async def __aexit__(self, *args):
+        await self.close()
+
+
+if __name__ == "__main__":
+    # Spuštění serveru; volitelnými argumenty jsou port a počet pracovních
+    # procesů
+    port = int(sys.argv[1]) if len(sys.argv) > 1 else 9999
+    workers = int(sys.argv[2]) if len(sys.argv) > 2 else None
+    asyncio.run(GameServer(port=port, workers=workers).serve_forever())
@@ -4,4 +4,15 @@ from src.game.player import Player
 class DummyPlayer(Player):
 
     def move(self) -> str:
-        return "test_move"
\ No newline at end of file
+        return "test_move"
+
+
+class ScriptedPlayer(Player):
+    """Hráč, který hraje předem zadané tahy."""
+
+    def __init__(self, player_name: str, mark: str, moves):
+        super().__init__(player_name, mark)
+        self.moves = list(moves)
+
+    def move(self, board, valid_moves) -> str:
+        return self.moves.pop(0)
@@ -0,0 +1,98 @@
+import asyncio
+
+import pytest
+
+from src.game.async_game import AsyncGame
+from src.game.async_player import AsyncPlayer, SyncPlayerAdapter
+from src.game.board import default_board
+from src.game.game import Game, GameError
+from src.game.player import PlayerError
+from src.game.time_control import TimeControl
+from src.players import MinmaxNPC, RandomNPCPlayer
+from test.dummy_player import ScriptedPlayer
+
+
+def scripted_players():
+    return [ScriptedPlayer("A", "X", ["0 0", "9 9", "1 0", "2 0"]),
+            ScriptedPlayer("B", "O", ["0 1", "1 1"])]
+
+
+def test_async_player_validates_mark():
+    with pytest.raises(PlayerError):
+        SyncPlayerAdapter(ScriptedPlayer("A", "Q", []))
+
+
+def test_async_game_requires_two_players():
+    player = SyncPlayerAdapter(ScriptedPlayer("A", "X", []))
+    with pytest.raises(GameError):
+        AsyncGame([player])
+
+
+def test_async_game_rejects_time_controls():
+    players = [SyncPlayerAdapter(player) for player in scripted_players()]
+    with pytest.raises(GameError):
+        AsyncGame(players, time_controls=TimeControl(per_move=1))
+
+
+def test_async_player_shares_player_base():
+    player = SyncPlayerAdapter(ScriptedPlayer("A", "X", []))
+    assert player.opponent_mark == "O"
+    with pytest.raises(PlayerError):
+        SyncPlayerAdapter(ScriptedPlayer("", "X", []))
+
+
+def test_async_game_matches_sync_game():
+    expected = Game(scripted_players()).play()
+    game = AsyncGame([SyncPlayerAdapter(player, executor=False)
+                      for player in scripted_players()])
+
+    result = asyncio.run(game.play())
+    assert result.winner == expected.winner
+    assert result.reason == expected.reason
+    assert ([move[:2] for move in result.moves] ==
+            [move[:2] for move in expected.moves])
+    assert game.result is result
+    with pytest.raises(GameError):
+        asyncio.run(game.play())
+
+
+def test_native_async_player():
+    class Delayed(AsyncPlayer):
+        def __init__(self, name, mark, moves):
+            super().__init__(name, mark)
+            self.moves = list(moves)
+
+        async def move(self, board, valid_moves):
+            await asyncio.sleep(0)
+            return self.moves.pop(0)
+
+    game = AsyncGame([Delayed("A", "X", [" 0 0 ", "1 0", "2 0"]),
+                      Delayed("B", "O", ["0 1", "1 1"])])
+    result = asyncio.run(game.play())
+    assert result.winner == "A"
+    assert result.moves[0].move == "0 0"
+
+
+def test_thousand_concurrent_games():
+    async def play_all():
+        games = [AsyncGame([
+            SyncPlayerAdapter(RandomNPCPlayer("A", "X"), executor=False),
+            SyncPlayerAdapter(RandomNPCPlayer("B", "O"), executor=False)])
+            for _ in range(1000)]
+        return await asyncio.gather(*(game.play() for game in games))
+
+    results = asyncio.run(play_all())
+    assert len(results) == 1000
+    assert all(5 <= len(result.moves) <= 9 for result in results)
+
+
+def test_engine_in_executor():
+    async def play_all():
+        games = [AsyncGame([
+            SyncPlayerAdapter(MinmaxNPC("Minimax", "X", alpha_beta=True)),
+            SyncPlayerAdapter(MinmaxNPC("Minimax", "O", alpha_beta=True))],
+            default_board(3)) for _ in range(4)]
+        return await asyncio.gather(*(game.play() for game in games))
+
+    # Dokonalí hráči spolu vždy remizují
+    assert all(result.is_draw for result in asyncio.run(play_all()))
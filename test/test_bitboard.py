@@ -0,0 +1,32 @@
+import pytest
+
+from src.game.bitboard import (anti_diagonal_mask, cell_bit, column_mask,
+                               diagonal_mask, full_mask, has_line,
+                               line_masks, row_mask)
+
+
+def test_cell_bit_order():
+    assert cell_bit(0, 0, 3) == 1
+    assert cell_bit(2, 0, 3) == 1 << 2
+    assert cell_bit(0, 1, 3) == 1 << 3
+
+
+def test_full_mask():
+    assert full_mask(3) == 0b111111111
+
+
+def test_line_masks():
+    assert row_mask(3, 0) == 0b000000111
+    assert column_mask(3, 0) == 0b001001001
+    assert diagonal_mask(3) == 0b100010001
+    assert anti_diagonal_mask(3) == 0b001010100
+    assert len(line_masks(4)) == 2 * 4 + 2
+
+
+@pytest.mark.parametrize("base", [2, 3, 4])
+def test_has_line(base):
+    for mask in line_masks(base):
+        assert has_line(mask, base)
+
+        # Bez nejnižšího bitu již linie spojena není
+        assert not has_line(mask & (mask - 1), base)
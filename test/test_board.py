@@ -1,7 +1,7 @@
 import pytest
 
 from src.game.board import Board, BoardError
-from src.game.field import Field
+from src.game.field import Field, FieldError
 
 
 def fields():
@@ -79,3 +79,83 @@ def test_multiple_fields_with_same_coords(board):
 
 
 
+def test_field_is_view_of_board(board):
+    field = board.field(2, 1)
+    field.mark = "O"
+
+    assert board.mark_at(2, 1) == "O"
+    assert board.mark_mask("O") == 1 << (1 * 3 + 2)
+
+
+def test_board_mark_is_visible_in_fields(board):
+    board.mark(0, 2, "X")
+    assert board.field(0, 2).mark == "X"
+
+
+def test_copy_is_independent(board):
+    board.mark(1, 1, "X")
+    copy = board.copy
+
+    copy.mark(0, 0, "O")
+
+    assert copy.field(1, 1).mark == "X"
+    assert not board.field(0, 0).is_marked
+
+
+def test_board_takes_over_field_marks():
+    marked = fields()
+    marked[4].mark = "O"
+    board = Board(marked)
+
+    assert board.mark_at(1, 1) == "O"
+    assert len(board.marked_fields) == 1
+
+
+def test_board_does_not_steal_bound_fields(board):
+    board.mark(1, 1, "X")
+    other = Board(board.fields)
+
+    assert other.mark_at(1, 1) == "X"
+    assert all(field.is_bound for field in board.fields)
+
+    other.mark(0, 0, "O")
+    board.mark(2, 2, "O")
+
+    assert not board.field(0, 0).is_marked
+    assert not other.field(2, 2).is_marked
+    assert board.field(2, 2).mark == "O"
+
+
+def test_marked_field_cannot_be_cleared(board):
+    board.mark(0, 0, "X")
+
+    with pytest.raises(FieldError):
+        board.mark(0, 0, "")
+    with pytest.raises(FieldError):
+        board.field(0, 0).mark = ""
+    assert board.mark_at(0, 0) == "X"
+
+
+def test_bound_field_coords_cannot_change(board):
+    with pytest.raises(FieldError):
+        board.field(1, 1).x = 2
+
+
+def test_field_out_of_board():
+    with pytest.raises(BoardError):
+        Board([Field(x, y + 1) for y in range(3) for x in range(3)])
+
+
+def test_has_line(board):
+    for x in range(3):
+        board.mark(x, 1, "X")
+
+    assert board.has_line("X")
+    assert not board.has_line("O")
+
+
+def test_field_index_matches_coords(board):
+    for copy in (board, board.copy):
+        for y in range(3):
+            for x in range(3):
+                assert copy.field(x, y).xy == (x, y)
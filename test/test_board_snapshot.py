@@ -1,7 +1,7 @@
 
 import pytest
 
-from src.game.board import BoardSnapshot, default_board
+from src.game.board import BoardError, BoardSnapshot, default_board
 
 
 @pytest.fixture
@@ -46,3 +46,49 @@ def test_valid_moves_after_one_move(board, fields):
 
 
 
+def test_find_closure(board):
+    board.mark(2, 0, "O")
+    snapshot = BoardSnapshot(board)
+
+    assert snapshot.find_closure(2, 0).mark == "O"
+    assert snapshot.find_closure(0, 2).identifier == "0 2"
+    assert snapshot.find_closure(3, 0) is None
+
+
+def test_field_closures_are_row_major(board):
+    closures = BoardSnapshot(board).field_closures
+    assert [c.coords for c in closures] == [
+        (x, y) for y in range(3) for x in range(3)]
+
+
+def test_snapshot_is_not_changed_by_later_moves(board):
+    snapshot = BoardSnapshot(board)
+    board.mark(1, 1, "X")
+
+    assert len(snapshot.played_fields) == 0
+    assert board.field(1, 1).is_marked
+
+
+def test_snapshot_cannot_be_marked(board):
+    snapshot = BoardSnapshot(board)
+
+    with pytest.raises(BoardError):
+        snapshot.fields[0].mark = "X"
+
+    assert not board.field(*snapshot.fields[0].xy).is_marked
+
+
+def test_board_snapshot_is_reused_until_change(board):
+    snapshot = board.board_snapshot
+    assert board.board_snapshot is snapshot
+
+    board.mark(0, 0, "O")
+    assert board.board_snapshot is not snapshot
+
+
+def test_move_coords(board):
+    board.mark(0, 0, "O")
+    snapshot = board.board_snapshot
+
+    assert snapshot.move_coords("2 1") == (2, 1)
+    assert snapshot.move_coords("0 0") is None
@@ -0,0 +1,63 @@
+import random
+
+import pytest
+
+from src.game.board import default_board
+from src.game.end_recognition import (Column, EndDetector, LeftRightDiagonal,
+                                      NoMoreMoves, RightLeftDiagonal, Row)
+from src.game.game_result_exceptions import Draw, Win
+
+
+def recognizers(base):
+    result = []
+    for i in range(base):
+        result.append(Column(i))
+        result.append(Row(i))
+    result.append(LeftRightDiagonal())
+    result.append(RightLeftDiagonal())
+    result.append(NoMoreMoves())
+    return result
+
+
+def full_scan(board, all_recognizers):
+    for recognizer in all_recognizers:
+        try:
+            recognizer.is_end(board.board_snapshot)
+        except (Win, Draw) as end:
+            return type(end), recognizer.description
+    return None
+
+
+@pytest.mark.parametrize("base", [3, 4])
+def test_detector_matches_full_scan(base):
+    rnd = random.Random(base)
+    for _ in range(200):
+        board = default_board(base)
+        all_recognizers = recognizers(base)
+        detector = EndDetector(board, all_recognizers)
+        moves = [(x, y) for y in range(base) for x in range(base)]
+        rnd.shuffle(moves)
+
+        for turn, (x, y) in enumerate(moves):
+            mark = "XO"[turn % 2]
+            board.mark(x, y, mark)
+            expected = full_scan(board, all_recognizers)
+            try:
+                detector.record(x, y, mark)
+                assert expected is None
+            except (Win, Draw) as end:
+                assert expected == (type(end),
+                                    detector.recognized.description)
+                break
+
+
+def test_detector_takes_over_board_state():
+    board = default_board()
+    board.mark(0, 0, "X")
+    board.mark(1, 0, "X")
+    detector = EndDetector(board, recognizers(3))
+
+    board.mark(2, 0, "X")
+    with pytest.raises(Win):
+        detector.record(2, 0, "X")
+    assert detector.recognized.description == Row(0).description
@@ -0,0 +1,160 @@
+import io
+import os
+import signal
+import sys
+import time
+
+import pytest
+
+from src.game.board import default_board
+from src.game.game import Game
+from src.game.player import PlayerError
+from src.game.time_control import timed_move
+from src.players import RandomNPCPlayer
+from src.players.engine_player.engine import load_factory, serve
+from src.players.engine_player.engine_player import (EngineError, EnginePlayer,
+                                                     EnginePool,
+                                                     engine_command)
+from src.players.engine_player.engine_protocol import (decode_move,
+                                                       decode_position,
+                                                       encode_position)
+
+
+@pytest.fixture(scope="module")
+def minimax_pool():
+    with EnginePool(engine_command("src.players:MinmaxNPC", alpha_beta=True),
+                    size=2) as pool:
+        yield pool
+
+
+def test_position_round_trip():
+    board = default_board(3)
+    board.mark(1, 1, "X")
+    board.mark(0, 2, "O")
+    line = encode_position("X", board.board_snapshot)
+
+    assert line == "go X 3 ....X.O.."
+    mark, decoded = decode_position(line)
+    assert mark == "X"
+    assert decoded.board_snapshot == board.board_snapshot
+
+
+def test_decode_move_reports_errors():
+    assert decode_move("move 1 2\n") == "1 2"
+    with pytest.raises(ValueError):
+        decode_move("error ValueError('x')")
+    with pytest.raises(ValueError):
+        decode_move("hello")
+
+
+def test_serve_answers_requests():
+    requests = io.StringIO("go O 3 ....X....\ngo O 2 ..\nquit\n")
+    output = io.StringIO()
+    serve(load_factory("src.players:MinmaxNPC"), requests, output)
+
+    lines = output.getvalue().splitlines()
+    assert lines[0] == "ready"
+    assert lines[1].startswith("move ")
+    assert lines[2].startswith("error ")
+
+
+def test_engine_player_never_loses(minimax_pool):
+    for _ in range(3):
+        result = Game([RandomNPCPlayer("R", "X"),
+                       EnginePlayer("Engine", "O", minimax_pool)]).play()
+        assert result.winner != "R"
+
+
+def test_crashed_engine_is_restarted(minimax_pool):
+    for pid in minimax_pool.pids:
+        os.kill(pid, signal.SIGKILL)
+
+    board = default_board(3).board_snapshot
+    player = EnginePlayer("Engine", "X", minimax_pool)
+    assert player.move(board, board.valid_moves) in board.valid_moves
+    assert len(minimax_pool.pids) >= 1
+
+
+def test_timeout_kills_engine():
+    with EnginePool(engine_command("src.players:MinmaxNPC")) as pool:
+        board = default_board(4).board_snapshot
+        player = EnginePlayer("Pomalý", "X", pool)
+        assert timed_move(player, board, board.valid_moves, 0.3) is None
+        time.sleep(0.2)
+        assert pool.pids == ()
+
+
+def test_broken_engine_command():
+    with pytest.raises(EngineError):
+        EnginePool(engine_command("src.players:NoSuchPlayer"))
+
+
+def test_engine_errors_raise_player_error(minimax_pool):
+    player = EnginePlayer("Engine", "X", minimax_pool)
+
+    # Plocha bez volných políček - engine ohlásí chybu
+    board = default_board(1)
+    board.mark(0, 0, "O")
+    with pytest.raises(PlayerError):
+        player.move(board.board_snapshot, ())
+
+
+# Engine, který táhne vždy na políčko [0, 0]; existuje-li dodaný soubor,
+# ihned skončí
+FLAKY_ENGINE = """
+import os, sys
+if os.path.exists(sys.argv[1]):
+    sys.exit(1)
+print("ready", flush=True)
+for line in sys.stdin:
+    print("move 0 0", flush=True)
+"""
+
+
+def test_failed_respawn_keeps_pool_usable(tmp_path):
+    marker = tmp_path / "broken"
+    with EnginePool([sys.executable, "-c", FLAKY_ENGINE, str(marker)],
+                    start_timeout=5) as pool:
+        board = default_board(3).board_snapshot
+        player = EnginePlayer("Engine", "X", pool)
+
+        marker.touch()
+        os.kill(pool.pids[0], signal.SIGKILL)
+        for _ in range(2):
+            with pytest.raises(PlayerError):
+                player.move(board, board.valid_moves)
+
+        marker.unlink()
+        assert player.move(board, board.valid_moves) == "0 0"
+        assert len(pool.pids) == 1
+
+
+def test_silent_engine_times_out():
+    with pytest.raises(EngineError):
+        EnginePool([sys.executable, "-c", "import time; time.sleep(5)"],
+                   start_timeout=0.2)
+
+
+def test_memory_limit_is_passed_to_engine():
+    command = engine_command("src.players:MinmaxNPC", memory_mb=256)
+    assert command[-2:] == ["--memory-mb", "256"]
+    with EnginePool(command) as pool:
+        board = default_board(3).board_snapshot
+        player = EnginePlayer("Engine", "X", pool)
+        assert player.move(board, board.valid_moves) in board.valid_moves
+
+
+def test_engine_returned_after_close_is_killed():
+    pool = EnginePool([sys.executable, "-c", FLAKY_ENGINE, "/nonexistent"],
+                      size=2)
+    with pool.engine() as engine:
+        pool.close()
+        assert pool.is_closed
+        assert engine.is_alive
+        assert engine.request("go X 3 .........") == "move 0 0"
+    assert not engine.is_alive
+
+    with pytest.raises(EngineError):
+        with pool.engine():
+            pass
+    pool.close()
@@ -0,0 +1,103 @@
+import random
+
+import pytest
+
+from src.players.rational_npc_player import evaluators as module
+from src.players.rational_npc_player.evaluation import (
+    EvaluationEngine, IncrementalEvaluation)
+from src.players.rational_npc_player.evaluators import (Evaluator,
+                                                        OffensiveProgressInRow,
+                                                        WinInRow,
+                                                        line_statistics)
+
+BUILT_IN = [getattr(module, name) for name in dir(module)
+            if name.startswith(("WinIn", "OffensiveProgressIn",
+                                "DefensiveProgressIn"))]
+
+
+class MarkCounter(Evaluator):
+    def evaluate(self, board, player_mark, opponent_mark):
+        return sum(row.count(player_mark) for row in board) * self.weight
+
+
+class HalvedWinInRow(WinInRow):
+    def evaluate(self, board, player_mark, opponent_mark):
+        return super().evaluate(board, player_mark, opponent_mark) / 2
+
+
+def random_boards(count, seed=0):
+    rnd = random.Random(seed)
+    boards = []
+    for _ in range(count):
+        base = rnd.choice([3, 4, 5])
+        boards.append([[rnd.choice(["", "", "X", "O"]) for _ in range(base)]
+                       for _ in range(base)])
+    return boards
+
+
+def test_line_statistics():
+    board = [["X", "O", ""], ["X", "", ""], ["X", "O", "O"]]
+    lines = line_statistics(board, "X", "O")
+
+    assert lines.length == 3
+    assert lines.rows == ((1, 1), (1, 0), (1, 2))
+    assert lines.columns == ((3, 0), (0, 2), (0, 1))
+    assert lines.first_diagonal == (1, 1)
+    assert lines.second_diagonal == (1, 0)
+
+
+def test_only_built_in_evaluators_use_lines():
+    assert all(evaluator.supports_lines() for evaluator in BUILT_IN)
+    assert not MarkCounter.supports_lines()
+    assert not HalvedWinInRow.supports_lines()
+
+
+def test_engine_matches_separate_evaluation():
+    evaluators = [evaluator(weight=index % 3 + 0.5)
+                  for index, evaluator in enumerate(BUILT_IN)]
+    evaluators += [MarkCounter(2), HalvedWinInRow()]
+    engine = EvaluationEngine(evaluators, "O", "X")
+
+    assert engine.fused_count == len(BUILT_IN)
+    for board in random_boards(200):
+        assert engine.evaluate(board) == sum(
+            [evaluator.evaluate(board, "O", "X") for evaluator in evaluators])
+
+
+def test_engine_without_evaluators():
+    assert EvaluationEngine([], "X", "O").evaluate([[""]]) == 0
+    assert EvaluationEngine([OffensiveProgressInRow()], "X", "O").evaluate(
+        [["X", ""], ["", "O"]]) == 0.5
+
+
+def test_only_built_in_evaluators_are_incremental():
+    assert all(evaluator.supports_incremental() for evaluator in BUILT_IN)
+    assert not MarkCounter.supports_incremental()
+    assert not HalvedWinInRow.supports_incremental()
+
+
+def test_incremental_evaluation_follows_moves():
+    evaluators = [evaluator(weight=index % 3 + 0.5)
+                  for index, evaluator in enumerate(BUILT_IN)]
+    evaluators += [MarkCounter(2), HalvedWinInRow()]
+    engine = EvaluationEngine(evaluators, "X", "O")
+    rnd = random.Random(1)
+
+    for board in random_boards(30, seed=2):
+        evaluation = IncrementalEvaluation(evaluators, board, "X", "O")
+        assert evaluation.value == pytest.approx(engine.evaluate(board))
+
+        free = [(x, y) for y, row in enumerate(board)
+                for x, mark in enumerate(row) if not mark]
+        played = []
+        for x, y in rnd.sample(free, len(free) // 2):
+            mark = rnd.choice("XO")
+            board[y][x] = mark
+            evaluation.place(x, y, mark)
+            played.append((x, y, mark))
+            assert evaluation.value == pytest.approx(engine.evaluate(board))
+
+        for x, y, mark in reversed(played):
+            board[y][x] = ""
+            evaluation.remove(x, y, mark)
+        assert evaluation.value == pytest.approx(engine.evaluate(board))
@@ -0,0 +1,28 @@
+import pytest
+
+from src.players.rational_npc_player.evaluation_cache import EvaluationCache
+
+
+def test_probe_counts_hits_and_misses():
+    cache = EvaluationCache(4)
+    assert cache.probe(1) is None
+    cache.store(1, 0.0)
+    assert cache.probe(1) == 0.0
+    assert (cache.hits, cache.misses, cache.hit_rate) == (1, 1, 0.5)
+
+
+def test_least_recently_used_is_evicted():
+    cache = EvaluationCache(2)
+    cache.store(1, 1.0)
+    cache.store(2, 2.0)
+    cache.probe(1)
+    cache.store(3, 3.0)
+
+    assert len(cache) == 2
+    assert cache.probe(2) is None
+    assert cache.probe(1) == 1.0 and cache.probe(3) == 3.0
+
+
+def test_invalid_capacity():
+    with pytest.raises(ValueError):
+        EvaluationCache(0)
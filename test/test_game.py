@@ -1,7 +1,9 @@
 import pytest
 
 from src.game.game import Game, GameError
-from test.dummy_player import DummyPlayer
+from src.game.game_result_exceptions import GameOver
+from src.game.observer import GameObserver
+from test.dummy_player import DummyPlayer, ScriptedPlayer
 
 
 @pytest.fixture
@@ -47,3 +49,63 @@ def test_game_returns_players():
 def test_game_returns_player_names():
     game = Game([DummyPlayer("A", "X"), DummyPlayer("B", "O")])
     assert game.player_names == ("A", "B")
+
+
+class Recorder(GameObserver):
+    def __init__(self):
+        self.events = []
+
+    def on_turn(self, player, board):
+        self.events.append(("turn", player.mark))
+
+    def on_move(self, player, move, x, y):
+        self.events.append(("move", move))
+
+    def on_invalid_move(self, player, move):
+        self.events.append(("invalid", move))
+
+    def on_end(self, result):
+        self.events.append(("end", result.winner))
+
+
+def scripted_game(observers=()):
+    return Game([ScriptedPlayer("A", "X", ["0 0", "9 9", "1 0", "2 0"]),
+                 ScriptedPlayer("B", "O", ["0 1", "1 1"])],
+                observers=observers)
+
+
+def test_play_returns_result_without_output(capsys):
+    result = scripted_game().play()
+
+    assert result.winner == "A" and result.winner_mark == "X"
+    assert not result.is_draw
+    assert [move.move for move in result.moves] == [
+        "0 0", "0 1", "1 0", "1 1", "2 0"]
+    assert result.reason
+    assert capsys.readouterr().out == ""
+
+
+def test_observers_receive_events():
+    recorder = Recorder()
+    scripted_game([recorder]).play()
+
+    assert recorder.events[:4] == [("turn", "X"), ("move", "0 0"),
+                                   ("turn", "O"), ("move", "0 1")]
+    assert ("invalid", "9 9") in recorder.events
+    assert recorder.events[-1] == ("end", "A")
+
+
+def test_game_cannot_be_played_twice():
+    game = scripted_game()
+    game.play()
+    with pytest.raises(GameError):
+        game.play()
+
+
+def test_run_game_prints_and_raises(capsys):
+    with pytest.raises(GameOver) as over:
+        scripted_game().run_game()
+
+    assert over.value.winner == "A"
+    output = capsys.readouterr().out
+    assert "Na tahu je hráč: B" in output and "Neplatný tah" in output
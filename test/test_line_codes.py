@@ -0,0 +1,61 @@
+import random
+
+from src.players.rational_npc_player.evaluators import line_statistics
+from src.players.rational_npc_player.line_codes import (LineCodes, board_lines,
+                                                        line_code, line_codes,
+                                                        line_table)
+from src.players.rational_npc_player.utils import is_terminate
+
+
+def test_line_code():
+    assert line_code(("", "", "")) == 0
+    assert line_code(("X", "", "O")) == 1 + 2 * 9
+    assert line_codes([["X", ""], ["O", "X"]]) == [1, 2 + 3, 1 + 6, 0 + 3,
+                                                   1 + 3, 2 + 0]
+
+
+def test_line_table():
+    table = line_table(3)
+    code = table.codes[("X", "", "X")]
+
+    assert len(table.winners) == 27
+    assert table.winners[table.codes[("O", "O", "O")]] == "O"
+    assert table.winners[table.codes[("", "", "")]] == ""
+    assert table.counts["X"][code] == (2, 0)
+    assert table.counts["O"][code] == (0, 2)
+    assert table.progress["X"][code] == 4 / 3
+    assert table.progress["O"][table.codes[("X", "O", "")]] == 0
+
+
+def test_board_lines():
+    board = [["X", "O"], ["", "X"]]
+    assert board_lines(board) == [("X", "O"), ("", "X"), ("X", ""),
+                                  ("O", "X"), ("X", "X"), ("", "O")]
+
+
+def test_line_codes_follow_moves():
+    rnd = random.Random(0)
+    for base in (3, 4, 5):
+        for _ in range(20):
+            board = [[""] * base for _ in range(base)]
+            lines = LineCodes(board)
+            cells = [(x, y) for y in range(base) for x in range(base)]
+            rnd.shuffle(cells)
+            played = []
+            for x, y in cells:
+                mark = "XO"[len(played) % 2]
+                board[y][x] = mark
+                lines.place(x, y, mark)
+                played.append((x, y, mark))
+                assert lines.result == is_terminate(board)
+                assert lines.codes == tuple(line_codes(board))
+                assert lines.statistics("O") == line_statistics(board, "O",
+                                                                "X")
+                if lines.result:
+                    break
+
+            for x, y, mark in reversed(played):
+                board[y][x] = ""
+                lines.remove(x, y, mark)
+                assert lines.result == is_terminate(board)
+            assert lines.codes == tuple([0] * (2 * base + 2))
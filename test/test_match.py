@@ -0,0 +1,41 @@
+from functools import partial
+
+import pytest
+
+from src.game.match import play_match
+from src.players import MinmaxNPC, RandomNPCPlayer
+
+
+def test_match_counts_all_games():
+    progress = []
+    stats = play_match(partial(RandomNPCPlayer, "A"),
+                       partial(RandomNPCPlayer, "B"), 40, workers=2,
+                       chunk_size=5, on_progress=progress.append)
+
+    assert stats.is_finished and stats.played == 40
+    assert stats.first_wins + stats.second_wins + stats.draws == 40
+    assert len(progress) == 8
+    assert stats.average_move_time(0) > 0
+
+
+def test_match_is_reproducible():
+    def run(workers):
+        stats = play_match(partial(RandomNPCPlayer, "A"),
+                           partial(RandomNPCPlayer, "B"), 30,
+                           workers=workers, seed=7)
+        return stats.first_wins, stats.second_wins, stats.draws
+
+    assert run(1) == run(3)
+
+
+def test_perfect_player_never_loses():
+    stats = play_match(partial(MinmaxNPC, "Minmax", alpha_beta=True),
+                       partial(RandomNPCPlayer, "Random"), 10, workers=2)
+
+    assert stats.second_wins == 0
+
+
+def test_invalid_game_count():
+    with pytest.raises(ValueError):
+        play_match(partial(RandomNPCPlayer, "A"),
+                   partial(RandomNPCPlayer, "B"), 0)
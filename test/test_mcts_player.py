@@ -0,0 +1,66 @@
+import pytest
+
+from src.game.board import default_board
+from src.game.player import PlayerError
+from src.players import MCTSPlayer
+
+
+def play(board, player, move):
+    snapshot = board.board_snapshot
+    x, y = snapshot.move_coords(move)
+    board.mark(x, y, player)
+
+
+def test_takes_winning_move():
+    board = default_board(3)
+    for move, mark in (("0 0", "X"), ("0 1", "O"), ("1 0", "X"),
+                       ("1 1", "O")):
+        play(board, mark, move)
+    player = MCTSPlayer("mcts", "X", playouts=500, seed=0)
+    snapshot = board.board_snapshot
+
+    assert player.move(snapshot, snapshot.valid_moves) == "2 0"
+
+
+def test_blocks_opponent():
+    board = default_board(3)
+    for move, mark in (("0 0", "O"), ("1 1", "X"), ("1 0", "O")):
+        play(board, mark, move)
+    player = MCTSPlayer("mcts", "X", playouts=2000, seed=0)
+    snapshot = board.board_snapshot
+
+    assert player.move(snapshot, snapshot.valid_moves) == "2 0"
+
+
+def test_reuses_subtree_after_opponent_move():
+    board = default_board(3)
+    player = MCTSPlayer("mcts", "X", playouts=1000, seed=1)
+    snapshot = board.board_snapshot
+    play(board, "X", player.move(snapshot, snapshot.valid_moves))
+    play(board, "O", board.board_snapshot.valid_moves[0])
+
+    snapshot = board.board_snapshot
+    assert player.move(snapshot, snapshot.valid_moves) in snapshot.valid_moves
+    assert player.reused_nodes > 1
+
+
+def test_new_game_resets_tree():
+    player = MCTSPlayer("mcts", "X", playouts=200, seed=2)
+    snapshot = default_board(3).board_snapshot
+    player.move(snapshot, snapshot.valid_moves)
+    player.move(snapshot, snapshot.valid_moves)
+
+    assert player.reused_nodes == 0
+
+
+def test_time_limit_on_largest_board():
+    player = MCTSPlayer("mcts", "O", time_limit=0.05, seed=3)
+    snapshot = default_board(9).board_snapshot
+
+    assert player.move(snapshot, snapshot.valid_moves) in snapshot.valid_moves
+    assert player.last_playouts > 0
+
+
+def test_invalid_budget():
+    with pytest.raises(PlayerError):
+        MCTSPlayer("mcts", "X", playouts=0)
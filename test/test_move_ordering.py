@@ -0,0 +1,82 @@
+import pytest
+
+from src.game.board import default_board
+from src.players.rational_npc_player import MinmaxNPC, MoveOrdering
+from src.players.rational_npc_player.move_ordering import static_priority
+from test.test_rational_players import random_snapshots
+
+ALL_MOVES = [(x, y) for y in range(3) for x in range(3)]
+
+
+def test_static_priority_prefers_center_and_corners():
+    priority = static_priority(3)
+    assert priority[4] == 0
+    assert sorted(priority[index] for index in (0, 2, 6, 8)) == [1, 2, 3, 4]
+    assert MoveOrdering().order(ALL_MOVES, 3, 0)[:5] == [
+        (1, 1), (0, 0), (2, 0), (0, 2), (2, 2)]
+
+
+def test_hash_move_goes_first():
+    ordering = MoveOrdering()
+    assert ordering.order(ALL_MOVES, 3, 0, hash_move=(2, 1))[0] == (2, 1)
+    assert MoveOrdering(hash_move=False).order(
+        ALL_MOVES, 3, 0, hash_move=(2, 1))[0] == (1, 1)
+
+
+def test_killers_are_kept_per_ply():
+    ordering = MoveOrdering(history=False, static=False)
+    ordering.record_cutoff((2, 1), 1, 1)
+    ordering.record_cutoff((0, 1), 1, 1)
+    ordering.record_cutoff((1, 2), 1, 1)
+
+    assert ordering.order(ALL_MOVES, 3, 1)[:2] == [(1, 2), (0, 1)]
+    assert ordering.order(ALL_MOVES, 3, 0) == ALL_MOVES
+
+    ordering.new_search()
+    assert ordering.order(ALL_MOVES, 3, 1) == ALL_MOVES
+
+
+def test_history_prefers_deeper_cutoffs():
+    ordering = MoveOrdering(killers=False, static=False)
+    ordering.record_cutoff((2, 0), 3, 1)
+    ordering.record_cutoff((0, 2), 5, 3)
+
+    assert ordering.order(ALL_MOVES, 3, 0)[:2] == [(0, 2), (2, 0)]
+
+
+def test_disabled_ordering_keeps_row_major_order():
+    ordering = MoveOrdering(False, False, False, False)
+    ordering.record_cutoff((2, 2), 0, 4)
+    assert ordering.order(ALL_MOVES, 3, 0, hash_move=(1, 1)) == ALL_MOVES
+
+
+def move_value(snapshot, move, mark):
+    board = [[snapshot.find_closure(x, y).mark for x in range(3)]
+             for y in range(3)]
+    x, y = map(int, move.split())
+    board[y][x] = mark
+    opponent = MinmaxNPC("ref", "O" if mark == "X" else "X", alpha_beta=True)
+    return -opponent.minimax(board, True)[0]
+
+
+@pytest.mark.parametrize("snapshot", random_snapshots(3, 2, 5, seed=8))
+def test_ordering_keeps_move_value(snapshot):
+    ordered = MinmaxNPC("ordered", "X", alpha_beta=True,
+                        move_ordering=MoveOrdering())
+    reference = MinmaxNPC("ref", "X", alpha_beta=True)
+
+    move = ordered.move(snapshot, snapshot.valid_moves)
+    expected = reference.move(snapshot, snapshot.valid_moves)
+    assert move_value(snapshot, move, "X") == move_value(
+        snapshot, expected, "X")
+
+
+def test_ordering_reduces_nodes():
+    snapshot = default_board(3).board_snapshot
+    ordered = MinmaxNPC("ordered", "X", alpha_beta=True,
+                        move_ordering=MoveOrdering())
+    reference = MinmaxNPC("ref", "X", alpha_beta=True)
+
+    ordered.move(snapshot, snapshot.valid_moves)
+    reference.move(snapshot, snapshot.valid_moves)
+    assert ordered.nodes < reference.nodes / 2
@@ -0,0 +1,88 @@
+import gc
+import pickle
+import weakref
+
+import pytest
+
+from src.game.player import PlayerError
+from src.players.rational_npc_player import (LimitedMinmaxPlayer, MinmaxNPC,
+                                             ParallelSearch, WinInRow)
+from src.players.rational_npc_player import parallel as parallel_search
+from test.test_rational_players import evaluators, random_snapshots
+
+
+@pytest.fixture(scope="module")
+def pool():
+    with ParallelSearch(2) as search:
+        yield search
+
+
+@pytest.mark.parametrize("alpha_beta", [False, True])
+@pytest.mark.parametrize("snapshot", random_snapshots(3, 2, 3, seed=3))
+def test_minmax_parallel_returns_same_move(pool, snapshot, alpha_beta):
+    serial = MinmaxNPC("serial", "X", alpha_beta=alpha_beta)
+    parallel = MinmaxNPC("parallel", "X", alpha_beta=alpha_beta,
+                         parallel=pool)
+
+    assert (parallel.move(snapshot, snapshot.valid_moves) ==
+            serial.move(snapshot, snapshot.valid_moves))
+
+
+@pytest.mark.parametrize("alpha_beta", [False, True])
+@pytest.mark.parametrize("snapshot", random_snapshots(4, 3, 3, seed=5))
+def test_limited_parallel_returns_same_move(pool, snapshot, alpha_beta):
+    serial = LimitedMinmaxPlayer("serial", "O", evaluators(), max_depth=3,
+                                 alpha_beta=alpha_beta)
+    parallel = LimitedMinmaxPlayer("parallel", "O", evaluators(),
+                                   max_depth=3, alpha_beta=alpha_beta,
+                                   parallel=pool)
+
+    assert (parallel.move(snapshot, snapshot.valid_moves) ==
+            serial.move(snapshot, snapshot.valid_moves))
+    if not alpha_beta:
+        assert parallel.nodes == serial.nodes
+
+
+def test_new_evaluator_reaches_workers(pool):
+    snapshot = random_snapshots(4, 2, 1, seed=8)[0]
+    parallel = LimitedMinmaxPlayer("parallel", "X", max_depth=2,
+                                   alpha_beta=True, parallel=pool)
+    serial = LimitedMinmaxPlayer("serial", "X", max_depth=2, alpha_beta=True)
+    parallel.move(snapshot, snapshot.valid_moves)
+
+    for evaluator in evaluators():
+        parallel.add_evaluator(evaluator)
+        serial.add_evaluator(evaluator)
+    assert (parallel.move(snapshot, snapshot.valid_moves) ==
+            serial.move(snapshot, snapshot.valid_moves))
+
+
+def test_parallel_rejects_budgets(pool):
+    with pytest.raises(PlayerError):
+        LimitedMinmaxPlayer("parallel", "X", [WinInRow()], time_limit=1,
+                            parallel=pool)
+
+
+def test_worker_cache_is_bounded():
+    payload = pickle.dumps(MinmaxNPC("worker", "X"))
+    board = [["" for _ in range(3)] for _ in range(3)]
+    limit = parallel_search.MAX_CACHED_PLAYERS
+    parallel_search._players.clear()
+    for index in range(limit + 2):
+        parallel_search._search_move(f"token-{index}", payload, board,
+                                     (1, 1), 0, 1, False)
+
+    assert len(parallel_search._players) == limit
+    assert f"token-{limit + 1}" in parallel_search._players
+    parallel_search._players.clear()
+
+
+def test_search_does_not_keep_players_alive(pool):
+    player = MinmaxNPC("parallel", "X", alpha_beta=True, parallel=pool)
+    snapshot = random_snapshots(3, 4, 1, seed=1)[0]
+    player.move(snapshot, snapshot.valid_moves)
+
+    reference = weakref.ref(player)
+    del player
+    gc.collect()
+    assert reference() is None
@@ -0,0 +1,100 @@
+import time
+
+import pytest
+
+from src.game.board import default_board
+from src.game.game import Game
+from src.game.game_result_exceptions import GameOver
+from src.game.player import PlayerError
+from src.players.rational_npc_player import (LimitedMinmaxPlayer, MinmaxNPC,
+                                             ParallelSearch)
+from test.dummy_player import DummyPlayer, ScriptedPlayer
+from test.test_rational_players import evaluators
+
+
+def after_moves(base, moves):
+    board = default_board(base)
+    for (x, y), mark in moves:
+        board.mark(x, y, mark)
+    return board
+
+
+def wait_for(ponderer):
+    while ponderer.is_pondering:
+        time.sleep(0.01)
+
+
+def test_default_ponder_does_nothing():
+    player = DummyPlayer("dummy", "X")
+    player.ponder(default_board().board_snapshot)
+    player.stop_pondering()
+
+
+def test_pondered_answer_is_reused():
+    board = after_moves(3, [((1, 1), "X")])
+    player = MinmaxNPC("ponder", "X", alpha_beta=True, pondering=True)
+    reference = MinmaxNPC("ref", "X", alpha_beta=True)
+    player.ponder(board.board_snapshot)
+    wait_for(player.ponderer)
+
+    board.mark(0, 0, "O")
+    snapshot = board.board_snapshot
+    assert (player.move(snapshot, snapshot.valid_moves) ==
+            reference.move(snapshot, snapshot.valid_moves))
+    assert player.ponderer.hits == 1
+
+
+def test_unexpected_reply_is_searched():
+    board = after_moves(4, [((1, 1), "X"), ((2, 2), "O"), ((0, 1), "X")])
+    player = LimitedMinmaxPlayer("ponder", "X", evaluators(), max_depth=3,
+                                 alpha_beta=True, pondering=True)
+    reference = LimitedMinmaxPlayer("ref", "X", evaluators(), max_depth=3,
+                                    alpha_beta=True)
+    player.ponder(board.board_snapshot)
+
+    board.mark(3, 3, "O")
+    snapshot = board.board_snapshot
+    assert (player.move(snapshot, snapshot.valid_moves) ==
+            reference.move(snapshot, snapshot.valid_moves))
+    assert not player.ponderer.is_pondering
+
+
+def test_stop_pondering_aborts_search():
+    board = after_moves(5, [((2, 2), "X")])
+    player = LimitedMinmaxPlayer("ponder", "X", evaluators(), max_depth=9,
+                                 alpha_beta=True, pondering=True)
+    player.ponder(board.board_snapshot)
+    time.sleep(0.05)
+
+    start = time.perf_counter()
+    player.stop_pondering()
+    assert time.perf_counter() - start < 1
+    assert not player.ponderer.is_pondering
+
+
+def test_game_lets_players_ponder():
+    class Recorder(ScriptedPlayer):
+        def __init__(self, name, mark, moves):
+            super().__init__(name, mark, moves)
+            self.pondered = 0
+            self.stopped = 0
+
+        def ponder(self, board):
+            self.pondered += 1
+
+        def stop_pondering(self):
+            self.stopped += 1
+
+    first = Recorder("A", "X", ["0 0", "1 0", "2 0"])
+    second = Recorder("B", "O", ["0 1", "1 1"])
+    with pytest.raises(GameOver):
+        Game([first, second]).run_game()
+
+    assert (first.pondered, second.pondered) == (2, 2)
+    assert (first.stopped, second.stopped) == (1, 1)
+
+
+def test_pondering_rejects_parallel():
+    with ParallelSearch(1) as search:
+        with pytest.raises(PlayerError):
+            MinmaxNPC("ponder", "X", parallel=search, pondering=True)
@@ -0,0 +1,177 @@
+import random
+import time
+
+import pytest
+
+from src.game.board import default_board
+from src.players.rational_npc_player import (LimitedMinmaxPlayer, MinmaxNPC,
+                                             OffensiveProgressInRow,
+                                             OffensiveProgressInColumn,
+                                             DefensiveProgressInRow,
+                                             DefensiveProgressInColumn,
+                                             WinInRow, WinInColumn,
+                                             TranspositionTable, MoveOrdering,
+                                             EvaluationCache)
+
+
+def evaluators():
+    return [WinInRow(), WinInColumn(),
+            OffensiveProgressInRow(weight=3),
+            OffensiveProgressInColumn(weight=3),
+            DefensiveProgressInRow(), DefensiveProgressInColumn()]
+
+
+def random_snapshots(base, marks, count, seed=0):
+    rnd = random.Random(seed)
+    snapshots = []
+    while len(snapshots) < count:
+        board = default_board(base)
+        cells = [(x, y) for y in range(base) for x in range(base)]
+        for turn, (x, y) in enumerate(rnd.sample(cells, marks)):
+            board.mark(x, y, "XO"[turn % 2])
+        if not board.has_line("X") and not board.has_line("O"):
+            snapshots.append(board.board_snapshot)
+    return snapshots
+
+
+@pytest.mark.parametrize("snapshot", random_snapshots(3, 2, 10))
+def test_minmax_alpha_beta_returns_same_move(snapshot):
+    plain = MinmaxNPC("plain", "X")
+    pruned = MinmaxNPC("pruned", "X", alpha_beta=True)
+
+    assert (plain.move(snapshot, snapshot.valid_moves) ==
+            pruned.move(snapshot, snapshot.valid_moves))
+    assert pruned.nodes < plain.nodes
+
+
+@pytest.mark.parametrize("snapshot", random_snapshots(4, 3, 5))
+def test_limited_alpha_beta_returns_same_move(snapshot):
+    plain = LimitedMinmaxPlayer("plain", "X", evaluators(), max_depth=2)
+    pruned = LimitedMinmaxPlayer("pruned", "X", evaluators(), max_depth=2,
+                                 alpha_beta=True)
+
+    assert (plain.move(snapshot, snapshot.valid_moves) ==
+            pruned.move(snapshot, snapshot.valid_moves))
+    assert pruned.nodes <= plain.nodes
+
+
+@pytest.mark.parametrize("alpha_beta", [False, True])
+def test_transposition_table_keeps_move(alpha_beta):
+    table = TranspositionTable(memory_mb=0.01)
+    player = MinmaxNPC("tt", "O", alpha_beta=alpha_beta,
+                       transposition_table=table)
+
+    for snapshot in random_snapshots(3, 2, 10, seed=3):
+        reference = MinmaxNPC("ref", "O")
+        assert (player.move(snapshot, snapshot.valid_moves) ==
+                reference.move(snapshot, snapshot.valid_moves))
+
+    assert table.hits > 0
+
+
+@pytest.mark.parametrize("alpha_beta", [False, True])
+def test_symmetry_keeps_move(alpha_beta):
+    table = TranspositionTable(memory_mb=1)
+    player = MinmaxNPC("sym", "O", alpha_beta=alpha_beta,
+                       transposition_table=table, symmetry=True)
+
+    for snapshot in random_snapshots(3, 1, 5, seed=4):
+        reference = MinmaxNPC("ref", "O", alpha_beta=True)
+        assert (player.move(snapshot, snapshot.valid_moves) ==
+                reference.move(snapshot, snapshot.valid_moves))
+        assert player.nodes < reference.nodes
+
+
+def test_limited_symmetry_keeps_move():
+    for snapshot in random_snapshots(4, 3, 5, seed=5):
+        player = LimitedMinmaxPlayer(
+            "sym", "X", evaluators(), max_depth=2, alpha_beta=True,
+            transposition_table=TranspositionTable(1), symmetry=True)
+        reference = LimitedMinmaxPlayer("ref", "X", evaluators(),
+                                        max_depth=2, alpha_beta=True)
+        assert (player.move(snapshot, snapshot.valid_moves) ==
+                reference.move(snapshot, snapshot.valid_moves))
+
+
+@pytest.mark.parametrize("snapshot", random_snapshots(4, 3, 5, seed=7))
+def test_iterative_deepening_reaches_max_depth(snapshot):
+    player = LimitedMinmaxPlayer("id", "X", evaluators(), max_depth=2,
+                                 alpha_beta=True, node_limit=10 ** 6)
+    reference = LimitedMinmaxPlayer("ref", "X", evaluators(), max_depth=2,
+                                    alpha_beta=True)
+
+    assert (player.move(snapshot, snapshot.valid_moves) ==
+            reference.move(snapshot, snapshot.valid_moves))
+    assert player.completed_depth == 2
+
+
+def test_node_limit_bounds_search():
+    snapshot = default_board(5).board_snapshot
+    player = LimitedMinmaxPlayer("id", "X", evaluators(), max_depth=25,
+                                 alpha_beta=True, node_limit=2000)
+
+    assert player.move(snapshot, snapshot.valid_moves) in snapshot.valid_moves
+    assert 1 <= player.completed_depth < 25
+    assert player.nodes <= 2001
+
+
+def test_time_limit_bounds_search():
+    snapshot = default_board(5).board_snapshot
+    player = LimitedMinmaxPlayer("id", "X", evaluators(), max_depth=25,
+                                 alpha_beta=True, time_limit=0.05)
+
+    start = time.perf_counter()
+    assert player.move(snapshot, snapshot.valid_moves) in snapshot.valid_moves
+    assert time.perf_counter() - start < 1
+    assert player.completed_depth >= 1
+
+
+def test_limited_ordering_reduces_nodes():
+    board = default_board(4)
+    board.mark(1, 1, "X")
+    board.mark(2, 1, "O")
+    snapshot = board.board_snapshot
+    ordered = LimitedMinmaxPlayer("ordered", "X", evaluators(), max_depth=3,
+                                  alpha_beta=True,
+                                  move_ordering=MoveOrdering())
+    reference = LimitedMinmaxPlayer("ref", "X", evaluators(), max_depth=3,
+                                    alpha_beta=True)
+
+    assert ordered.move(snapshot, snapshot.valid_moves) in snapshot.valid_moves
+    reference.move(snapshot, snapshot.valid_moves)
+    assert ordered.nodes < reference.nodes
+
+
+@pytest.mark.parametrize("snapshot", random_snapshots(4, 3, 5, seed=9))
+def test_incremental_evaluation_keeps_move(snapshot):
+    player = LimitedMinmaxPlayer("inc", "O", evaluators(), max_depth=2,
+                                 alpha_beta=True, incremental=True)
+    reference = LimitedMinmaxPlayer("ref", "O", evaluators(), max_depth=2,
+                                    alpha_beta=True)
+
+    assert (player.move(snapshot, snapshot.valid_moves) ==
+            reference.move(snapshot, snapshot.valid_moves))
+
+
+@pytest.mark.parametrize("snapshot", random_snapshots(4, 3, 5, seed=4))
+def test_evaluation_cache_keeps_move(snapshot):
+    cache = EvaluationCache()
+    player = LimitedMinmaxPlayer("cached", "X", evaluators(), max_depth=3,
+                                 evaluation_cache=cache)
+    reference = LimitedMinmaxPlayer("ref", "X", evaluators(), max_depth=3)
+
+    assert (player.move(snapshot, snapshot.valid_moves) ==
+            reference.move(snapshot, snapshot.valid_moves))
+    assert cache.hits > 0
+
+
+def test_evaluation_cache_cleared_by_new_evaluator():
+    cache = EvaluationCache()
+    player = LimitedMinmaxPlayer("cached", "X", evaluators(), max_depth=2,
+                                 evaluation_cache=cache)
+    snapshot = default_board(3).board_snapshot
+    player.move(snapshot, snapshot.valid_moves)
+    assert len(cache) > 0
+
+    player.add_evaluator(WinInRow())
+    assert len(cache) == 0 and cache.hits == cache.misses == 0
@@ -0,0 +1,179 @@
+import asyncio
+import os
+from functools import partial
+
+import pytest
+
+from src.server.load_client import generate_load
+from src.players import RandomNPCPlayer
+from src.server.protocol import (BAD_REQUEST, DRAW, ENGINE_ERROR,
+                                 INVALID_MOVE, O_WON, PLAYING,
+                                 UNKNOWN_SESSION, X_WON, BoardState,
+                                 GameClient, ProtocolError, decode_state,
+                                 encode_state)
+from src.server.server import GameServer
+
+
+def with_server(test):
+    """Spustí korutinu testu proti serveru s jedním pracovním procesem."""
+    async def run():
+        async with GameServer(workers=1) as server:
+            client = await GameClient.connect("127.0.0.1", server.port)
+            try:
+                await test(server, client)
+            finally:
+                await client.close()
+    asyncio.run(run())
+
+
+def test_state_encoding_is_compact():
+    state = BoardState(7, PLAYING, 3, 0b000010001, 0b100000000)
+    message = encode_state(state)
+
+    assert len(message) == 13
+    assert decode_state(message[3:]) == state
+    assert state.empty_cells == ((1, 0), (2, 0), (0, 1), (2, 1),
+                                 (0, 2), (1, 2))
+
+
+def test_new_game_and_move():
+    async def test(server, client):
+        state = await client.new_game(3, 0, True)
+        assert state.status == PLAYING
+        assert state.x_bits == state.o_bits == 0
+
+        state = await client.move(state.session, 1, 1)
+        assert state.x_bits == 1 << 4
+        assert bin(state.o_bits).count("1") == 1
+        assert server.session_count == 1
+    with_server(test)
+
+
+def test_engine_starts_when_client_is_second():
+    async def test(server, client):
+        state = await client.new_game(4, 0, False)
+        assert state.base == 4
+        assert bin(state.x_bits).count("1") == 1 and state.o_bits == 0
+    with_server(test)
+
+
+def test_errors():
+    async def test(server, client):
+        state = await client.new_game(3, 0, True)
+        await client.move(state.session, 0, 0)
+
+        with pytest.raises(ProtocolError) as error:
+            await client.move(state.session, 0, 0)
+        assert error.value.code == INVALID_MOVE
+
+        with pytest.raises(ProtocolError) as error:
+            await client.move(state.session + 1, 1, 1)
+        assert error.value.code == UNKNOWN_SESSION
+
+        with pytest.raises(ProtocolError) as error:
+            await client.new_game(3, 42, True)
+        assert error.value.code == BAD_REQUEST
+    with_server(test)
+
+
+def test_minimax_engine_never_loses():
+    async def test(server, client):
+        for client_first in (True, False):
+            state = await client.new_game(3, 1, client_first)
+            while not state.is_finished:
+                state = await client.move(state.session,
+                                          *state.empty_cells[0])
+            assert state.status in (DRAW, O_WON if client_first else X_WON)
+        assert server.session_count == 0
+    with_server(test)
+
+
+def test_load_generator_reports_throughput():
+    async def run():
+        async with GameServer(workers=1) as server:
+            report = await generate_load("127.0.0.1", server.port, 40,
+                                         connections=8)
+            assert server.session_count == 0
+        return report
+
+    report = asyncio.run(run())
+    assert report.games == 40
+    assert report.games_per_second > 0
+    assert 0 < report.latency_percentile(50) <= report.p99_latency
+
+
+class FailingEngine(RandomNPCPlayer):
+    """Engine, jehož tah vždy selže."""
+
+    def move(self, board, valid_moves):
+        raise ValueError("Engine selhal")
+
+
+class CrashingEngine(RandomNPCPlayer):
+    """Engine, jehož tah ukončí pracovní proces."""
+
+    def move(self, board, valid_moves):
+        os._exit(1)
+
+
+class InvalidEngine(RandomNPCPlayer):
+    """Engine, který zadává jen neplatné tahy."""
+
+    def move(self, board, valid_moves):
+        return "9 9"
+
+
+def test_engine_without_valid_move_ends_session():
+    async def run():
+        engines = (partial(InvalidEngine, "Server"),)
+        async with GameServer(workers=1, engines=engines) as server:
+            client = await GameClient.connect("127.0.0.1", server.port)
+            state = await client.new_game(3, 0, True)
+            with pytest.raises(ProtocolError) as error:
+                await client.move(state.session, 0, 0)
+            assert error.value.code == ENGINE_ERROR
+            assert server.session_count == 0
+
+            with pytest.raises(ProtocolError) as error:
+                await client.move(state.session, 1, 1)
+            assert error.value.code == UNKNOWN_SESSION
+            await client.close()
+    asyncio.run(run())
+
+
+def test_engine_failure_reverts_client_move():
+    async def run():
+        engines = (partial(FailingEngine, "Server"),)
+        async with GameServer(workers=1, engines=engines) as server:
+            client = await GameClient.connect("127.0.0.1", server.port)
+            state = await client.new_game(3, 0, True)
+            for _ in range(2):
+                with pytest.raises(ProtocolError) as error:
+                    await client.move(state.session, 0, 0)
+                assert error.value.code == ENGINE_ERROR
+                assert f"relace {state.session}" in str(error.value)
+            assert server.session_count == 1
+
+            with pytest.raises(ProtocolError):
+                await client.new_game(3, 0, False)
+            assert server.session_count == 1
+            await client.close()
+    asyncio.run(run())
+
+
+def test_broken_pool_is_recreated():
+    async def run():
+        engines = (partial(CrashingEngine, "Server"),
+                   partial(RandomNPCPlayer, "Server"))
+        async with GameServer(workers=1, engines=engines) as server:
+            client = await GameClient.connect("127.0.0.1", server.port)
+            state = await client.new_game(3, 0, True)
+            with pytest.raises(ProtocolError) as error:
+                await client.move(state.session, 0, 0)
+            assert error.value.code == ENGINE_ERROR
+
+            state = await client.new_game(3, 1, True)
+            state = await client.move(state.session, 0, 0)
+            assert bin(state.o_bits).count("1") == 1
+            await client.close()
+    asyncio.run(run())
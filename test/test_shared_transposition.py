@@ -0,0 +1,112 @@
+import os
+import pickle
+import struct
+import subprocess
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing.shared_memory import SharedMemory
+
+import pytest
+
+from src.players.rational_npc_player import (MinmaxNPC, ParallelSearch,
+                                             SharedTranspositionTable)
+from src.players.rational_npc_player.shared_transposition import ENTRY
+from src.players.rational_npc_player.transposition import (EXACT,
+                                                           LOWER_BOUND)
+from test.test_rational_players import random_snapshots
+
+
+@pytest.fixture
+def table():
+    with SharedTranspositionTable(memory_mb=0.01) as shared:
+        yield shared
+
+
+def fill(table, start):
+    for key in range(start, start + 50):
+        table.store(key, key / 2, key % 7, LOWER_BOUND, "2 3")
+    return start
+
+
+def test_store_and_probe(table):
+    assert table.probe(2 ** 64 - 1) is None
+    table.store(2 ** 64 - 1, -0.25, 4, EXACT, "8 1")
+    table.store(0, 0.0, 0, EXACT, "")
+
+    entry = table.probe(2 ** 64 - 1)
+    assert (entry.value, entry.depth, entry.bound, entry.best_move) == (
+        -0.25, 4, EXACT, "8 1")
+    assert table.probe(0).best_move == ""
+    assert len(table) == 2
+
+
+def test_torn_entry_is_ignored(table):
+    table.store(5, 1.0, 2, EXACT, "0 0")
+    index = 2 * (5 % (table.capacity // 2))
+    offset = index * ENTRY.size + 8
+    # Slovo hodnoty pochází z jiného zápisu než kontrolní slovo
+    memory = SharedMemory(name=table.name)
+    memory.buf[offset:offset + 8] = struct.pack("<d", 3.0)
+    memory.close()
+
+    assert table.probe(5) is None
+
+
+def test_other_processes_share_entries(table):
+    with ProcessPoolExecutor(2) as pool:
+        list(pool.map(fill, [table] * 2, [0, 1000]))
+
+    assert table.probe(1020).value == 510
+    assert pickle.loads(pickle.dumps(table)).probe(30).value == 15
+
+
+@pytest.mark.parametrize("snapshot", random_snapshots(3, 2, 3, seed=6))
+def test_parallel_players_share_table(table, snapshot):
+    serial = MinmaxNPC("serial", "X", alpha_beta=True)
+    with ParallelSearch(2) as search:
+        shared = MinmaxNPC("shared", "X", alpha_beta=True,
+                           transposition_table=table, parallel=search)
+        assert (shared.move(snapshot, snapshot.valid_moves) ==
+                serial.move(snapshot, snapshot.valid_moves))
+    assert len(table) > 0
+
+
+# Skript, který tabulku předá pracovním procesům dodanou metodou spuštění
+# a poté ji buď uvolní, nebo (při havárii) skončí bez jejího uvolnění
+TRACKER_SCRIPT = """
+import os, sys
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import get_context
+from src.players.rational_npc_player import SharedTranspositionTable
+from test.test_shared_transposition import fill
+
+table = SharedTranspositionTable(memory_mb=0.01)
+print(table.name, flush=True)
+with ProcessPoolExecutor(2, mp_context=get_context(sys.argv[1])) as pool:
+    list(pool.map(fill, [table] * 4, [0, 100, 200, 300]))
+if sys.argv[2] == "crash":
+    os._exit(1)
+table.close()
+"""
+
+
+def run_tracker_script(method, mode):
+    return subprocess.run(
+        [sys.executable, "-c", TRACKER_SCRIPT, method, mode],
+        capture_output=True, text=True, timeout=60,
+        cwd=os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+@pytest.mark.parametrize("method", ["fork", "spawn", "forkserver"])
+def test_workers_keep_owner_registration(method):
+    result = run_tracker_script(method, "close")
+    assert result.returncode == 0, result.stderr
+    assert "Traceback" not in result.stderr
+
+
+@pytest.mark.parametrize("method", ["fork", "spawn"])
+def test_memory_is_released_after_owner_crash(method):
+    result = run_tracker_script(method, "crash")
+    name = result.stdout.split()[0]
+    with pytest.raises(FileNotFoundError):
+        SharedMemory(name=name).close()
@@ -0,0 +1,79 @@
+import pytest
+
+from src.game.board import default_board
+from src.players.rational_npc_player import (MinmaxNPC, SolvedDatabase,
+                                             build_database)
+from src.players.rational_npc_player.solved_db import (HEADER_SIZE,
+                                                       SolvedDatabaseError,
+                                                       position_rank)
+from test.test_rational_players import random_snapshots
+
+
+@pytest.fixture(scope="module")
+def database(tmp_path_factory):
+    path = tmp_path_factory.mktemp("db") / "solved_3x3.db"
+    build_database(str(path), 3)
+    with SolvedDatabase(str(path)) as database:
+        yield database
+
+
+def test_database_contains_all_open_positions(database):
+    with open(database.path, "rb") as file:
+        entries = file.read()[HEADER_SIZE:]
+    assert database.base == 3
+    assert sum(1 for entry in entries if entry) == 4520
+
+
+def test_empty_board_is_draw(database):
+    board = [[""] * 3 for _ in range(3)]
+    assert database.lookup(board, "X")[0] == 0
+
+
+def test_rank_is_relative_to_player_on_move():
+    board = [["X", "O", ""], ["", "", ""], ["", "", ""]]
+    assert position_rank(board, "X") == 1 + 2 * 3
+    assert position_rank(board, "O") == 2 + 1 * 3
+
+
+@pytest.mark.parametrize("mark", ["X", "O"])
+def test_database_move_matches_search(database, mark):
+    for snapshot in random_snapshots(3, 2, 10, seed=6):
+        player = MinmaxNPC("db", mark, solved_database=database)
+        reference = MinmaxNPC("ref", mark, alpha_beta=True)
+
+        assert (player.move(snapshot, snapshot.valid_moves) ==
+                reference.move(snapshot, snapshot.valid_moves))
+        assert player.nodes == 0
+
+
+def test_player_falls_back_to_search(database):
+    board = default_board(4)
+    player = MinmaxNPC("db", "X", alpha_beta=True, solved_database=database)
+    board.mark(0, 0, "X")
+    board.mark(1, 1, "O")
+    board.mark(0, 1, "X")
+    board.mark(2, 2, "O")
+    board.mark(0, 2, "X")
+    board.mark(3, 3, "O")
+    board.mark(1, 0, "X")
+    board.mark(2, 0, "O")
+    board.mark(3, 1, "X")
+    board.mark(1, 2, "O")
+    snapshot = board.board_snapshot
+
+    assert player.move(snapshot, snapshot.valid_moves) in snapshot.valid_moves
+    assert player.nodes > 0
+
+
+def test_invalid_file_is_rejected(tmp_path):
+    path = tmp_path / "invalid.db"
+    path.write_bytes(b"not a database")
+    with pytest.raises(SolvedDatabaseError):
+        SolvedDatabase(str(path))
+
+
+def test_parallel_build_gives_same_database(database, tmp_path):
+    path = tmp_path / "parallel.db"
+    build_database(str(path), 3, workers=2)
+    with open(database.path, "rb") as file:
+        assert path.read_bytes() == file.read()
@@ -0,0 +1,79 @@
+import random
+
+import pytest
+
+from src.players.rational_npc_player.symmetry import (
+    INVERSE_TRANSFORMS, TRANSFORMS, PositionHasher, canonicalize,
+    transform_board, transform_move, unique_moves)
+from src.players.rational_npc_player.utils import is_terminate, zobrist_hash
+
+
+def random_board(base, marks, seed):
+    rnd = random.Random(seed)
+    board = [[""] * base for _ in range(base)]
+    cells = [(x, y) for y in range(base) for x in range(base)]
+    for turn, (x, y) in enumerate(rnd.sample(cells, marks)):
+        board[y][x] = "XO"[turn % 2]
+    return board
+
+
+@pytest.mark.parametrize("transform", range(len(TRANSFORMS)))
+def test_inverse_transforms(transform):
+    board = random_board(4, 6, transform)
+    inverse = INVERSE_TRANSFORMS[transform]
+    assert transform_board(transform_board(board, transform), inverse) == board
+    assert transform_move(
+        transform_move("1 3", transform, 4), inverse, 4) == "1 3"
+
+
+@pytest.mark.parametrize("seed", range(10))
+def test_symmetric_boards_share_canonical_form(seed):
+    board = random_board(3, 4, seed)
+    canonical, transform = canonicalize(board)
+
+    assert tuple(map(tuple, transform_board(board, transform))) == canonical
+    for other in range(len(TRANSFORMS)):
+        assert canonicalize(transform_board(board, other))[0] == canonical
+
+
+@pytest.mark.parametrize("seed", range(10))
+def test_terminality_is_symmetric(seed):
+    board = random_board(3, 5, seed)
+    for transform in range(len(TRANSFORMS)):
+        image = transform_board(board, transform)
+        assert is_terminate(image) == is_terminate(board)
+
+
+def test_hasher_matches_canonical_form():
+    board = random_board(4, 5, 1)
+    hasher = PositionHasher(board, symmetric=True)
+    canonical, _ = canonicalize(board)
+    assert hasher.canonical[0] == min(
+        zobrist_hash(transform_board(board, transform))
+        for transform in range(len(TRANSFORMS)))
+
+    for transform in range(len(TRANSFORMS)):
+        image = transform_board(board, transform)
+        assert PositionHasher(image, True).canonical[0] == hasher.canonical[0]
+
+    x, y = next((x, y) for y in range(4) for x in range(4) if not board[y][x])
+    hasher.toggle(x, y, "X")
+    board[y][x] = "X"
+    assert hasher.canonical == PositionHasher(board, True).canonical
+
+
+def test_hasher_without_symmetry_keeps_plain_hash():
+    board = random_board(3, 4, 2)
+    assert PositionHasher(board).canonical == (zobrist_hash(board), 0)
+
+
+def test_unique_moves_on_empty_board():
+    board = [[""] * 3 for _ in range(3)]
+    assert unique_moves(board) == [(0, 0), (1, 0), (1, 1)]
+
+
+def test_unique_moves_without_symmetry():
+    board = [[""] * 3 for _ in range(3)]
+    board[0][0], board[0][1] = "X", "O"
+    free = [(x, y) for y in range(3) for x in range(3) if not board[y][x]]
+    assert unique_moves(board) == free
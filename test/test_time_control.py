@@ -0,0 +1,179 @@
+import threading
+import time
+
+import pytest
+
+from src.game import time_control
+from src.game.board import default_board
+from src.game.game import Game
+from src.game.player import PlayerError
+from src.game.time_control import (PROCESS, RANDOM_MOVE, Clock, TimeControl,
+                                   timed_move)
+from src.players import (HumanPlayer, LimitedMinmaxPlayer, MinmaxNPC,
+                         RandomNPCPlayer)
+from test.dummy_player import ScriptedPlayer
+
+
+class SlowPlayer(ScriptedPlayer):
+    """Hráč, jehož tahy trvají dodanou dobu."""
+
+    def __init__(self, player_name, mark, delay):
+        super().__init__(player_name, mark, [])
+        self.delay = delay
+
+    def move(self, board, valid_moves):
+        time.sleep(self.delay)
+        return valid_moves[0]
+
+
+def test_time_control_validation():
+    with pytest.raises(ValueError):
+        TimeControl(per_move=0)
+    with pytest.raises(ValueError):
+        TimeControl(bank=-1)
+    with pytest.raises(ValueError):
+        TimeControl(on_timeout="draw")
+    with pytest.raises(ValueError):
+        TimeControl(isolation="fiber")
+
+
+def test_clock_with_bank_and_increment():
+    clock = Clock(TimeControl(per_move=0.8, bank=1.0, increment=0.5))
+    assert clock.available == 0.8
+
+    clock.charge(0.7)
+    assert clock.remaining == pytest.approx(0.8)
+
+    clock.charge(2.0)
+    assert clock.remaining == pytest.approx(0.5)
+    assert clock.available == pytest.approx(0.5)
+    assert clock.used == pytest.approx(2.7)
+
+    assert Clock(TimeControl()).available is None
+
+
+def test_timeout_loses_game():
+    start = time.perf_counter()
+    result = Game([SlowPlayer("Pomalý", "X", 5), RandomNPCPlayer("R", "O")],
+                  time_controls=TimeControl(per_move=0.05)).play()
+
+    assert time.perf_counter() - start < 1
+    assert result.winner == "R"
+    assert "vypršel čas" in result.reason
+    assert result.moves == ()
+
+
+def test_timeout_plays_random_move():
+    game = Game([SlowPlayer("Pomalý", "X", 0.2), RandomNPCPlayer("R", "O")],
+                time_controls=(TimeControl(per_move=0.02,
+                                           on_timeout=RANDOM_MOVE), None))
+    result = game.play()
+
+    slow_moves = [move for move in result.moves if move.mark == "X"]
+    assert slow_moves and all(move.timed_out for move in slow_moves)
+    assert not any(move.timed_out for move in result.moves
+                   if move.mark == "O")
+    assert game.clocks[1] is None
+    # Dokud pomalý hráč nedokončí první tah, jsou další tahy hned nestihnuté
+    assert game.clocks[0].used >= 0.02
+
+
+def test_time_used_is_recorded():
+    result = Game([SlowPlayer("A", "X", 0.01), SlowPlayer("B", "O", 0)],
+                  time_controls=TimeControl(bank=10)).play()
+    assert all(move.time_used >= 0.01 for move in result.moves
+               if move.mark == "X")
+
+
+def test_search_is_aborted_on_timeout():
+    board = default_board(5)
+    board.mark(2, 2, "X")
+    snapshot = board.board_snapshot
+    player = LimitedMinmaxPlayer("Hluboký", "O", max_depth=12)
+    threads = set(threading.enumerate())
+
+    assert timed_move(player, snapshot, snapshot.valid_moves, 0.1) is None
+    assert set(threading.enumerate()) <= threads
+
+    # Po přerušení hráč opět táhne běžně
+    board = default_board(3)
+    board.mark(1, 1, "X")
+    snapshot = board.board_snapshot
+    assert timed_move(player, snapshot, snapshot.valid_moves,
+                      5) in snapshot.valid_moves
+
+
+def test_timed_out_player_is_reusable():
+    board = default_board(4).board_snapshot
+    player = MinmaxNPC("Minimax", "X", alpha_beta=True)
+    assert timed_move(player, board, board.valid_moves, 0.01) is None
+
+    # Událost přerušení je po tahu od hráče odpojena
+    board = default_board(3)
+    board.mark(1, 1, "O")
+    snapshot = board.board_snapshot
+    assert player.move(snapshot, snapshot.valid_moves) in snapshot.valid_moves
+
+
+class CountingPlayer(SlowPlayer):
+    """Pomalý hráč, který si počítá své tahy."""
+
+    def __init__(self, player_name, mark, delay):
+        super().__init__(player_name, mark, delay)
+        self.calls = 0
+
+    def move(self, board, valid_moves):
+        self.calls += 1
+        return super().move(board, valid_moves)
+
+
+class StubbornPlayer(SlowPlayer):
+    """Hráč, který přerušení přijme, ale neuposlechne."""
+
+    def abort_on(self, event):
+        pass
+
+
+def test_player_without_abort_runs_in_thread():
+    board = default_board(3).board_snapshot
+    player = CountingPlayer("Pomalý", "X", 0.5)
+    start = time.perf_counter()
+    assert timed_move(player, board, board.valid_moves, 0.05) is None
+    assert time.perf_counter() - start < 0.4
+
+    # Dokud hráč nedokončí předchozí tah, není k dalšímu vyzván
+    assert timed_move(player, board, board.valid_moves, 5) is None
+    assert player.calls == 1
+
+    time.sleep(0.6)
+    player.delay = 0
+    assert timed_move(player, board,
+                      board.valid_moves, 5) == board.valid_moves[0]
+    assert player.calls == 2
+
+
+def test_player_ignoring_abort_is_reported(monkeypatch):
+    monkeypatch.setattr(time_control, "ABORT_GRACE", 0.05)
+    board = default_board(3).board_snapshot
+    player = StubbornPlayer("Tvrdohlavý", "X", 0.5)
+    with pytest.raises(PlayerError):
+        timed_move(player, board, board.valid_moves, 0.05)
+
+
+def test_human_player_with_time_control(monkeypatch):
+    moves = iter(["0 0", "1 0", "2 0"])
+    monkeypatch.setattr("builtins.input", lambda prompt="": next(moves))
+    result = Game([HumanPlayer("Člověk", "X"), ScriptedPlayer(
+        "Skript", "O", ["0 1", "1 1"])],
+        time_controls=TimeControl(per_move=5)).play()
+    assert result.winner == "Člověk"
+
+
+def test_process_isolation_kills_slow_player():
+    board = default_board(3).board_snapshot
+    start = time.perf_counter()
+    assert timed_move(SlowPlayer("Pomalý", "X", 5), board,
+                      board.valid_moves, 0.1, PROCESS) is None
+    assert time.perf_counter() - start < 2
+    assert timed_move(SlowPlayer("Rychlý", "X", 0), board,
+                      board.valid_moves, 5, PROCESS) == board.valid_moves[0]
@@ -0,0 +1,59 @@
+import pytest
+
+from src.players.rational_npc_player.transposition import (
+    EXACT, LOWER_BOUND, UPPER_BOUND, TranspositionTable, bound_type)
+
+
+@pytest.fixture
+def table():
+    return TranspositionTable(memory_mb=0.001)
+
+
+def test_capacity_follows_memory_limit():
+    small = TranspositionTable(memory_mb=1)
+    large = TranspositionTable(memory_mb=4)
+    assert abs(large.capacity - 4 * small.capacity) <= 8
+
+
+def test_invalid_memory_limit():
+    with pytest.raises(ValueError):
+        TranspositionTable(memory_mb=0)
+
+
+def test_probe_counts_hits_and_misses(table):
+    assert table.probe(42) is None
+    table.store(42, 1.5, 3, EXACT, "1 1")
+
+    entry = table.probe(42)
+    assert entry.value == 1.5 and entry.best_move == "1 1"
+    assert table.hits == 1 and table.misses == 1
+    assert table.hit_rate == 0.5
+
+
+def test_depth_preferred_and_always_replace(table):
+    buckets = table.capacity // 2
+    deep, shallow, newer = 7, 7 + buckets, 7 + 2 * buckets
+
+    table.store(deep, 1, 5, EXACT, "0 0")
+    table.store(shallow, 2, 1, EXACT, "0 1")
+    table.store(newer, 3, 2, EXACT, "0 2")
+
+    # Hlubší záznam zůstává, mělčí je přepsán novějším
+    assert table.probe(deep).depth == 5
+    assert table.probe(shallow) is None
+    assert table.probe(newer).value == 3
+
+
+def test_clear(table):
+    table.store(1, 0, 0, EXACT, "")
+    table.probe(1)
+    table.clear()
+
+    assert len(table) == 0
+    assert table.hits == 0
+
+
+def test_bound_type():
+    assert bound_type(-1, 0, 1) == UPPER_BOUND
+    assert bound_type(0.5, 0, 1) == EXACT
+    assert bound_type(1, 0, 1) == LOWER_BOUND
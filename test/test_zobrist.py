@@ -0,0 +1,44 @@
+from src.game.board import default_board
+from src.game.zobrist import zobrist_key, zobrist_keys
+from src.players.rational_npc_player.utils import translate_board, zobrist_hash
+
+
+def test_keys_are_deterministic_and_distinct():
+    keys = zobrist_keys(3)
+    assert len(set(keys["X"] + keys["O"])) == 18
+    assert all(0 <= key < 2 ** 64 for key in keys["X"])
+
+
+def test_empty_board_hash():
+    assert default_board().zobrist_hash == 0
+
+
+def test_hash_is_updated_on_mark():
+    board = default_board()
+    board.mark(1, 2, "X")
+    board.mark(0, 0, "O")
+
+    assert board.zobrist_hash == (zobrist_key(1, 2, "X", 3) ^
+                                  zobrist_key(0, 0, "O", 3))
+
+
+def test_hash_does_not_depend_on_move_order():
+    first, second = default_board(), default_board()
+    first.mark(0, 0, "X")
+    first.mark(2, 2, "O")
+    second.mark(2, 2, "O")
+    second.mark(0, 0, "X")
+
+    assert first.zobrist_hash == second.zobrist_hash
+    assert first.board_snapshot == second.board_snapshot
+    assert len({first.board_snapshot, second.board_snapshot}) == 1
+
+
+def test_snapshot_and_translated_board_hash():
+    board = default_board(4)
+    board.mark(3, 1, "O")
+    board.mark(2, 0, "X")
+    snapshot = board.board_snapshot
+
+    assert snapshot.zobrist_hash == board.zobrist_hash
+    assert zobrist_hash(translate_board(snapshot)) == snapshot.zobrist_hash